@@ -3,6 +3,8 @@
 from fastapi import APIRouter, Response
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
+from metrics import metrics_collector
+
 
 def create_router(app_state) -> APIRouter:  # noqa: ARG001 - signature kept for consistency
     """Expose Prometheus metrics."""
@@ -10,6 +12,7 @@ def create_router(app_state) -> APIRouter:  # noqa: ARG001 - signature kept for
 
     @router.get("/metrics")
     async def metrics():
+        metrics_collector.flush()
         return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
     return router
@@ -3,6 +3,7 @@
 from typing import List, Optional
 from datetime import date, datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query, Header
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from services import TaskRegistryService, DailyStatsService, SessionService, EnvironmentService
@@ -16,6 +17,12 @@ from models import (
 from config import Config
 from security.auth import AuthenticatedUser
 from security.dependencies import get_auth_dependency
+from api.responses import json_response
+
+# Timeline and daily-stats payloads grow with the requested window, so they are
+# encoded with json_response.
+_TIMELINE_ADAPTER = TypeAdapter(TaskTimelineResponse)
+_DAILY_STATS_LIST_ADAPTER = TypeAdapter(List[TaskDailyStatsResponse])
 
 
 def create_router(app_state) -> APIRouter:
@@ -163,11 +170,11 @@ def create_router(app_state) -> APIRouter:
         if not task:
             raise HTTPException(status_code=404, detail=f"Task '{task_name}' not found")
 
-        return registry_service.get_task_timeline(
+        return json_response(_TIMELINE_ADAPTER, registry_service.get_task_timeline(
             task_name,
             hours=hours,
             bucket_size_minutes=bucket_size_minutes
-        )
+        ))
 
     @router.get("/tags", response_model=List[str])
     async def get_all_tags(
@@ -208,12 +215,12 @@ def create_router(app_state) -> APIRouter:
             start_date = end_date - timedelta(days=days - 1)
 
         daily_stats_service = DailyStatsService(session)
-        return daily_stats_service.get_daily_stats(
+        return json_response(_DAILY_STATS_LIST_ADAPTER, daily_stats_service.get_daily_stats(
             task_name,
             start_date=start_date,
             end_date=end_date,
             limit=days if days else 30
-        )
+        ))
 
     @router.get("/tasks/{task_name}/trend", response_model=dict)
     async def get_task_trend(
@@ -248,6 +255,9 @@ def create_router(app_state) -> APIRouter:
             target_date: The date to get stats for (YYYY-MM-DD)
         """
         daily_stats_service = DailyStatsService(session)
-        return daily_stats_service.get_all_tasks_stats_for_date(target_date)
+        return json_response(
+            _DAILY_STATS_LIST_ADAPTER,
+            daily_stats_service.get_all_tasks_stats_for_date(target_date),
+        )
 
     return router
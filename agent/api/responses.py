@@ -0,0 +1,17 @@
+"""Shared response helpers for API routes."""
+
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_response(adapter: TypeAdapter, content: Any) -> Response:
+    """
+    Encode ``content`` with pydantic-core and wrap it in a JSON response.
+
+    Routes returning large payloads use this instead of FastAPI's response
+    validation, jsonable_encoder and json.dumps. The JSON produced is the same,
+    so response_model can stay on the route for the OpenAPI schema.
+    """
+    return Response(content=adapter.dump_json(content), media_type="application/json")
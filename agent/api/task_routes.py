@@ -3,10 +3,10 @@
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from services import TaskService, EnvironmentService, SessionService, AppConfigService, ProgressService
 from database import TaskEventDB
@@ -15,6 +15,7 @@ from database import ensure_utc_isoformat
 from config import Config
 from security.auth import AuthenticatedUser
 from security.dependencies import get_auth_dependency
+from api.responses import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,30 @@ class ResolveTaskRequest(BaseModel):
     resolved_by: Optional[str] = None
 
 
+# Task event payloads are encoded with json_response; response_model stays on
+# the routes for the schema.
+_EVENT_PAGE_ADAPTER = TypeAdapter(Dict[str, Any])
+_EVENT_LIST_ADAPTER = TypeAdapter(List[TaskEvent])
+
+
+def _parse_cursor(
+    before_timestamp: Optional[datetime], before_id: Optional[str], aggregate: bool
+) -> Optional[Tuple[datetime, Any]]:
+    """Build the keyset cursor from its query parameters; both or neither must be given."""
+    if before_timestamp is None and before_id is None:
+        return None
+    if before_timestamp is None or before_id is None:
+        raise HTTPException(
+            status_code=400, detail="before_timestamp and before_id must be given together"
+        )
+    if aggregate:
+        return before_timestamp, before_id
+    try:
+        return before_timestamp, int(before_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="before_id must be an integer") from exc
+
+
 def create_router(app_state) -> APIRouter:
     """Create task router with dependency injection."""
     router = APIRouter(prefix="/api", tags=["tasks"])
@@ -79,14 +104,18 @@ def create_router(app_state) -> APIRouter:
         filter_worker: Optional[str] = None,
         filter_task: Optional[str] = None,
         filter_queue: Optional[str] = None,
+        before_timestamp: Optional[datetime] = None,
+        before_id: Optional[str] = None,
         session: Session = Depends(get_db),
         active_env = Depends(get_active_env)
     ):
         """Get recent task events with filtering and pagination."""
         logger.info(f"API /events/recent called with session env={active_env.name if active_env else 'None'}")
 
+        before = _parse_cursor(before_timestamp, before_id, aggregate)
+
         task_service = TaskService(session, active_env=active_env)
-        return task_service.get_recent_events(
+        return json_response(_EVENT_PAGE_ADAPTER, task_service.get_recent_events(
             limit=limit,
             page=page,
             aggregate=aggregate,
@@ -99,8 +128,9 @@ def create_router(app_state) -> APIRouter:
             filter_state=filter_state,
             filter_worker=filter_worker,
             filter_task=filter_task,
-            filter_queue=filter_queue
-        )
+            filter_queue=filter_queue,
+            before=before
+        ))
 
 
     @router.get("/events/{task_id}", response_model=List[TaskEvent])
@@ -112,7 +142,7 @@ def create_router(app_state) -> APIRouter:
         if not task_events:
             raise HTTPException(status_code=404, detail="Task not found")
 
-        return task_events
+        return json_response(_EVENT_LIST_ADAPTER, task_events)
 
     @router.get("/tasks/{task_id}/progress", response_model=TaskProgressSnapshot)
     async def get_task_progress(task_id: str, session: Session = Depends(get_db)):
@@ -138,7 +168,7 @@ def create_router(app_state) -> APIRouter:
         """Get currently active tasks."""
         task_service = TaskService(session, active_env=active_env)
         active_events = task_service.get_active_tasks()
-        return active_events
+        return json_response(_EVENT_LIST_ADAPTER, active_events)
 
 
     @router.get("/tasks/orphaned", response_model=List[TaskEvent])
@@ -148,7 +178,7 @@ def create_router(app_state) -> APIRouter:
     ):
         """Get tasks that have been marked as orphaned and NOT yet retried."""
         task_service = TaskService(session, active_env=active_env)
-        return task_service.get_unretried_orphaned_tasks()
+        return json_response(_EVENT_LIST_ADAPTER, task_service.get_unretried_orphaned_tasks())
 
     @router.get("/tasks/failed/recent", response_model=List[TaskEvent])
     async def get_recent_failed_tasks(
@@ -172,7 +202,7 @@ def create_router(app_state) -> APIRouter:
             limit=limit,
             exclude_retried=not include_retried
         )
-        return failed_tasks
+        return json_response(_EVENT_LIST_ADAPTER, failed_tasks)
 
 
     @router.post("/tasks/{task_id}/resolve")
@@ -4,6 +4,7 @@ import json
 import logging
 from datetime import datetime, timezone
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import BaseModel
 from typing import Dict, Any
 
 from models import (
@@ -19,33 +20,48 @@ from security.tokens import TokenError
 logger = logging.getLogger(__name__)
 
 
+_MISSING = object()
+
+
+def _filter_value(event_data: Any, key: str) -> Any:
+    """Read one field for filtering without dumping the whole event."""
+    if isinstance(event_data, BaseModel):
+        if key not in type(event_data).model_fields:
+            return _MISSING
+        value = getattr(event_data, key)
+        # Tuples arrive from clients as JSON arrays, so compare them as lists.
+        if isinstance(value, tuple):
+            value = list(value)
+        # Nested models compare as dicts, as they would after model_dump().
+        if isinstance(value, BaseModel):
+            return value.model_dump()
+        if isinstance(value, list) and value and isinstance(value[0], BaseModel):
+            return [item.model_dump() for item in value]
+        return value
+    if hasattr(event_data, 'dict'):
+        event_data = event_data.dict()
+    if isinstance(event_data, dict):
+        return event_data.get(key, _MISSING)
+    return _MISSING
+
+
 def _matches_filters(event_data: Any, filters: Dict[str, Any]) -> bool:
     """Check if event data matches the given filters."""
     if not filters:
         return True
-    
-    # Convert event data to dict if it's a Pydantic model
-    if hasattr(event_data, 'model_dump'):
-        event_dict = event_data.model_dump()
-    elif hasattr(event_data, 'dict'):
-        event_dict = event_data.dict()
-    else:
-        event_dict = event_data if isinstance(event_data, dict) else {}
-    
-    # Apply filters
+
     for filter_key, filter_value in filters.items():
-        if filter_key in event_dict:
-            event_value = event_dict[filter_key]
-            # Support both exact match and contains for string fields
-            if isinstance(filter_value, str) and isinstance(event_value, str):
-                if filter_value.lower() not in event_value.lower():
-                    return False
-            elif event_value != filter_value:
-                return False
-        else:
+        event_value = _filter_value(event_data, filter_key)
+        if event_value is _MISSING:
             # If filter key doesn't exist in event, filter doesn't match
             return False
-    
+        # Support both exact match and contains for string fields
+        if isinstance(filter_value, str) and isinstance(event_value, str):
+            if filter_value.lower() not in event_value.lower():
+                return False
+        elif event_value != filter_value:
+            return False
+
     return True
 
 
@@ -103,28 +119,13 @@ def create_router(app_state) -> APIRouter:
                 
                 try:
                     message = json.loads(data)
-                    
-                    if message.get('type') == 'ping':
-                        pong_response = PongResponse(timestamp=datetime.now(timezone.utc))
-                        await app_state.connection_manager.send_personal_message(pong_response.model_dump_json(), websocket)
-                    
-                    elif message.get('type') == 'subscribe':
-                        filters = message.get('filters', {})
-                        app_state.connection_manager.set_client_filters(websocket, filters)
-
-                        response = SubscriptionResponse(
-                            status="acknowledged",
-                            filters=filters,
-                            timestamp=datetime.now(timezone.utc)
-                        )
-                        await app_state.connection_manager.send_personal_message(response.model_dump_json(), websocket)
-                    
-                    elif message.get('type') == 'set_mode':
-                        await handle_set_mode(websocket, message)
-                    
-                    elif message.get('type') == 'get_stored':
-                        await handle_get_stored(websocket, message)
-                    
+                    # Read the type tag once and dispatch on it; frames that
+                    # aren't JSON objects or lack a string tag are ignored.
+                    message_type = message.get('type') if isinstance(message, dict) else None
+                    handler = message_handlers.get(message_type) if isinstance(message_type, str) else None
+                    if handler is not None:
+                        await handler(websocket, message)
+
                 except json.JSONDecodeError:
                     logger.error(f"Invalid JSON received: {data}")
         
@@ -132,6 +133,25 @@ def create_router(app_state) -> APIRouter:
             app_state.connection_manager.disconnect(websocket)
 
 
+    async def handle_ping(websocket: WebSocket, message: Dict[str, Any]):
+        """Handle ping WebSocket message."""
+        pong_response = PongResponse(timestamp=datetime.now(timezone.utc))
+        await app_state.connection_manager.send_personal_message(pong_response.model_dump_json(), websocket)
+
+
+    async def handle_subscribe(websocket: WebSocket, message: Dict[str, Any]):
+        """Handle subscribe WebSocket message."""
+        filters = message.get('filters', {})
+        app_state.connection_manager.set_client_filters(websocket, filters)
+
+        response = SubscriptionResponse(
+            status="acknowledged",
+            filters=filters,
+            timestamp=datetime.now(timezone.utc)
+        )
+        await app_state.connection_manager.send_personal_message(response.model_dump_json(), websocket)
+
+
     async def handle_set_mode(websocket: WebSocket, message: Dict[str, Any]):
         """Handle set_mode WebSocket message."""
         mode = message.get('mode', 'live')
@@ -151,7 +171,7 @@ def create_router(app_state) -> APIRouter:
                     # Apply client filters
                     if _matches_filters(event_data, filters):
                         await app_state.connection_manager.send_personal_message(
-                            event_data.model_dump_json(),
+                            event_data.model_dump_json(exclude_none=True),
                             websocket
                         )
                         events_sent += 1
@@ -182,7 +202,7 @@ def create_router(app_state) -> APIRouter:
                     # Apply client filters
                     if _matches_filters(event_data, filters):
                         await app_state.connection_manager.send_personal_message(
-                            event_data.model_dump_json(),
+                            event_data.model_dump_json(exclude_none=True),
                             websocket
                         )
                         events_sent += 1
@@ -194,6 +214,15 @@ def create_router(app_state) -> APIRouter:
         await app_state.connection_manager.send_personal_message(stored_response.model_dump_json(), websocket)
 
 
+    # Client message "type" tag -> handler, looked up once per received frame
+    message_handlers = {
+        'ping': handle_ping,
+        'subscribe': handle_subscribe,
+        'set_mode': handle_set_mode,
+        'get_stored': handle_get_stored,
+    }
+
+
     @router.get("/api/websocket/message-types")
     async def get_websocket_message_types():
         """Get schema information for WebSocket message types."""
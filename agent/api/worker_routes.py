@@ -11,6 +11,23 @@ from config import Config
 from security.dependencies import get_auth_dependency
 
 
+def _to_worker_info(hostname: str, data: dict, now: datetime) -> WorkerInfo:
+    """Build the API model from a monitor worker-state dict."""
+    get = data.get
+    return WorkerInfo(
+        hostname=hostname,
+        status=get('status', 'unknown'),
+        timestamp=get('timestamp', now),
+        active_tasks=get('active', 0),
+        processed_tasks=get('processed', 0),
+        sw_ident=get('sw_ident'),
+        sw_ver=get('sw_ver'),
+        sw_sys=get('sw_sys'),
+        loadavg=get('loadavg'),
+        freq=get('freq')
+    )
+
+
 def create_router(app_state) -> APIRouter:
     """Create worker router with dependency injection."""
     router = APIRouter(prefix="/api", tags=["workers"])
@@ -36,24 +53,8 @@ def create_router(app_state) -> APIRouter:
             return []
         
         workers_data = app_state.monitor_instance.get_workers_info()
-        worker_list = []
-        
-        for hostname, data in workers_data.items():
-            worker_info = WorkerInfo(
-                hostname=hostname,
-                status=data.get('status', 'unknown'),
-                timestamp=data.get('timestamp', datetime.now(timezone.utc)),
-                active_tasks=data.get('active', 0),
-                processed_tasks=data.get('processed', 0),
-                sw_ident=data.get('sw_ident'),
-                sw_ver=data.get('sw_ver'),
-                sw_sys=data.get('sw_sys'),
-                loadavg=data.get('loadavg'),
-                freq=data.get('freq')
-            )
-            worker_list.append(worker_info)
-        
-        return worker_list
+        now = datetime.now(timezone.utc)
+        return [_to_worker_info(hostname, data, now) for hostname, data in workers_data.items()]
 
 
     @router.get("/workers/{hostname}", response_model=WorkerInfo)
@@ -66,19 +67,7 @@ def create_router(app_state) -> APIRouter:
         if hostname not in workers_data:
             raise HTTPException(status_code=404, detail="Worker not found")
         
-        data = workers_data[hostname]
-        return WorkerInfo(
-            hostname=hostname,
-            status=data.get('status', 'unknown'),
-            timestamp=data.get('timestamp', datetime.now(timezone.utc)),
-            active_tasks=data.get('active', 0),
-            processed_tasks=data.get('processed', 0),
-            sw_ident=data.get('sw_ident'),
-            sw_ver=data.get('sw_ver'),
-            sw_sys=data.get('sw_sys'),
-            loadavg=data.get('loadavg'),
-            freq=data.get('freq')
-        )
+        return _to_worker_info(hostname, workers_data[hostname], datetime.now(timezone.utc))
 
 
     @router.get("/workers/events/recent")
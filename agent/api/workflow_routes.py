@@ -2,6 +2,7 @@
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from models import (
@@ -15,6 +16,11 @@ from services.action_executor import ActionExecutor
 from services.workflow_catalog import TRIGGER_METADATA
 from config import Config
 from security.dependencies import get_auth_dependency
+from api.responses import json_response
+
+# Execution history carries whole trigger events and workflow snapshots, so it
+# is encoded with json_response.
+_EXECUTION_LIST_ADAPTER = TypeAdapter(List[WorkflowExecutionRecord])
 
 
 def create_router(app_state) -> APIRouter:
@@ -142,7 +148,7 @@ def create_router(app_state) -> APIRouter:
             offset=offset
         )
 
-        return executions
+        return json_response(_EXECUTION_LIST_ADAPTER, executions)
 
     @router.get("/executions/recent", response_model=List[WorkflowExecutionRecord])
     async def get_recent_executions(
@@ -158,7 +164,7 @@ def create_router(app_state) -> APIRouter:
             limit=limit,
             offset=offset
         )
-        return executions
+        return json_response(_EXECUTION_LIST_ADAPTER, executions)
 
     # ==================== Workflow Testing ====================
 
@@ -1,5 +1,6 @@
 """Main FastAPI application for Celery Event Monitor."""
 
+import asyncio
 import logging
 import threading
 from typing import Any, Dict, Optional
@@ -60,10 +61,14 @@ async def lifespan(app: FastAPI):
         app_state.health_monitor.stop()
     if app_state.retention_scheduler:
         app_state.retention_scheduler.stop()
+    # The monitor goes first: stopping it flushes its pending task batch, whose
+    # daily stats the buffer must still be running to receive.
+    if app_state.monitor_instance:
+        await asyncio.to_thread(app_state.monitor_instance.stop)
+    if app_state.event_handler:
+        app_state.event_handler.daily_stats_buffer.stop()
     if app_state.connection_manager:
         await app_state.connection_manager.stop_background_broadcaster()
-    if app_state.monitor_instance:
-        app_state.monitor_instance.stop()
     if app_state.monitor_thread and app_state.monitor_thread.is_alive():
         logger.info("Monitor thread signalled to stop (daemon; exits with process)")
 
@@ -308,6 +313,7 @@ def start_monitor(config: Config):
     )
     
     app_state.monitor_instance.set_task_callback(app_state.event_handler.handle_task_event)
+    app_state.monitor_instance.set_batch_task_callback(app_state.event_handler.handle_task_events)
     app_state.monitor_instance.set_worker_callback(app_state.event_handler.handle_worker_event)
     app_state.monitor_instance.set_progress_callback(app_state.event_handler.handle_progress_event)
     app_state.monitor_instance.set_steps_callback(app_state.event_handler.handle_steps_event)
@@ -1,3 +1,4 @@
+import functools
 import os
 import logging
 import secrets
@@ -123,8 +124,15 @@ class Config:
     )
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> 'Config':
-        """Create config from environment variables."""
+        """
+        Create config from environment variables.
+
+        The instance is cached so every caller shares one config, including the
+        secrets generated when none are configured. Call
+        ``Config.from_env.cache_clear()`` to rebuild it.
+        """
         return cls()
 
     def __post_init__(self) -> None:
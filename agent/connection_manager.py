@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 from fastapi import WebSocket
 
@@ -8,12 +8,26 @@ from models import TaskEvent, WorkerEvent
 
 logger = logging.getLogger(__name__)
 
+# Per-client (event_types, task_names) filter sets; None means "don't filter".
+_CompiledFilters = Tuple[Optional[FrozenSet[str]], Optional[FrozenSet[str]]]
+_NO_FILTERS: _CompiledFilters = (None, None)
+
+
+def _compile_filter_values(values) -> Optional[FrozenSet[str]]:
+    if not values:
+        return None
+    if isinstance(values, str):
+        values = [values]
+    return frozenset(value for value in values if isinstance(value, str))
+
 
 class ConnectionManager:
     def __init__(self):
         self.active_connections: List[WebSocket] = []
         self.client_filters: Dict[WebSocket, dict] = {}
+        self._compiled_filters: Dict[WebSocket, _CompiledFilters] = {}
         self.client_modes: Dict[WebSocket, str] = {}
+        self.live_connections: Set[WebSocket] = set()
         self.message_queue: Optional[asyncio.Queue] = None
         self._broadcast_task = None
         self._running = False
@@ -38,6 +52,9 @@ class ConnectionManager:
 
                     if message_type == "task":
                         await self._broadcast_task_event(data)
+                    elif message_type == "task_batch":
+                        for task_event in data:
+                            await self._broadcast_task_event(task_event)
                     elif message_type == "worker":
                         await self._broadcast_worker_event(data)
                     elif message_type == "progress":
@@ -67,6 +84,7 @@ class ConnectionManager:
         self.active_connections.append(websocket)
         self.client_filters[websocket] = {}
         self.client_modes[websocket] = "live"
+        self.live_connections.add(websocket)
         logger.info(f"Client connected. Total connections: {len(self.active_connections)}")
 
         if len(self.active_connections) == 1:
@@ -77,13 +95,20 @@ class ConnectionManager:
             self.active_connections.remove(websocket)
         if websocket in self.client_filters:
             del self.client_filters[websocket]
+        self._compiled_filters.pop(websocket, None)
         if websocket in self.client_modes:
             del self.client_modes[websocket]
+        self.live_connections.discard(websocket)
         logger.info(f"Client disconnected. Total connections: {len(self.active_connections)}")
 
     def queue_broadcast(self, task_event: TaskEvent):
         self._queue_event("task", task_event)
 
+    def queue_broadcast_many(self, task_events: List[TaskEvent]):
+        """Queue several task events with a single hop onto the event loop."""
+        if task_events:
+            self._queue_event("task_batch", list(task_events))
+
     def queue_worker_broadcast(self, worker_event: WorkerEvent):
         self._queue_event("worker", worker_event)
 
@@ -103,7 +128,7 @@ class ConnectionManager:
                 logger.error(f"Error queuing {event_type} event: {e}", exc_info=True)
 
     async def _broadcast_task_event(self, task_event: TaskEvent):
-        await self._broadcast_event(task_event, check_filters=True)
+        await self._broadcast_event(task_event, check_filters=True, exclude_none=True)
 
     async def _broadcast_worker_event(self, worker_event: WorkerEvent):
         await self._broadcast_event(worker_event, check_filters=False)
@@ -114,51 +139,63 @@ class ConnectionManager:
     async def _broadcast_task_action_event(self, action_event):
         await self._broadcast_event(action_event, check_filters=False)
 
-    async def _broadcast_event(self, event, check_filters: bool):
-        if not self.active_connections:
+    async def _broadcast_event(self, event, check_filters: bool, exclude_none: bool = False):
+        if not self.live_connections:
             return
 
-        message = event.model_dump_json()
-        disconnected = []
-
-        for connection in self.active_connections:
-            try:
-                if self.client_modes.get(connection, "live") != "live":
-                    continue
-
-                if check_filters:
-                    filters = self.client_filters.get(connection, {})
-                    if not self._should_send_to_client(event, filters):
-                        continue
-
-                await connection.send_text(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
-                disconnected.append(connection)
-
-        for connection in disconnected:
-            self.disconnect(connection)
-
-    def _should_send_to_client(self, task_event: TaskEvent, filters: dict) -> bool:
-        if not filters:
-            return True
+        if check_filters:
+            # Bound once; the comprehension runs per live client for every event
+            should_send = self._should_send_to_client
+            get_filters = self._compiled_filters.get
+            recipients = [
+                connection for connection in self.live_connections
+                if should_send(event, get_filters(connection, _NO_FILTERS))
+            ]
+        else:
+            recipients = list(self.live_connections)
+
+        # Nothing is serialized for events every client filters out
+        if not recipients:
+            return
 
-        event_types = filters.get("event_types", [])
-        if event_types and task_event.event_type not in event_types:
+        message = event.model_dump_json(exclude_none=exclude_none)
+        # Sent concurrently so one slow socket doesn't hold up everyone else
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in recipients),
+            return_exceptions=True,
+        )
+
+        for connection, result in zip(recipients, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error broadcasting to client: {result}")
+                self.disconnect(connection)
+
+    def _should_send_to_client(self, task_event: TaskEvent, filters: _CompiledFilters) -> bool:
+        event_types, task_names = filters
+        if event_types is not None and task_event.event_type not in event_types:
             return False
-
-        task_names = filters.get("task_names", [])
-        if task_names and task_event.task_name not in task_names:
+        if task_names is not None and task_event.task_name not in task_names:
             return False
-
         return True
 
     def set_client_filters(self, websocket: WebSocket, filters: dict):
         self.client_filters[websocket] = filters
+        # Compiled once per subscribe so the broadcast loop does set lookups
+        # instead of scanning the client's filter lists for every event.
+        if not isinstance(filters, dict):
+            filters = {}
+        self._compiled_filters[websocket] = (
+            _compile_filter_values(filters.get("event_types")),
+            _compile_filter_values(filters.get("task_names")),
+        )
 
     def set_client_mode(self, websocket: WebSocket, mode: str):
         if mode in ["live", "static"]:
             self.client_modes[websocket] = mode
+            if mode == "live":
+                self.live_connections.add(websocket)
+            else:
+                self.live_connections.discard(websocket)
             logger.info(f"Client mode set to: {mode}")
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
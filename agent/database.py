@@ -1,7 +1,8 @@
 """Database models and session management for Kanchi."""
 
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from sqlalchemy import (
     create_engine,
     Column,
@@ -22,6 +23,7 @@ from sqlalchemy.orm import sessionmaker, Session, relationship
 from sqlalchemy.pool import StaticPool, NullPool
 from contextlib import contextmanager
 import json
+import operator
 
 Base = declarative_base()
 
@@ -97,35 +99,74 @@ class TaskEventDB(Base):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API responses."""
-        return {
-            'task_id': self.task_id,
-            'task_name': self.task_name,
-            'event_type': self.event_type,
-            'timestamp': ensure_utc_isoformat(self.timestamp),
-            'hostname': self.hostname,
-            'worker_name': self.worker_name,
-            'queue': self.queue,
-            'exchange': self.exchange or "",
-            'routing_key': self.routing_key,
-            'root_id': self.root_id,
-            'parent_id': self.parent_id,
-            'args': self.args if self.args is not None else [],
-            'kwargs': self.kwargs if self.kwargs is not None else {},
-            'retries': self.retries,
-            'eta': self.eta,
-            'expires': self.expires,
-            'result': self.result,
-            'runtime': self.runtime,
-            'exception': self.exception,
-            'traceback': self.traceback,
-            'retry_of': self.retry_of,
-            'retried_by': json.loads(self.retried_by) if self.retried_by else [],
-            'is_retry': self.is_retry,
-            'has_retries': self.has_retries,
-            'retry_count': self.retry_count,
-            'is_orphan': self.is_orphan,
-            'orphaned_at': ensure_utc_isoformat(self.orphaned_at),
-        }
+        data = dict(zip(_TASK_EVENT_COLUMNS, _get_task_event_columns(self)))
+        data['timestamp'] = ensure_utc_isoformat(data['timestamp'])
+        data['orphaned_at'] = ensure_utc_isoformat(data['orphaned_at'])
+        data['exchange'] = data['exchange'] or ""
+        if data['args'] is None:
+            data['args'] = []
+        if data['kwargs'] is None:
+            data['kwargs'] = {}
+        data['retried_by'] = json.loads(data['retried_by']) if data['retried_by'] else []
+        return data
+
+
+# Column order of TaskEventDB.to_dict(); fetched in one attrgetter call per row.
+_TASK_EVENT_COLUMNS = (
+    'task_id', 'task_name', 'event_type', 'timestamp', 'hostname', 'worker_name',
+    'queue', 'exchange', 'routing_key', 'root_id', 'parent_id', 'args', 'kwargs',
+    'retries', 'eta', 'expires', 'result', 'runtime', 'exception', 'traceback',
+    'retry_of', 'retried_by', 'is_retry', 'has_retries', 'retry_count',
+    'is_orphan', 'orphaned_at',
+)
+_get_task_event_columns = operator.attrgetter(*_TASK_EVENT_COLUMNS)
+
+
+@dataclass(slots=True)
+class TaskEventRow:
+    """
+    Plain row for the task_events insert path.
+
+    Carries the same columns as TaskEventDB without ORM instance state, so
+    ingestion can insert through Core instead of the unit of work.
+    """
+    task_id: str
+    task_name: Optional[str]
+    event_type: str
+    timestamp: datetime
+    hostname: Optional[str] = None
+    worker_name: Optional[str] = None
+    queue: Optional[str] = None
+    exchange: Optional[str] = None
+    routing_key: Optional[str] = None
+    root_id: Optional[str] = None
+    parent_id: Optional[str] = None
+    args: Any = None
+    kwargs: Any = None
+    retries: Optional[int] = 0
+    eta: Optional[str] = None
+    expires: Optional[str] = None
+    result: Any = None
+    runtime: Optional[float] = None
+    exception: Optional[str] = None
+    traceback: Optional[str] = None
+    retry_of: Optional[str] = None
+    retried_by: Optional[str] = None
+    is_retry: bool = False
+    has_retries: bool = False
+    retry_count: int = 0
+    is_orphan: bool = False
+    orphaned_at: Optional[datetime] = None
+    id: Optional[int] = None
+
+    def insert_values(self) -> Dict[str, Any]:
+        """Column values for an INSERT, leaving the primary key to the database."""
+        return dict(zip(_TASK_EVENT_ROW_INSERT_FIELDS, _get_task_event_row_insert_values(self)))
+
+
+# Field names are snapshotted once so inserts don't re-walk fields() per row.
+_TASK_EVENT_ROW_INSERT_FIELDS = tuple(f.name for f in fields(TaskEventRow) if f.name != 'id')
+_get_task_event_row_insert_values = operator.attrgetter(*_TASK_EVENT_ROW_INSERT_FIELDS)
 
 
 class TaskProgressDB(Base):
@@ -833,6 +874,7 @@ class DatabaseManager:
                 poolclass=NullPool,  # No connection pooling - new connection per use
                 pool_pre_ping=True,
                 echo=False,
+                query_cache_size=1200,
                 connect_args={
                     "check_same_thread": False,  # Allow cross-thread usage
                     "timeout": 30.0,  # Wait up to 30s for database locks
@@ -848,10 +890,15 @@ class DatabaseManager:
                 pool_recycle=3600,
                 pool_timeout=30,
                 pool_pre_ping=True,
-                echo=False
+                echo=False,
+                query_cache_size=1200
             )
 
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # Event ingestion never re-reads rows after commit, so skip expiring them
+        self.IngestSessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine
+        )
 
     def run_migrations(self):
         """Run Alembic migrations to upgrade database to latest version."""
@@ -868,7 +915,18 @@ class DatabaseManager:
     @contextmanager
     def get_session(self) -> Session:
         """Get a database session context manager."""
-        session = self.SessionLocal()
+        with self._session_scope(self.SessionLocal) as session:
+            yield session
+
+    @contextmanager
+    def get_ingest_session(self) -> Session:
+        """Get a session for the event write path that does not expire objects on commit."""
+        with self._session_scope(self.IngestSessionLocal) as session:
+            yield session
+
+    @contextmanager
+    def _session_scope(self, factory) -> Session:
+        session = factory()
         try:
             yield session
             session.commit()
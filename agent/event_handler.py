@@ -1,5 +1,7 @@
 import logging
+import threading
 from datetime import datetime, timezone
+from typing import List
 
 from connection_manager import ConnectionManager
 from database import DatabaseManager
@@ -8,24 +10,39 @@ from constants import EventType
 from services import (
     OrphanDetectionService,
     TaskService,
-    WorkerService,
     TaskRegistryService,
-    DailyStatsService,
+    DailyStatsBuffer,
     ProgressService
 )
 from metrics import metrics_collector
 
 logger = logging.getLogger(__name__)
 
+ORPHAN_GRACE_PERIOD_SECONDS = 2
+
 
 class EventHandler:
     def __init__(self, db_manager: DatabaseManager, connection_manager: ConnectionManager, workflow_engine=None):
         self.db_manager = db_manager
         self.connection_manager = connection_manager
         self.workflow_engine = workflow_engine
+        self.daily_stats_buffer = DailyStatsBuffer(db_manager)
 
     def handle_task_event(self, task_event: TaskEvent):
-        try:
+        self.handle_task_events([task_event])
+
+    def handle_task_events(self, task_events: List[TaskEvent]):
+        """
+        Persist and broadcast a batch of task events.
+
+        Registry checks, retry enrichment and inserts for the whole batch share
+        one session and one commit. If the batch fails to save, each event is
+        retried on its own so one bad event cannot drop its neighbours.
+        """
+        if not task_events:
+            return
+
+        for task_event in task_events:
             try:
                 metrics_collector.record_task_event(task_event)
             except Exception as exc:  # pylint: disable=broad-except
@@ -35,28 +52,66 @@ class EventHandler:
                     exc,
                 )
 
-            with self.db_manager.get_session() as session:
-                registry_service = TaskRegistryService(session)
-                registry_service.ensure_task_registered(task_event.task_name)
-
-                task_service = TaskService(session)
-                daily_stats_service = DailyStatsService(session)
-
-                task_service._enrich_task_with_retry_info(task_event)
-                task_service.save_task_event(task_event)
-                daily_stats_service.update_daily_stats(task_event)
-
-            self.connection_manager.queue_broadcast(task_event)
-
-            if self.workflow_engine:
-                self.workflow_engine.process_event(task_event)
+        try:
+            self._save_task_events(task_events)
+        except Exception as e:
+            if len(task_events) == 1:
+                logger.error(f"Error handling task event {task_events[0].task_id}: {e}", exc_info=True)
+                return
+            logger.warning(
+                "Batch save of %d task events failed, retrying individually: %s",
+                len(task_events),
+                e,
+            )
+            saved = []
+            for task_event in task_events:
+                try:
+                    self._save_task_events([task_event])
+                    saved.append(task_event)
+                except Exception as exc:
+                    logger.error(f"Error handling task event {task_event.task_id}: {exc}", exc_info=True)
+            task_events = saved
+            if not task_events:
+                return
+
+        self._publish_task_events(task_events)
+
+    def _save_task_events(self, task_events: List[TaskEvent]):
+        with self.db_manager.get_ingest_session() as session:
+            registry_service = TaskRegistryService(session)
+            for task_name in dict.fromkeys(task_event.task_name for task_event in task_events):
+                registry_service.ensure_task_registered(task_name)
+
+            task_service = TaskService(session)
+            task_service._bulk_enrich_with_retry_info(task_events)
+            task_service.save_task_events(task_events)
+
+    def _publish_task_events(self, task_events: List[TaskEvent]):
+        """Feed saved events to daily stats, broadcasts and workflows; errors are logged, never raised."""
+        for task_event in task_events:
+            try:
+                self.daily_stats_buffer.add(task_event)
+            except Exception as e:
+                logger.error(f"Error handling task event {task_event.task_id}: {e}", exc_info=True)
 
+        try:
+            if len(task_events) == 1:
+                self.connection_manager.queue_broadcast(task_events[0])
+            else:
+                self.connection_manager.queue_broadcast_many(task_events)
         except Exception as e:
-            logger.error(f"Error handling task event {task_event.task_id}: {e}", exc_info=True)
+            logger.error(f"Error broadcasting {len(task_events)} task events: {e}", exc_info=True)
+
+        if self.workflow_engine:
+            for task_event in task_events:
+                try:
+                    self.workflow_engine.process_event(task_event)
+                except Exception as e:
+                    logger.error(f"Error handling task event {task_event.task_id}: {e}", exc_info=True)
 
     def handle_progress_event(self, progress_event):
         try:
-            with self.db_manager.get_session() as session:
+            with self.db_manager.get_ingest_session() as session:
                 progress_service = ProgressService(session)
                 progress_service.save_progress_event(progress_event)
 
@@ -69,7 +124,7 @@ class EventHandler:
 
     def handle_steps_event(self, steps_event):
         try:
-            with self.db_manager.get_session() as session:
+            with self.db_manager.get_ingest_session() as session:
                 progress_service = ProgressService(session)
                 progress_service.save_steps_event(steps_event)
 
@@ -91,11 +146,10 @@ class EventHandler:
                     exc,
                 )
 
-            with self.db_manager.get_session() as session:
-                if worker_event.event_type == EventType.WORKER_OFFLINE.value:
-                    logger.info(f"Worker {worker_event.hostname} went offline, marking tasks as orphaned")
-                    orphaned_at = datetime.now(timezone.utc)
-                    self._mark_tasks_as_orphaned(session, worker_event.hostname, orphaned_at)
+            if worker_event.event_type == EventType.WORKER_OFFLINE.value:
+                logger.info("Worker %s went offline, marking tasks as orphaned", worker_event.hostname)
+                orphaned_at = datetime.now(timezone.utc)
+                self._schedule_orphan_scan(worker_event.hostname, orphaned_at)
 
             self.connection_manager.queue_worker_broadcast(worker_event)
 
@@ -105,31 +159,49 @@ class EventHandler:
         except Exception as e:
             logger.error(f"Error handling worker event {worker_event.hostname}: {e}", exc_info=True)
 
-    def _mark_tasks_as_orphaned(
+    def _schedule_orphan_scan(
+        self,
+        hostname: str,
+        orphaned_at: datetime,
+        grace_period_seconds: int = ORPHAN_GRACE_PERIOD_SECONDS
+    ):
+        """
+        Run the orphan scan for an offline worker once the grace period has passed.
+
+        The wait happens on a timer thread with no session open, so the event
+        thread and the connection pool are not held up in the meantime.
+        """
+        if grace_period_seconds <= 0:
+            self._do_orphan_scan(hostname, orphaned_at, grace_period_seconds)
+            return
+
+        timer = threading.Timer(
+            grace_period_seconds,
+            self._do_orphan_scan,
+            args=(hostname, orphaned_at, grace_period_seconds)
+        )
+        timer.daemon = True
+        timer.start()
+
+    def _do_orphan_scan(
         self,
-        session,
         hostname: str,
         orphaned_at: datetime,
-        grace_period_seconds: int = 2
+        grace_period_seconds: int = ORPHAN_GRACE_PERIOD_SECONDS
     ):
         try:
-            import time
-
-            if grace_period_seconds > 0:
-                time.sleep(grace_period_seconds)
-
-            orphan_service = OrphanDetectionService(session)
-            orphaned_tasks = orphan_service.find_and_mark_orphaned_tasks(
-                hostname=hostname,
-                orphaned_at=orphaned_at,
-                grace_period_seconds=grace_period_seconds
-            )
-
-            if orphaned_tasks:
-                orphan_service.broadcast_orphan_events(
-                    orphaned_tasks, orphaned_at, self.connection_manager
+            with self.db_manager.get_ingest_session() as session:
+                orphan_service = OrphanDetectionService(session)
+                orphaned_tasks = orphan_service.find_and_mark_orphaned_tasks(
+                    hostname=hostname,
+                    orphaned_at=orphaned_at,
+                    grace_period_seconds=grace_period_seconds
                 )
 
+                if orphaned_tasks:
+                    orphan_service.broadcast_orphan_events(
+                        orphaned_tasks, orphaned_at, self.connection_manager
+                    )
+
         except Exception as e:
             logger.error(f"Error marking tasks as orphaned for worker {hostname}: {e}", exc_info=True)
-            session.rollback()
@@ -20,18 +20,18 @@ def main():
     )
     parser.add_argument(
         '--host',
-        default='localhost',
+        default=None,
         help='Server host (default: localhost, can also set WS_HOST env var)'
     )
     parser.add_argument(
         '--port',
         type=int,
-        default=8765,
+        default=None,
         help='Server port (default: 8765, can also set WS_PORT env var)'
     )
     parser.add_argument(
         '--log-level',
-        default='INFO',
+        default=None,
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
         help='Logging level (default: INFO, can also set LOG_LEVEL env var)'
     )
@@ -47,11 +47,11 @@ def main():
     config = Config.from_env()
     if args.broker:
         config.broker_url = args.broker
-    if args.host != 'localhost':
+    if args.host is not None:
         config.ws_host = args.host
-    if args.port != 8765:
+    if args.port is not None:
         config.ws_port = args.port
-    if args.log_level != 'INFO':
+    if args.log_level is not None:
         config.log_level = args.log_level
     
     logger.info(f"Starting Celery Event Monitor server on {config.ws_host}:{config.ws_port}")
@@ -1,6 +1,10 @@
+import functools
 import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 
 from prometheus_client import Counter, Gauge, Histogram
 
@@ -8,15 +12,58 @@ from constants import EventType, COMPLETED_EVENT_TYPES
 from models import TaskEvent, WorkerEvent
 
 
+# Tracking state is split across independently locked shards (by task id for
+# timings, by worker for counts) so concurrent events do not contend on a
+# single lock. Must be a power of two.
+_TRACKING_SHARDS = 16
+
+# Event types that end a task's current execution attempt.
+_TERMINAL_EVENT_TYPES = frozenset(
+    {*(event_type.value for event_type in COMPLETED_EVENT_TYPES), EventType.TASK_RETRIED.value}
+)
+
+# In-flight tasks that never reach a terminal event (lost events, crashed
+# workers) are evicted once tracking grows past this many entries or an entry
+# goes untouched for longer than the TTL.
+_TRACKING_MAX_ENTRIES = 100_000
+_TRACKING_TTL_SECONDS = 3600
+
+# Upper bound on memoised label children per metric.
+_LABELS_CACHE_SIZE = 4096
+
+
+@dataclass(slots=True)
+class _Tracking:
+    """In-flight timing for one task."""
+    task_name: str
+    worker: str
+    touched_at: float
+    received_at: Optional[float] = None
+    started_at: Optional[float] = None
+
+
 def _timestamp(dt: Optional[datetime]) -> float:
     """Convert datetime to UTC timestamp."""
     if dt is None:
-        return datetime.now(timezone.utc).timestamp()
+        return time.time()
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.timestamp()
 
 
+def _cached_labels(metric, maxsize: int = _LABELS_CACHE_SIZE):
+    """
+    Return a getter for ``metric.labels(*values)`` memoised in a bounded LRU.
+
+    Label values are passed positionally in the metric's label order.
+    """
+    return functools.lru_cache(maxsize=maxsize)(metric.labels)
+
+
+def _shard(key: str) -> int:
+    return hash(key) & (_TRACKING_SHARDS - 1)
+
+
 def _safe_task_name(task_name: Optional[str]) -> str:
     return task_name or "unknown"
 
@@ -58,11 +105,33 @@ class MetricsCollector:
             ["worker"],
         )
 
-        self._received_at: Dict[str, float] = {}
-        self._started_at: Dict[str, float] = {}
-        self._prefetched_counts: Dict[Tuple[str, str], int] = {}
-        self._active_counts: Dict[str, int] = {}
-        self._lock = threading.Lock()
+        self._task_events_child = _cached_labels(self.task_events_total)
+        self._queue_wait_child = _cached_labels(self.task_queue_wait_seconds)
+        self._prefetch_child = _cached_labels(self.worker_prefetch_count)
+        self._execution_duration_child = _cached_labels(self.task_execution_duration_seconds)
+        self._worker_status_child = _cached_labels(self.worker_status)
+        self._active_tasks_child = _cached_labels(self.worker_active_tasks)
+
+        self._tracking: List[OrderedDict[str, _Tracking]] = [
+            OrderedDict() for _ in range(_TRACKING_SHARDS)
+        ]
+        self._tracking_shard_capacity = _TRACKING_MAX_ENTRIES // _TRACKING_SHARDS
+        self._tracking_ttl_seconds = _TRACKING_TTL_SECONDS
+        self._tracking_locks = [threading.Lock() for _ in range(_TRACKING_SHARDS)]
+        self._prefetched_counts: List[Dict[Tuple[str, str], int]] = [{} for _ in range(_TRACKING_SHARDS)]
+        self._active_counts: List[Dict[str, int]] = [{} for _ in range(_TRACKING_SHARDS)]
+        self._worker_locks = [threading.Lock() for _ in range(_TRACKING_SHARDS)]
+        self._pending_event_counts: List[Dict[Tuple[str, str, str], int]] = [
+            {} for _ in range(_TRACKING_SHARDS)
+        ]
+        self._event_count_locks = [threading.Lock() for _ in range(_TRACKING_SHARDS)]
+
+        self._task_handlers: Dict[str, Callable[[TaskEvent, str, str, float], None]] = {
+            EventType.TASK_RECEIVED.value: self._handle_received,
+            EventType.TASK_STARTED.value: self._handle_started,
+        }
+        for event_type in _TERMINAL_EVENT_TYPES:
+            self._task_handlers[event_type] = self._handle_finished
 
     def record_task_event(self, task_event: TaskEvent):
         """Update metrics based on a task event."""
@@ -70,38 +139,62 @@ class MetricsCollector:
         worker = _safe_worker(task_event.hostname or task_event.worker_name)
         ts = _timestamp(task_event.timestamp)
 
-        self.task_events_total.labels(
-            task_name=task_name,
-            event_type=task_event.event_type,
-            worker=worker,
-        ).inc()
-
-        if task_event.event_type == EventType.TASK_RECEIVED.value:
-            self._track_received(task_event.task_id, ts)
-            self._update_prefetch(task_name, worker, delta=1)
-            return
-
-        if task_event.event_type == EventType.TASK_STARTED.value:
-            self._record_queue_wait(task_event.task_id, task_name, worker, ts)
-            self._track_started(task_event.task_id, ts)
-            self._update_prefetch(task_name, worker, delta=-1)
-            self._update_active(worker, delta=1)
+        key = (task_name, task_event.event_type, worker)
+        shard = _shard(worker)
+        with self._event_count_locks[shard]:
+            counts = self._pending_event_counts[shard]
+            counts[key] = counts.get(key, 0) + 1
+
+        handler = self._task_handlers.get(task_event.event_type)
+        if handler is not None:
+            handler(task_event, task_name, worker, ts)
+
+    def flush(self):
+        """
+        Fold buffered event counts into the Prometheus counter.
+
+        Task events are counted locally and only pushed into
+        ``kanchi_task_events_total`` here, once per label set, so call this
+        before exposing metrics.
+        """
+        for shard in range(_TRACKING_SHARDS):
+            with self._event_count_locks[shard]:
+                pending = self._pending_event_counts[shard]
+                if not pending:
+                    continue
+                self._pending_event_counts[shard] = {}
+
+            for (task_name, event_type, worker), count in pending.items():
+                self._task_events_child(task_name, event_type, worker).inc(count)
+
+    def _handle_received(self, task_event: TaskEvent, task_name: str, worker: str, ts: float):
+        self._track_received(task_event.task_id, task_name, worker, ts)
+        self._update_prefetch(task_name, worker, delta=1)
+
+    def _handle_started(self, task_event: TaskEvent, task_name: str, worker: str, ts: float):
+        received_ts = self._track_started(task_event.task_id, task_name, worker, ts)
+        self._record_queue_wait(task_name, worker, ts, received_ts)
+        self._update_prefetch(task_name, worker, delta=-1)
+        self._update_active(worker, delta=1)
+
+    def _handle_finished(self, task_event: TaskEvent, task_name: str, worker: str, ts: float):
+        tracking = self._clear_tracking(task_event.task_id)
+        if tracking is None:
+            # Never tracked, already finished, or evicted, in which case
+            # _release_evicted has already taken it off the gauges.
+            self._record_execution_duration(task_event, task_name, worker, ts, None)
             return
 
-        if task_event.event_type in COMPLETED_EVENT_TYPES or (
-            task_event.event_type == EventType.TASK_RETRIED.value
-        ):
-            self._record_execution_duration(task_event, task_name, worker, ts)
-            self._update_active(worker, delta=-1)
-            self._update_prefetch(task_name, worker, delta=-1)
-            self._clear_tracking(task_event.task_id)
+        self._record_execution_duration(task_event, task_name, worker, ts, tracking.started_at)
+        self._update_active(worker, delta=-1)
+        self._update_prefetch(task_name, worker, delta=-1)
 
     def record_worker_event(self, worker_event: WorkerEvent):
         """Update metrics based on a worker event."""
         worker = _safe_worker(worker_event.hostname)
         is_offline = worker_event.event_type == EventType.WORKER_OFFLINE.value
 
-        self.worker_status.labels(worker=worker).set(0 if is_offline else 1)
+        self._worker_status_child(worker).set(0 if is_offline else 1)
 
         if worker_event.active is not None:
             self._set_active(worker, max(worker_event.active, 0))
@@ -111,28 +204,23 @@ class MetricsCollector:
             self._reset_prefetch_for_worker(worker)
 
     def _record_queue_wait(
-        self, task_id: str, task_name: str, worker: str, started_ts: float
+        self, task_name: str, worker: str, started_ts: float, received_ts: Optional[float]
     ):
-        with self._lock:
-            received_ts = self._received_at.pop(task_id, None)
-
         if received_ts is None:
             return
 
         wait_seconds = max(0.0, started_ts - received_ts)
-        self.task_queue_wait_seconds.labels(
-            task_name=task_name,
-            worker=worker,
-        ).set(wait_seconds)
+        self._queue_wait_child(task_name, worker).set(wait_seconds)
 
     def _record_execution_duration(
-        self, task_event: TaskEvent, task_name: str, worker: str, ts: float
+        self,
+        task_event: TaskEvent,
+        task_name: str,
+        worker: str,
+        ts: float,
+        start_ts: Optional[float],
     ):
         duration = task_event.runtime
-        start_ts = None
-
-        with self._lock:
-            start_ts = self._started_at.pop(task_event.task_id, None)
 
         if duration is None and start_ts is not None:
             duration = ts - start_ts
@@ -140,70 +228,127 @@ class MetricsCollector:
         if duration is None:
             return
 
-        self.task_execution_duration_seconds.labels(
-            task_name=task_name,
-            worker=worker,
-        ).observe(max(0.0, duration))
-
-    def _track_received(self, task_id: str, ts: float):
-        with self._lock:
-            self._received_at[task_id] = ts
-
-    def _track_started(self, task_id: str, ts: float):
-        with self._lock:
-            self._started_at[task_id] = ts
-
-    def _clear_tracking(self, task_id: str):
-        with self._lock:
-            self._received_at.pop(task_id, None)
-            self._started_at.pop(task_id, None)
+        self._execution_duration_child(task_name, worker).observe(max(0.0, duration))
+
+    def _track_received(self, task_id: str, task_name: str, worker: str, ts: float):
+        shard = _shard(task_id)
+        with self._tracking_locks[shard]:
+            tracking = self._touch_tracking(shard, task_id, task_name, worker)
+            tracking.received_at = ts
+            evicted = self._evict_stale_tracking(shard, tracking.touched_at)
+
+        self._release_evicted(evicted)
+
+    def _track_started(self, task_id: str, task_name: str, worker: str, ts: float) -> Optional[float]:
+        """Record the start time and return (and consume) the received time."""
+        shard = _shard(task_id)
+        with self._tracking_locks[shard]:
+            tracking = self._touch_tracking(shard, task_id, task_name, worker)
+            received_ts = tracking.received_at
+            tracking.received_at = None
+            tracking.started_at = ts
+            evicted = self._evict_stale_tracking(shard, tracking.touched_at)
+
+        self._release_evicted(evicted)
+        return received_ts
+
+    def _touch_tracking(self, shard: int, task_id: str, task_name: str, worker: str) -> _Tracking:
+        """Return the task's record, moved to the young end of its shard. Caller holds the lock."""
+        entries = self._tracking[shard]
+        now = time.monotonic()
+        tracking = entries.get(task_id)
+        if tracking is None:
+            tracking = _Tracking(task_name=task_name, worker=worker, touched_at=now)
+            entries[task_id] = tracking
+        else:
+            tracking.task_name = task_name
+            tracking.worker = worker
+            tracking.touched_at = now
+            entries.move_to_end(task_id)
+        return tracking
+
+    def _evict_stale_tracking(self, shard: int, now: float) -> List[_Tracking]:
+        """Drop the oldest records over capacity or past the TTL. Caller holds the lock."""
+        entries = self._tracking[shard]
+        evicted = []
+        while entries:
+            oldest = next(iter(entries.values()))
+            if (
+                len(entries) <= self._tracking_shard_capacity
+                and now - oldest.touched_at <= self._tracking_ttl_seconds
+            ):
+                break
+            evicted.append(entries.popitem(last=False)[1])
+        return evicted
+
+    def _release_evicted(self, evicted: List[_Tracking]):
+        """Undo the gauge contributions of tasks that will never finish."""
+        for tracking in evicted:
+            if tracking.started_at is not None:
+                self._update_active(tracking.worker, delta=-1)
+            elif tracking.received_at is not None:
+                self._update_prefetch(tracking.task_name, tracking.worker, delta=-1)
+
+    def _clear_tracking(self, task_id: str) -> Optional[_Tracking]:
+        shard = _shard(task_id)
+        with self._tracking_locks[shard]:
+            return self._tracking[shard].pop(task_id, None)
 
     def _update_prefetch(self, task_name: str, worker: str, delta: int):
+        if delta == 0:
+            return
         key = (task_name, worker)
-        with self._lock:
-            current = self._prefetched_counts.get(key, 0)
+        shard = _shard(worker)
+        with self._worker_locks[shard]:
+            counts = self._prefetched_counts[shard]
+            current = counts.get(key, 0)
             new_value = max(0, current + delta)
+            if new_value == current:
+                return
 
             if new_value == 0:
-                self._prefetched_counts.pop(key, None)
+                counts.pop(key, None)
             else:
-                self._prefetched_counts[key] = new_value
+                counts[key] = new_value
 
-        self.worker_prefetch_count.labels(
-            task_name=task_name,
-            worker=worker,
-        ).set(new_value)
+        self._prefetch_child(task_name, worker).set(new_value)
 
     def _reset_prefetch_for_worker(self, worker: str):
-        with self._lock:
-            keys = [key for key in self._prefetched_counts if key[1] == worker]
+        shard = _shard(worker)
+        with self._worker_locks[shard]:
+            counts = self._prefetched_counts[shard]
+            keys = [key for key in counts if key[1] == worker]
             for key in keys:
-                self._prefetched_counts.pop(key, None)
-                self.worker_prefetch_count.labels(
-                    task_name=key[0],
-                    worker=worker,
-                ).set(0)
+                counts.pop(key, None)
+                self._prefetch_child(key[0], worker).set(0)
 
     def _update_active(self, worker: str, delta: int):
-        with self._lock:
-            current = self._active_counts.get(worker, 0)
+        if delta == 0:
+            return
+        shard = _shard(worker)
+        with self._worker_locks[shard]:
+            counts = self._active_counts[shard]
+            current = counts.get(worker, 0)
             new_value = max(0, current + delta)
+            if new_value == current:
+                return
 
             if new_value == 0:
-                self._active_counts.pop(worker, None)
+                counts.pop(worker, None)
             else:
-                self._active_counts[worker] = new_value
+                counts[worker] = new_value
 
-        self.worker_active_tasks.labels(worker=worker).set(new_value)
+        self._active_tasks_child(worker).set(new_value)
 
     def _set_active(self, worker: str, value: int):
-        with self._lock:
+        shard = _shard(worker)
+        with self._worker_locks[shard]:
             if value <= 0:
-                self._active_counts.pop(worker, None)
+                self._active_counts[shard].pop(worker, None)
             else:
-                self._active_counts[worker] = value
+                self._active_counts[shard][worker] = value
 
-        self.worker_active_tasks.labels(worker=worker).set(max(0, value))
+        self._active_tasks_child(worker).set(max(0, value))
 
 
 metrics_collector = MetricsCollector()
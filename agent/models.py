@@ -1,12 +1,54 @@
-from typing import Any, Dict, Optional, List, Union, Literal
+from typing import Annotated, Any, Dict, Optional, List, Tuple, Union, Literal
+from dataclasses import dataclass
 from datetime import datetime, timezone, date
 from enum import Enum
 import ast
-from pydantic import BaseModel, Field, field_validator
+import functools
+import json
+import sys
+from pydantic import AfterValidator, BaseModel, Field, field_validator
 
 from utils.payload_sanitizer import sanitize_payload
 
 
+# Distinct args/kwargs reprs remembered by _parse_literal.
+_LITERAL_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_LITERAL_CACHE_SIZE)
+def _parse_literal(raw: str) -> Any:
+    """
+    Parse a Celery args/kwargs repr string.
+
+    Reprs without quoted strings (e.g. "[1, 2]") are usually valid JSON, which
+    decodes far faster than ast.literal_eval compiles an AST; anything else
+    falls back to literal_eval.
+
+    Results are cached per repr and shared between calls, so callers must not
+    mutate them; the validators copy them through sanitize_payload.
+    """
+    if raw[0] in '[{' and "'" not in raw:
+        try:
+            return json.loads(raw)
+        except ValueError:
+            pass
+    return ast.literal_eval(raw)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern low-cardinality event strings so buffered events share one copy."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+# Naive values are UTC; normalizing them on validation lets pydantic-core
+# serialize the field natively instead of through a per-datetime json_encoder.
+UtcDatetime = Annotated[datetime, AfterValidator(_as_utc)]
+
+
 class TaskEvent(BaseModel):
     """Represents a Celery task event"""
     task_id: str
@@ -30,12 +72,14 @@ class TaskEvent(BaseModel):
     exception: Optional[str] = None
     traceback: Optional[str] = None
     retry_of: Optional['TaskEvent'] = None
-    retried_by: List['TaskEvent'] = Field(default_factory=list)
+    # Tuples: the empty default is shared rather than allocated per event, and
+    # the related events are fanned out by reference without defensive copies.
+    retried_by: Tuple['TaskEvent', ...] = ()
     is_retry: bool = False
     has_retries: bool = False
     retry_count: int = 0
     rerun_of: Optional['TaskEvent'] = None
-    rerun_by: List['TaskEvent'] = Field(default_factory=list)
+    rerun_by: Tuple['TaskEvent', ...] = ()
     is_rerun: bool = False
     has_reruns: bool = False
     rerun_count: int = 0
@@ -48,54 +92,53 @@ class TaskEvent(BaseModel):
     submitted_rerun_kwargs: Optional[Dict[str, Any]] = None
     submitted_rerun_kind: Optional[str] = None
 
-    model_config = {
-        'from_attributes': True,
-        'json_encoders': {
-            datetime: lambda v: v.isoformat() if v else None
-        }
-    }
+    model_config = {'from_attributes': True}
 
     @classmethod
-    def from_celery_event(cls, event: dict, task_name: Optional[str] = None) -> 'TaskEvent':
-        return cls(
-            task_id=event.get('uuid', ''),
-            task_name=task_name or event.get('name', 'unknown'),
-            event_type=event.get('type', 'unknown'),
-            timestamp=datetime.now(timezone.utc),
-            args=event.get('args'),
-            kwargs=event.get('kwargs'),
-            retries=event.get('retries', 0),
-            eta=event.get('eta'),
-            expires=event.get('expires'),
-            hostname=event.get('hostname'),
-            queue=event.get('queue'),
-            exchange=event.get('exchange') or '',
-            routing_key=event.get('routing_key') or 'default',
-            root_id=event.get('root_id', event.get('uuid', '')),
-            parent_id=event.get('parent_id'),
-            result=event.get('result'),
-            runtime=event.get('runtime'),
-            exception=event.get('exception'),
-            traceback=event.get('traceback'),
+    def from_celery_event(
+        cls, event: dict, task_name: Optional[str] = None, now: Optional[datetime] = None
+    ) -> 'TaskEvent':
+        """Create TaskEvent from a Celery task event, stamped with ``now`` when given."""
+        get = event.get
+        task_id = get('uuid', '')
+        # Broker events are already well-typed, so only the payload fields go
+        # through their validators and the model itself is built unvalidated.
+        return cls.model_construct(
+            task_id=task_id,
+            task_name=_intern(task_name or get('name', 'unknown')),
+            event_type=_intern(get('type', 'unknown')),
+            timestamp=now or datetime.now(timezone.utc),
+            args=cls.validate_args(get('args')),
+            kwargs=cls.validate_kwargs(get('kwargs')),
+            retries=get('retries', 0),
+            eta=get('eta'),
+            expires=get('expires'),
+            hostname=_intern(get('hostname')),
+            queue=_intern(get('queue')),
+            exchange=_intern(get('exchange') or ''),
+            routing_key=_intern(get('routing_key') or 'default'),
+            root_id=get('root_id', task_id),
+            parent_id=get('parent_id'),
+            result=cls.sanitize_result(get('result')),
+            runtime=get('runtime'),
+            exception=get('exception'),
+            traceback=get('traceback'),
         )
 
     @field_validator('args', mode='before')
     @classmethod
     def validate_args(cls, v):
-        if v is None:
+        # Every falsy input (None, '', [], ()) validates to an empty list
+        if not v:
             return []
-        if isinstance(v, list):
+        # sanitize_payload already rebuilds tuples as lists, so they are not copied first
+        if isinstance(v, (list, tuple)):
             sanitized, _ = sanitize_payload(v)
             return sanitized if isinstance(sanitized, list) else ([] if sanitized is None else [sanitized])
-        if isinstance(v, tuple):
-            sanitized, _ = sanitize_payload(list(v))
-            return sanitized if isinstance(sanitized, list) else ([] if sanitized is None else [sanitized])
         if isinstance(v, str):
             try:
-                parsed = ast.literal_eval(v) if v and v != '()' else []
-                if isinstance(parsed, tuple):
-                    parsed = list(parsed)
-                elif not isinstance(parsed, list):
+                parsed = _parse_literal(v) if v and v not in ('()', '[]') else []
+                if not isinstance(parsed, (list, tuple)):
                     parsed = []
                 sanitized, _ = sanitize_payload(parsed)
                 return sanitized if isinstance(sanitized, list) else []
@@ -107,14 +150,14 @@ class TaskEvent(BaseModel):
     @field_validator('kwargs', mode='before')
     @classmethod
     def validate_kwargs(cls, v):
-        if v is None:
+        if not v:
             return {}
         if isinstance(v, dict):
             sanitized, _ = sanitize_payload(v)
             return sanitized if isinstance(sanitized, dict) else {}
         if isinstance(v, str):
             try:
-                parsed = ast.literal_eval(v) if v and v != '{}' else {}
+                parsed = _parse_literal(v) if v and v != '{}' else {}
                 sanitized, _ = sanitize_payload(parsed if isinstance(parsed, dict) else {})
                 return sanitized if isinstance(sanitized, dict) else {}
             except:
@@ -158,12 +201,6 @@ class TaskStepsEvent(BaseModel):
     timestamp: datetime
     event_type: Literal["kanchi-task-steps"] = "kanchi-task-steps"
 
-    model_config = {
-        'json_encoders': {
-            datetime: lambda v: v.isoformat() if v else None
-        }
-    }
-
 
 class TaskProgressEvent(BaseModel):
     """Task progress update event."""
@@ -176,14 +213,8 @@ class TaskProgressEvent(BaseModel):
     meta: Optional[Dict[str, Any]] = None
     event_type: Literal["kanchi-task-progress"] = "kanchi-task-progress"
 
-    model_config = {
-        'json_encoders': {
-            datetime: lambda v: v.isoformat() if v else None
-        }
-    }
-
     @classmethod
-    def from_celery_event(cls, event: dict) -> 'TaskProgressEvent':
+    def from_celery_event(cls, event: dict, now: Optional[datetime] = None) -> 'TaskProgressEvent':
         sanitized_meta, _ = sanitize_payload(event.get('meta'))
         ts_value = event.get('timestamp')
         if isinstance(ts_value, (int, float)):
@@ -194,9 +225,9 @@ class TaskProgressEvent(BaseModel):
                 if ts.tzinfo is None:
                     ts = ts.replace(tzinfo=timezone.utc)
             except Exception:
-                ts = datetime.now(timezone.utc)
+                ts = now or datetime.now(timezone.utc)
         else:
-            ts = datetime.now(timezone.utc)
+            ts = now or datetime.now(timezone.utc)
         return cls(
             task_id=event.get('task_id', ''),
             task_name=event.get('task_name', ''),
@@ -387,12 +418,7 @@ class TaskActionItem(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {
-        'from_attributes': True,
-        'json_encoders': {
-            datetime: lambda v: v.isoformat() if v else None
-        }
-    }
+    model_config = {'from_attributes': True}
 
 
 class TaskActionSummary(BaseModel):
@@ -417,12 +443,7 @@ class TaskActionSummary(BaseModel):
     item_failed: int = 0
     summary: Dict[str, Any] = Field(default_factory=dict)
 
-    model_config = {
-        'from_attributes': True,
-        'json_encoders': {
-            datetime: lambda v: v.isoformat() if v else None
-        }
-    }
+    model_config = {'from_attributes': True}
 
 
 class TaskActionDetail(TaskActionSummary):
@@ -449,31 +470,28 @@ class WorkerInfo(BaseModel):
     """Worker information model"""
     hostname: str
     status: str
-    timestamp: datetime
+    timestamp: UtcDatetime
     active_tasks: int = 0
     processed_tasks: int = 0
     sw_ident: Optional[str] = None
     sw_ver: Optional[str] = None
     sw_sys: Optional[str] = None
-    loadavg: Optional[List[float]] = None
+    loadavg: Optional[Tuple[float, float, float]] = None  # 1/5/15-minute load
     freq: Optional[float] = None
 
     class Config:
         from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.replace(tzinfo=timezone.utc).isoformat() if v.tzinfo is None else v.isoformat()
-        }
 
 
 class WorkerEvent(BaseModel):
     """Worker event model"""
     hostname: str
     event_type: str
-    timestamp: datetime
+    timestamp: UtcDatetime
     active: Optional[int] = None
     processed: Optional[int] = None
     pool: Optional[Dict[str, Any]] = None
-    loadavg: Optional[List[float]] = None
+    loadavg: Optional[Tuple[float, float, float]] = None  # 1/5/15-minute load
     freq: Optional[float] = None
     sw_ident: Optional[str] = None
     sw_ver: Optional[str] = None
@@ -481,19 +499,22 @@ class WorkerEvent(BaseModel):
 
     class Config:
         from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.replace(tzinfo=timezone.utc).isoformat() if v.tzinfo is None else v.isoformat()
-        }
 
     @classmethod
-    def from_celery_event(cls, event: dict) -> 'WorkerEvent':
-        """Create WorkerEvent from Celery worker event"""
-        event_type = event.get('type', 'unknown')
+    def from_celery_event(cls, event: dict, now: Optional[datetime] = None) -> 'WorkerEvent':
+        """Create WorkerEvent from Celery worker event, falling back to ``now`` without a timestamp"""
+        event_type = _intern(event.get('type', 'unknown'))
+        ts_value = event.get('timestamp')
+        timestamp = (
+            datetime.fromtimestamp(ts_value, tz=timezone.utc)
+            if ts_value is not None
+            else now or datetime.now(timezone.utc)
+        )
 
         return cls(
-            hostname=event.get('hostname', 'unknown'),
+            hostname=_intern(event.get('hostname', 'unknown')),
             event_type=event_type,
-            timestamp=datetime.fromtimestamp(event.get('timestamp', datetime.now(timezone.utc).timestamp()), tz=timezone.utc),
+            timestamp=timestamp,
             active=event.get('active'),
             processed=event.get('processed'),
             pool=event.get('pool'),
@@ -535,16 +556,13 @@ class TaskRegistryResponse(BaseModel):
     human_readable_name: Optional[str] = None
     description: Optional[str] = None
     tags: List[str] = Field(default_factory=list)
-    created_at: datetime
-    updated_at: datetime
-    first_seen: datetime
-    last_seen: datetime
+    created_at: UtcDatetime
+    updated_at: UtcDatetime
+    first_seen: UtcDatetime
+    last_seen: UtcDatetime
 
     class Config:
         from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.replace(tzinfo=timezone.utc).isoformat() if v.tzinfo is None else v.isoformat()
-        }
 
 
 class TaskRegistryUpdate(BaseModel):
@@ -553,6 +571,8 @@ class TaskRegistryUpdate(BaseModel):
     description: Optional[str] = None
     tags: Optional[List[str]] = None
 
+    model_config = {'defer_build': True}
+
 
 class TaskRegistryStats(BaseModel):
     """Statistics for a specific task"""
@@ -563,12 +583,7 @@ class TaskRegistryStats(BaseModel):
     pending: int = 0
     retried: int = 0
     avg_runtime: Optional[float] = None
-    last_execution: Optional[datetime] = None
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.replace(tzinfo=timezone.utc).isoformat() if v and v.tzinfo is None else (v.isoformat() if v else None)
-        }
+    last_execution: Optional[UtcDatetime] = None
 
 
 class TaskDailyStatsResponse(BaseModel):
@@ -588,15 +603,11 @@ class TaskDailyStatsResponse(BaseModel):
     p50_runtime: Optional[float] = None
     p95_runtime: Optional[float] = None
     p99_runtime: Optional[float] = None
-    first_execution: Optional[datetime] = None
-    last_execution: Optional[datetime] = None
+    first_execution: Optional[UtcDatetime] = None
+    last_execution: Optional[UtcDatetime] = None
 
     class Config:
         from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.replace(tzinfo=timezone.utc).isoformat() if v and v.tzinfo is None else (v.isoformat() if v else None),
-            date: lambda v: v.isoformat()
-        }
 
 
 class EnvironmentResponse(BaseModel):
@@ -608,14 +619,11 @@ class EnvironmentResponse(BaseModel):
     worker_patterns: List[str] = Field(default_factory=list)
     is_active: bool = False
     is_default: bool = False
-    created_at: datetime
-    updated_at: datetime
+    created_at: UtcDatetime
+    updated_at: UtcDatetime
 
     class Config:
         from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.replace(tzinfo=timezone.utc).isoformat() if v.tzinfo is None else v.isoformat()
-        }
 
 
 class EnvironmentCreate(BaseModel):
@@ -641,14 +649,11 @@ class UserSessionResponse(BaseModel):
     session_id: str
     active_environment_id: Optional[str] = None
     preferences: Dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime
-    last_active: datetime
+    created_at: UtcDatetime
+    last_active: UtcDatetime
 
     class Config:
         from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.replace(tzinfo=timezone.utc).isoformat() if v.tzinfo is None else v.isoformat()
-        }
 
 
 class UserSessionCreate(BaseModel):
@@ -672,14 +677,11 @@ class AppSetting(BaseModel):
     label: Optional[str] = None
     description: Optional[str] = None
     category: Optional[str] = None
-    created_at: datetime
-    updated_at: datetime
+    created_at: UtcDatetime
+    updated_at: UtcDatetime
 
     class Config:
         from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.replace(tzinfo=timezone.utc).isoformat() if v.tzinfo is None else v.isoformat()
-        }
 
 
 class AppSettingUpdate(BaseModel):
@@ -752,6 +754,8 @@ class AppConfigSnapshot(BaseModel):
     retention_last_run: RetentionLastRun = Field(default_factory=RetentionLastRun)
 
 
+# Auth, workflow and registry-update models are only touched by their own API
+# routes, so their validators are built on first use instead of at import.
 class UserInfo(BaseModel):
     """Authenticated user information returned to clients."""
     id: str
@@ -760,6 +764,8 @@ class UserInfo(BaseModel):
     name: Optional[str] = None
     avatar_url: Optional[str] = None
 
+    model_config = {'defer_build': True}
+
 
 class AuthTokens(BaseModel):
     """Token bundle returned after login/refresh."""
@@ -770,6 +776,8 @@ class AuthTokens(BaseModel):
     refresh_expires_in: int
     session_id: str
 
+    model_config = {'defer_build': True}
+
 
 class AuthConfigResponse(BaseModel):
     """Backend authentication configuration."""
@@ -778,6 +786,8 @@ class AuthConfigResponse(BaseModel):
     oauth_providers: List[str] = Field(default_factory=list)
     allowed_email_patterns: List[str] = Field(default_factory=list)
 
+    model_config = {'defer_build': True}
+
 
 class LoginResponse(BaseModel):
     """Login response payload."""
@@ -785,6 +795,8 @@ class LoginResponse(BaseModel):
     tokens: AuthTokens
     provider: str
 
+    model_config = {'defer_build': True}
+
 
 class BasicLoginRequest(BaseModel):
     """Basic authentication request payload."""
@@ -792,44 +804,40 @@ class BasicLoginRequest(BaseModel):
     password: str
     session_id: Optional[str] = None
 
+    model_config = {'defer_build': True}
+
 
 class RefreshRequest(BaseModel):
     """Refresh token request payload."""
     refresh_token: str
 
+    model_config = {'defer_build': True}
+
 
 class LogoutRequest(BaseModel):
     """Logout request payload."""
     session_id: Optional[str] = None
 
+    model_config = {'defer_build': True}
+
 
 class TimelineBucket(BaseModel):
     """Single time bucket in timeline"""
-    timestamp: datetime
+    timestamp: UtcDatetime
     total_executions: int = 0
     succeeded: int = 0
     failed: int = 0
     retried: int = 0
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.replace(tzinfo=timezone.utc).isoformat() if v.tzinfo is None else v.isoformat()
-        }
-
 
 class TaskTimelineResponse(BaseModel):
     """Timeline response showing execution frequency over time"""
     task_name: str
-    start_time: datetime
-    end_time: datetime
+    start_time: UtcDatetime
+    end_time: UtcDatetime
     bucket_size_minutes: int
     buckets: List[TimelineBucket]
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.replace(tzinfo=timezone.utc).isoformat() if v.tzinfo is None else v.isoformat()
-        }
-
 
 class PingMessage(BaseModel):
     """WebSocket ping message"""
@@ -931,7 +939,8 @@ class CircuitBreakerConfig(BaseModel):
         return value
 
 
-class CircuitBreakerState(BaseModel):
+@dataclass(slots=True)
+class CircuitBreakerState:
     """Result of circuit breaker check."""
     is_open: bool
     reason: Optional[str] = None
@@ -983,6 +992,7 @@ class WorkflowDefinition(BaseModel):
 
     class Config:
         from_attributes = True
+        defer_build = True
 
 
 class WorkflowCreateRequest(BaseModel):
@@ -998,6 +1008,8 @@ class WorkflowCreateRequest(BaseModel):
     cooldown_seconds: int = 0
     circuit_breaker: Optional[CircuitBreakerConfig] = None
 
+    model_config = {'defer_build': True}
+
 
 class WorkflowUpdateRequest(BaseModel):
     """Request model for updating a workflow."""
@@ -1012,6 +1024,8 @@ class WorkflowUpdateRequest(BaseModel):
     cooldown_seconds: Optional[int] = None
     circuit_breaker: Optional[CircuitBreakerConfig] = None
 
+    model_config = {'defer_build': True}
+
 
 class WorkflowExecutionRecord(BaseModel):
     """Execution history record."""
@@ -1032,6 +1046,7 @@ class WorkflowExecutionRecord(BaseModel):
 
     class Config:
         from_attributes = True
+        defer_build = True
 
 
 class ActionConfigDefinition(BaseModel):
@@ -1049,6 +1064,7 @@ class ActionConfigDefinition(BaseModel):
 
     class Config:
         from_attributes = True
+        defer_build = True
 
 
 class ActionConfigCreateRequest(BaseModel):
@@ -1058,9 +1074,13 @@ class ActionConfigCreateRequest(BaseModel):
     action_type: str
     config: Dict[str, Any]
 
+    model_config = {'defer_build': True}
+
 
 class ActionConfigUpdateRequest(BaseModel):
     """Request model for updating action config."""
     name: Optional[str] = None
     description: Optional[str] = None
     config: Optional[Dict[str, Any]] = None
+
+    model_config = {'defer_build': True}
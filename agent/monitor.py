@@ -1,9 +1,11 @@
 """Simplified Celery event monitor."""
 
 import logging
+import threading
 import time
+from functools import partial
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from celery import Celery
 
@@ -18,6 +20,37 @@ _RECONNECT_BASE_DELAY = 1    # seconds
 _RECONNECT_MAX_DELAY  = 60   # seconds
 _RECONNECT_MULTIPLIER = 2
 
+# Events arriving within this many seconds share one wall-clock datetime.
+_CLOCK_RESOLUTION = 0.001
+
+# Task events are handed to the batch callback once this many are pending, or
+# once the oldest has waited _TASK_BATCH_MAX_DELAY seconds. While batching, the
+# broker is polled at that interval so the deadline also holds when idle.
+_TASK_BATCH_SIZE = 64
+_TASK_BATCH_MAX_DELAY = 0.05
+
+# kombu's default wait for broker events between consume-loop iterations.
+_DRAIN_TIMEOUT = 1
+
+# How long stop() waits for the consume loop to exit and flush pending events.
+_STOP_TIMEOUT = 5
+
+# Worker event type -> (status, log level, log message, (field, default) pairs copied from the event)
+_WORKER_EVENT_UPDATES: Dict[str, Tuple[str, int, str, Tuple[Tuple[str, Any], ...]]] = {
+    EventType.WORKER_ONLINE.value: (
+        "online", logging.INFO, "Worker online: %s",
+        (("sw_ident", None), ("sw_ver", None), ("sw_sys", None)),
+    ),
+    EventType.WORKER_OFFLINE.value: (
+        "offline", logging.WARNING, "Worker offline: %s",
+        (),
+    ),
+    EventType.WORKER_HEARTBEAT.value: (
+        "online", logging.DEBUG, "Worker heartbeat: %s",
+        (("active", 0), ("processed", 0), ("pool", None), ("loadavg", None), ("freq", None)),
+    ),
+}
+
 
 class CeleryEventMonitor:
     """Monitor Celery events and handle them simply."""
@@ -45,16 +78,33 @@ class CeleryEventMonitor:
 
         self.state = None
         self.task_callback: Optional[Callable] = None
+        self.batch_task_callback: Optional[Callable] = None
         self.worker_callback: Optional[Callable] = None
         self.progress_callback: Optional[Callable] = None
         self.steps_callback: Optional[Callable] = None
         self.workers: Dict[str, Dict[str, Any]] = {}
+        # Bumped after every change to ``workers``; readers share one copy per generation.
+        self._workers_generation = 0
+        self._workers_snapshot: Tuple[int, Dict[str, Dict[str, Any]]] = (-1, {})
         self._stop = False
+        self._clock_read_at = 0.0
+        self._clock_now = datetime.now(timezone.utc)
+        self._pending_task_events: List[TaskEvent] = []
+        self._pending_since = 0.0
+        self._receiver = None
+        # Set whenever no consume loop is running, i.e. nothing is left pending.
+        self._idle = threading.Event()
+        self._idle.set()
+        self._handlers = self._build_handlers()
 
     def set_task_callback(self, callback: Callable[[TaskEvent], None]):
         """Set callback for task events."""
         self.task_callback = callback
 
+    def set_batch_task_callback(self, callback: Callable[[List[TaskEvent]], None]):
+        """Set callback for batches of task events; takes precedence over the task callback."""
+        self.batch_task_callback = callback
+
     def set_worker_callback(self, callback: Callable[[WorkerEvent], None]):
         """Set callback for worker events."""
         self.worker_callback = callback
@@ -67,40 +117,99 @@ class CeleryEventMonitor:
         """Set callback for task steps events."""
         self.steps_callback = callback
 
+    def _build_handlers(self) -> Dict[str, Callable[[Dict[str, Any]], None]]:
+        """Map Celery event types to handlers, built once and reused on every reconnect."""
+        handle_task = self._handle_task_event
+        handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            event_type.value: handle_task
+            for event_type in (
+                EventType.TASK_SENT,
+                EventType.TASK_RECEIVED,
+                EventType.TASK_STARTED,
+                EventType.TASK_SUCCEEDED,
+                EventType.TASK_FAILED,
+                EventType.TASK_RETRIED,
+                EventType.TASK_REVOKED,
+            )
+        }
+        for event_type in (
+            EventType.WORKER_ONLINE,
+            EventType.WORKER_OFFLINE,
+            EventType.WORKER_HEARTBEAT,
+        ):
+            handlers[event_type.value] = partial(
+                self._handle_worker_event, event_type=event_type.value
+            )
+        handlers[EventType.TASK_PROGRESS.value] = self._handle_progress_event
+        handlers[EventType.TASK_STEPS.value] = self._handle_steps_event
+        return handlers
+
+    def _utc_now(self) -> datetime:
+        """Current UTC time, reusing the last datetime built within _CLOCK_RESOLUTION."""
+        now = time.time()
+        # abs() so a wall clock stepped backwards refreshes the cache as well.
+        if abs(now - self._clock_read_at) >= _CLOCK_RESOLUTION:
+            self._clock_read_at = now
+            self._clock_now = datetime.fromtimestamp(now, tz=timezone.utc)
+        return self._clock_now
+
     def _handle_task_event(self, event: Dict[str, Any]):
         """Handle task events."""
         try:
+            # Only the name needs resolving here: type and uuid are read (and the
+            # low-cardinality strings interned) once, in TaskEvent.from_celery_event.
+            # State.event hands back the task it just updated, so it is not looked
+            # up again in state.tasks.
+            task_name = None
             if self.state:
-                self.state.event(event)
-
-            task_name = event.get("name", "unknown")
-            task_id = event.get("uuid", "")
-            event_type = event.get("type", "")
-            
+                (task, _created), _subject = self.state.event(event)
+                task_name = task.name
 
-            if self.state and task_id:
-                task = self.state.tasks.get(task_id)
-                if task and hasattr(task, "name"):
-                    task_name = task.name
+            task_event = TaskEvent.from_celery_event(event, task_name, now=self._utc_now())
 
-            task_event = TaskEvent.from_celery_event(event, task_name)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Task %s: %s[%s]", task_event.event_type, task_event.task_name, task_event.task_id)
 
-            logger.debug(f"Task {event_type}: {task_name}[{task_id}]")
+            if self.batch_task_callback:
+                pending = self._pending_task_events
+                if not pending:
+                    self._pending_since = time.monotonic()
+                pending.append(task_event)
+                if len(pending) >= _TASK_BATCH_SIZE:
+                    self._flush_task_events()
+                return
 
-            if self.task_callback:
-                self.task_callback(task_event)
+            task_callback = self.task_callback
+            if task_callback:
+                task_callback(task_event)
 
         except Exception as e:
-            logger.error(f"Error handling task event: {e}", exc_info=True)
+            logger.error("Error handling task event: %s", e, exc_info=True)
+
+    def _flush_task_events(self):
+        """Hand pending task events to the batch callback."""
+        pending = self._pending_task_events
+        if not pending:
+            return
+        self._pending_task_events = []
+        try:
+            self.batch_task_callback(pending)
+        except Exception as e:
+            logger.error("Error handling batch of %d task events: %s", len(pending), e, exc_info=True)
+
+    def _flush_stale_task_events(self):
+        """Flush pending task events once the oldest has waited long enough."""
+        if self._pending_task_events and time.monotonic() - self._pending_since >= _TASK_BATCH_MAX_DELAY:
+            self._flush_task_events()
 
     def _handle_progress_event(self, event: Dict[str, Any]):
         """Handle custom task progress events."""
         try:
-            progress_event = TaskProgressEvent.from_celery_event(event)
+            progress_event = TaskProgressEvent.from_celery_event(event, now=self._utc_now())
             if self.progress_callback:
                 self.progress_callback(progress_event)
         except Exception as exc:
-            logger.error(f"Error handling progress event: {exc}", exc_info=True)
+            logger.error("Error handling progress event: %s", exc, exc_info=True)
 
     def _handle_steps_event(self, event: Dict[str, Any]):
         """Handle custom task steps events."""
@@ -110,7 +219,7 @@ class CeleryEventMonitor:
             if isinstance(ts_value, (int, float)):
                 ts = datetime.fromtimestamp(ts_value, tz=timezone.utc)
             else:
-                ts = datetime.now(timezone.utc)
+                ts = self._utc_now()
             steps_event = TaskStepsEvent(
                 task_id=event.get("task_id", ""),
                 task_name=event.get("task_name", ""),
@@ -120,88 +229,107 @@ class CeleryEventMonitor:
             if self.steps_callback:
                 self.steps_callback(steps_event)
         except Exception as exc:
-            logger.error(f"Error handling steps event: {exc}", exc_info=True)
+            logger.error("Error handling steps event: %s", exc, exc_info=True)
 
     def _handle_worker_event(self, event: Dict[str, Any], event_type: str):
         """Handle worker events."""
         try:
-            hostname = event.get("hostname", "unknown")
-            timestamp = datetime.now(timezone.utc)
-
-            if hostname not in self.workers:
-                self.workers[hostname] = {}
-
-            if event_type == EventType.WORKER_ONLINE.value:
-                self.workers[hostname].update(
-                    {
-                        "status": "online",
-                        "timestamp": timestamp,
-                        "sw_ident": event.get("sw_ident"),
-                        "sw_ver": event.get("sw_ver"),
-                        "sw_sys": event.get("sw_sys"),
-                    }
-                )
-                logger.info(f"Worker online: {hostname}")
-
-            elif event_type == EventType.WORKER_OFFLINE.value:
-                self.workers[hostname].update({"status": "offline", "timestamp": timestamp})
-                logger.warning(f"Worker offline: {hostname}")
-
-            elif event_type == EventType.WORKER_HEARTBEAT.value:
-                self.workers[hostname].update(
-                    {
-                        "status": "online",
-                        "timestamp": timestamp,
-                        "active": event.get("active", 0),
-                        "processed": event.get("processed", 0),
-                        "pool": event.get("pool"),
-                        "loadavg": event.get("loadavg"),
-                        "freq": event.get("freq"),
-                    }
-                )
-                logger.debug(f"Worker heartbeat: {hostname} - Active: {event.get('active', 0)}")
+            get = event.get
+            hostname = get("hostname", "unknown")
+            timestamp = self._utc_now()
+
+            status, log_level, log_message, fields = _WORKER_EVENT_UPDATES[event_type]
+            if status == "offline":
+                # Going offline orphans the worker's running tasks, so their
+                # pending events must be stored first.
+                self._flush_task_events()
+
+            worker = self.workers.setdefault(hostname, {})
+            worker["status"] = status
+            worker["timestamp"] = timestamp
+            for field, default in fields:
+                worker[field] = get(field, default)
+
+            if logger.isEnabledFor(log_level):
+                logger.log(log_level, log_message, hostname)
+
+            self._workers_generation += 1
 
             if self.worker_callback:
-                worker_event = WorkerEvent.from_celery_event(event)
+                worker_event = WorkerEvent.from_celery_event(event, now=timestamp)
                 self.worker_callback(worker_event)
 
         except Exception as e:
-            logger.error(f"Error handling worker event: {e}", exc_info=True)
+            logger.error("Error handling worker event: %s", e, exc_info=True)
 
     def get_workers_info(self) -> Dict[str, Dict[str, Any]]:
-        """Get current worker states."""
-        return self.workers.copy()
+        """
+        Get current worker states.
 
-    def stop(self):
-        """Signal the monitor loop to stop reconnecting and exit cleanly."""
+        The result is a snapshot shared by every caller until the next worker
+        update, so it must be treated as read-only; use ``mark_worker_offline``
+        to change a worker's status. Writers mutate before bumping the
+        generation, so a snapshot is never cached under a newer generation
+        than the state it was copied from.
+        """
+        generation = self._workers_generation
+        snapshot_generation, snapshot = self._workers_snapshot
+        if snapshot_generation != generation:
+            snapshot = {hostname: dict(state) for hostname, state in list(self.workers.items())}
+            self._workers_snapshot = (generation, snapshot)
+        return snapshot
+
+    def mark_worker_offline(self, hostname: str):
+        """Mark a known worker offline without waiting for its worker-offline event."""
+        worker = self.workers.get(hostname)
+        if worker is not None:
+            worker["status"] = "offline"
+            self._workers_generation += 1
+
+    def stop(self, timeout: float = _STOP_TIMEOUT):
+        """
+        Stop the monitor loop and hand any pending task events to the batch callback.
+
+        The running consume loop is asked to exit and flushes its pending batch
+        on the way out; this waits up to ``timeout`` seconds for that, since the
+        monitor thread is a daemon and would otherwise die with the batch.
+        """
         self._stop = True
+        receiver = self._receiver
+        if receiver is not None:
+            receiver.should_stop = True
+        if not self._idle.wait(timeout):
+            logger.warning(
+                "Monitor did not stop within %ss; %d pending task events may be lost",
+                timeout, len(self._pending_task_events),
+            )
 
     def _run_once(self):
         """Open one broker connection and capture events until it closes."""
         with self.app.connection() as connection:
-            handlers = {
-                EventType.TASK_SENT.value: self._handle_task_event,
-                EventType.TASK_RECEIVED.value: self._handle_task_event,
-                EventType.TASK_STARTED.value: self._handle_task_event,
-                EventType.TASK_SUCCEEDED.value: self._handle_task_event,
-                EventType.TASK_FAILED.value: self._handle_task_event,
-                EventType.TASK_RETRIED.value: self._handle_task_event,
-                EventType.TASK_REVOKED.value: self._handle_task_event,
-                EventType.WORKER_ONLINE.value: lambda event: self._handle_worker_event(
-                    event, EventType.WORKER_ONLINE.value
-                ),
-                EventType.WORKER_OFFLINE.value: lambda event: self._handle_worker_event(
-                    event, EventType.WORKER_OFFLINE.value
-                ),
-                EventType.WORKER_HEARTBEAT.value: lambda event: self._handle_worker_event(
-                    event, EventType.WORKER_HEARTBEAT.value
-                ),
-                EventType.TASK_PROGRESS.value: self._handle_progress_event,
-                EventType.TASK_STEPS.value: self._handle_steps_event,
-            }
-            recv = self.app.events.Receiver(connection, handlers=handlers)
+            recv = self.app.events.Receiver(connection, handlers=self._handlers)
+            # The consume loop calls on_iteration before every drain, and a
+            # drain waits at most safety_interval for events, so a partial
+            # batch is flushed within about twice _TASK_BATCH_MAX_DELAY even on
+            # a quiet broker. This is Receiver.capture with that interval.
+            recv.on_iteration = self._flush_stale_task_events
+            drain_timeout = _TASK_BATCH_MAX_DELAY if self.batch_task_callback else _DRAIN_TIMEOUT
             logger.info("Monitoring Celery events...")
-            recv.capture(limit=None, timeout=None, wakeup=True)
+            self._receiver = recv
+            self._idle.clear()
+            try:
+                # stop() may have run before the receiver was published.
+                recv.should_stop = self._stop
+                for _ in recv.consume(
+                    limit=None, timeout=None, wakeup=True, safety_interval=drain_timeout
+                ):
+                    pass
+            finally:
+                self._receiver = None
+                try:
+                    self._flush_task_events()
+                finally:
+                    self._idle.set()
 
     def start_monitoring(self):
         """Start monitoring Celery events, reconnecting automatically on broker disconnects.
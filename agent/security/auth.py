@@ -20,7 +20,7 @@ class AuthError(Exception):
     """Raised for authentication-related issues."""
 
 
-@dataclass
+@dataclass(slots=True)
 class AnonymousUser:
     """Represents an unauthenticated requester."""
     id: Optional[str] = None
@@ -33,7 +33,7 @@ class AnonymousUser:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticatedUser:
     """Minimal authenticated user context."""
     id: str
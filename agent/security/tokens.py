@@ -24,7 +24,7 @@ def _b64_decode(data: str) -> bytes:
     return base64.urlsafe_b64decode(data + padding)
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenPayload:
     """Decoded token payload."""
     token_type: str
@@ -4,7 +4,7 @@ from .task_service import TaskService
 from .worker_service import WorkerService
 from .orphan_detection_service import OrphanDetectionService
 from .task_registry_service import TaskRegistryService
-from .daily_stats_service import DailyStatsService
+from .daily_stats_service import DailyStatsBuffer, DailyStatsService
 from .progress_service import ProgressService
 from .environment_service import EnvironmentService
 from .session_service import SessionService
@@ -20,6 +20,7 @@ __all__ = [
     'OrphanDetectionService',
     'TaskRegistryService',
     'DailyStatsService',
+    'DailyStatsBuffer',
     'ProgressService',
     'EnvironmentService',
     'SessionService',
@@ -20,7 +20,7 @@ from security.auth import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class LoginResult:
     """Result returned after a successful login/refresh."""
     user: UserDB
@@ -1,16 +1,141 @@
 """Service for managing daily task statistics."""
 
 import logging
-from datetime import datetime, timezone, date
-from typing import List, Optional
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import case, func, literal
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from database import TaskDailyStatsDB
+from database import DatabaseManager, TaskDailyStatsDB
 from models import TaskEvent, TaskDailyStatsResponse
 
 logger = logging.getLogger(__name__)
 
+_COUNTER_COLUMNS = ('total_executions', 'succeeded', 'failed', 'retried', 'revoked', 'orphaned')
+_SETTLING_EVENT_TYPES = frozenset(('task-succeeded', 'task-failed', 'task-revoked'))
+# Validates a whole result set in one pydantic-core call instead of per row
+_STATS_LIST_ADAPTER = TypeAdapter(List[TaskDailyStatsResponse])
+# A task/day row whose flush keeps failing is dropped after this many attempts
+# so it cannot hold back the rest of the buffer forever.
+_MAX_FLUSH_ATTEMPTS = 5
+
+
+@dataclass(slots=True)
+class DailyStatsDelta:
+    """
+    Accumulated change to one task/day statistics row.
+
+    ``pending`` is tracked as a shift and a floor so that a sequence of
+    increments and clamped decrements composes exactly: the stored value
+    becomes ``max(pending + pending_shift, pending_floor)``.
+
+    ``runtimes`` keeps each runtime with the delta's succeeded count at that
+    point, so the per-event running average can be replayed exactly.
+    """
+    task_name: str
+    date: date
+    total_executions: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retried: int = 0
+    revoked: int = 0
+    orphaned: int = 0
+    pending_shift: int = 0
+    pending_floor: int = 0
+    runtimes: List[Tuple[int, float]] = field(default_factory=list)
+    min_runtime: Optional[float] = None
+    max_runtime: Optional[float] = None
+    first_execution: Optional[datetime] = None
+    last_execution: Optional[datetime] = None
+
+    @classmethod
+    def from_event(cls, task_event: TaskEvent) -> 'DailyStatsDelta':
+        delta = cls(task_name=task_event.task_name, date=task_event.timestamp.date())
+        delta.add(task_event)
+        return delta
+
+    def add(self, task_event: TaskEvent):
+        event_type = task_event.event_type
+
+        if event_type == 'task-received':
+            self.total_executions += 1
+            self._shift_pending(1)
+        elif event_type == 'task-succeeded':
+            self.succeeded += 1
+        elif event_type == 'task-failed':
+            self.failed += 1
+        elif event_type == 'task-retried':
+            self.retried += 1
+        elif event_type == 'task-revoked':
+            self.revoked += 1
+
+        if event_type in _SETTLING_EVENT_TYPES:
+            self._shift_pending(-1)
+
+        if task_event.is_orphan:
+            self.orphaned += 1
+
+        runtime = task_event.runtime
+        if runtime is not None:
+            self.runtimes.append((self.succeeded, runtime))
+            if self.min_runtime is None or runtime < self.min_runtime:
+                self.min_runtime = runtime
+            if self.max_runtime is None or runtime > self.max_runtime:
+                self.max_runtime = runtime
+
+        event_ts = task_event.timestamp
+        if event_ts.tzinfo is None:
+            event_ts = event_ts.replace(tzinfo=timezone.utc)
+        self._extend_window(event_ts, event_ts)
+
+    def merge(self, later: 'DailyStatsDelta'):
+        """Fold in a delta for the same row that happened after this one."""
+        succeeded = self.succeeded
+        self.runtimes.extend((succeeded + count, runtime) for count, runtime in later.runtimes)
+
+        for column in _COUNTER_COLUMNS:
+            setattr(self, column, getattr(self, column) + getattr(later, column))
+
+        self.pending_floor = max(self.pending_floor + later.pending_shift, later.pending_floor)
+        self.pending_shift += later.pending_shift
+
+        if later.min_runtime is not None and (self.min_runtime is None or later.min_runtime < self.min_runtime):
+            self.min_runtime = later.min_runtime
+        if later.max_runtime is not None and (self.max_runtime is None or later.max_runtime > self.max_runtime):
+            self.max_runtime = later.max_runtime
+
+        if later.first_execution is not None:
+            self._extend_window(later.first_execution, later.last_execution)
+
+    def apply_pending(self, pending: int) -> int:
+        return max(pending + self.pending_shift, self.pending_floor)
+
+    def apply_avg_runtime(self, avg_runtime: Optional[float], succeeded: int) -> Optional[float]:
+        """Replay the per-event running average onto a row's stored average and succeeded count."""
+        for delta_succeeded, runtime in self.runtimes:
+            count = succeeded + delta_succeeded
+            if avg_runtime is None or count <= 0:
+                avg_runtime = runtime
+            else:
+                avg_runtime = ((avg_runtime * count) + runtime) / (count + 1)
+        return avg_runtime
+
+    def _shift_pending(self, amount: int):
+        self.pending_floor = max(self.pending_floor + amount, 0)
+        self.pending_shift += amount
+
+    def _extend_window(self, first: datetime, last: datetime):
+        if self.first_execution is None or first < self.first_execution:
+            self.first_execution = first
+        if self.last_execution is None or last > self.last_execution:
+            self.last_execution = last
+
 
 class DailyStatsService:
 
@@ -18,18 +143,135 @@ class DailyStatsService:
         self.session = session
 
     def update_daily_stats(self, task_event: TaskEvent):
-        event_date = task_event.timestamp.date()
-        task_name = task_event.task_name
+        """Fold a single task event into its task/day statistics row."""
+        self.apply_deltas([DailyStatsDelta.from_event(task_event)])
 
+    def apply_deltas(self, deltas: Iterable[DailyStatsDelta]):
+        """
+        Apply accumulated deltas to the statistics table and commit once.
+
+        On PostgreSQL, MySQL and SQLite each row is a single INSERT ... ON CONFLICT
+        upsert whose counters are computed in SQL, so concurrent writers cannot
+        lose increments. The running average is replayed in Python from the row
+        as read in the same transaction. Other dialects fall back to
+        read-modify-write.
+        """
+        dialect = self.session.bind.dialect.name if self.session.bind else "sqlite"
+
+        try:
+            for delta in deltas:
+                if dialect in ("postgresql", "mysql", "sqlite"):
+                    self.session.execute(self._build_upsert(delta, dialect))
+                else:
+                    self._apply_delta_orm(delta)
+            self.session.commit()
+        except Exception as e:
+            logger.error(f"Error updating daily stats: {e}")
+            self.session.rollback()
+            raise
+
+    def _build_upsert(self, delta: DailyStatsDelta, dialect: str):
+        """Build the dialect-specific upsert for one delta."""
+        now = datetime.now(timezone.utc)
+        avg_runtime = None
+        if delta.runtimes:
+            stored = self.session.query(
+                TaskDailyStatsDB.avg_runtime, TaskDailyStatsDB.succeeded
+            ).filter(
+                TaskDailyStatsDB.task_name == delta.task_name,
+                TaskDailyStatsDB.date == delta.date
+            ).first()
+            if stored is None:
+                avg_runtime = delta.apply_avg_runtime(None, 0)
+            else:
+                avg_runtime = delta.apply_avg_runtime(stored.avg_runtime, stored.succeeded or 0)
+
+        values = {
+            'task_name': delta.task_name,
+            'date': delta.date,
+            'pending': delta.apply_pending(0),
+            'avg_runtime': avg_runtime,
+            'min_runtime': delta.min_runtime,
+            'max_runtime': delta.max_runtime,
+            'first_execution': delta.first_execution,
+            'last_execution': delta.last_execution,
+            'created_at': now,
+            'updated_at': now,
+        }
+        for column in _COUNTER_COLUMNS:
+            values[column] = getattr(delta, column)
+
+        table = TaskDailyStatsDB
+        first_ts = literal(delta.first_execution, type_=table.first_execution.type)
+        last_ts = literal(delta.last_execution, type_=table.last_execution.type)
+
+        # Assignment order matters on MySQL, which evaluates SET clauses left to
+        # right against already-updated values: derived columns go first.
+        updates = [
+            ('first_execution', case(
+                (table.first_execution.is_(None), first_ts),
+                (table.first_execution > first_ts, first_ts),
+                else_=table.first_execution
+            )),
+            ('last_execution', case(
+                (table.last_execution.is_(None), last_ts),
+                (table.last_execution < last_ts, last_ts),
+                else_=table.last_execution
+            )),
+        ]
+
+        if delta.runtimes:
+            rt_min = literal(delta.min_runtime, type_=table.min_runtime.type)
+            rt_max = literal(delta.max_runtime, type_=table.max_runtime.type)
+            updates += [
+                ('avg_runtime', literal(avg_runtime, type_=table.avg_runtime.type)),
+                ('min_runtime', case(
+                    (table.min_runtime.is_(None), rt_min),
+                    (table.min_runtime > rt_min, rt_min),
+                    else_=table.min_runtime
+                )),
+                ('max_runtime', case(
+                    (table.max_runtime.is_(None), rt_max),
+                    (table.max_runtime < rt_max, rt_max),
+                    else_=table.max_runtime
+                )),
+            ]
+
+        for column in _COUNTER_COLUMNS:
+            amount = getattr(delta, column)
+            if amount:
+                updates.append((column, func.coalesce(getattr(table, column), 0) + amount))
+
+        if delta.pending_shift or delta.pending_floor:
+            shifted = func.coalesce(table.pending, 0) + delta.pending_shift
+            updates.append(('pending', case(
+                (shifted > delta.pending_floor, shifted),
+                else_=delta.pending_floor
+            )))
+
+        updates.append(('updated_at', literal(now, type_=table.updated_at.type)))
+
+        if dialect == "mysql":
+            stmt = mysql_insert(table).values(**values)
+            return stmt.on_duplicate_key_update(updates)
+
+        insert_fn = pg_insert if dialect == "postgresql" else sqlite_insert
+        stmt = insert_fn(table).values(**values)
+        return stmt.on_conflict_do_update(
+            index_elements=[table.task_name, table.date],
+            set_=dict(updates)
+        )
+
+    def _apply_delta_orm(self, delta: DailyStatsDelta):
         stats = self.session.query(TaskDailyStatsDB).filter(
-            TaskDailyStatsDB.task_name == task_name,
-            TaskDailyStatsDB.date == event_date
+            TaskDailyStatsDB.task_name == delta.task_name,
+            TaskDailyStatsDB.date == delta.date
         ).first()
 
         if not stats:
             stats = TaskDailyStatsDB(
-                task_name=task_name,
-                date=event_date,
+                task_name=delta.task_name,
+                date=delta.date,
                 total_executions=0,
                 succeeded=0,
                 failed=0,
@@ -37,88 +279,47 @@ class DailyStatsService:
                 retried=0,
                 revoked=0,
                 orphaned=0,
-                first_execution=task_event.timestamp,
-                last_execution=task_event.timestamp
             )
             self.session.add(stats)
 
-        event_type = task_event.event_type
+        if delta.runtimes:
+            self._update_runtime_stats(stats, delta)
 
-        if event_type == 'task-received':
-            stats.total_executions += 1
-            stats.pending += 1
-        elif event_type == 'task-succeeded':
-            stats.succeeded += 1
-            if stats.pending > 0:
-                stats.pending -= 1
-        elif event_type == 'task-failed':
-            stats.failed += 1
-            if stats.pending > 0:
-                stats.pending -= 1
-        elif event_type == 'task-retried':
-            stats.retried += 1
-        elif event_type == 'task-revoked':
-            stats.revoked += 1
-            if stats.pending > 0:
-                stats.pending -= 1
+        for column in _COUNTER_COLUMNS:
+            setattr(stats, column, (getattr(stats, column) or 0) + getattr(delta, column))
+        stats.pending = delta.apply_pending(stats.pending or 0)
 
-        if task_event.is_orphan:
-            stats.orphaned += 1
-
-        if task_event.runtime is not None:
-            self._update_runtime_stats(stats, task_event.runtime)
-
-        event_ts = task_event.timestamp
-        if event_ts.tzinfo is None:
-            event_ts = event_ts.replace(tzinfo=timezone.utc)
-
-        if stats.first_execution is None:
-            stats.first_execution = event_ts
-        else:
+        if delta.first_execution is not None:
             first_exec = stats.first_execution
-            if first_exec.tzinfo is None:
+            if first_exec is not None and first_exec.tzinfo is None:
                 first_exec = first_exec.replace(tzinfo=timezone.utc)
-            if event_ts < first_exec:
-                stats.first_execution = event_ts
+            if first_exec is None or delta.first_execution < first_exec:
+                stats.first_execution = delta.first_execution
 
-        if stats.last_execution is None:
-            stats.last_execution = event_ts
-        else:
             last_exec = stats.last_execution
-            if last_exec.tzinfo is None:
+            if last_exec is not None and last_exec.tzinfo is None:
                 last_exec = last_exec.replace(tzinfo=timezone.utc)
-            if event_ts > last_exec:
-                stats.last_execution = event_ts
+            if last_exec is None or delta.last_execution > last_exec:
+                stats.last_execution = delta.last_execution
 
         stats.updated_at = datetime.now(timezone.utc)
 
-        try:
-            self.session.commit()
-        except Exception as e:
-            logger.error(f"Error updating daily stats for {task_name} on {event_date}: {e}")
-            self.session.rollback()
-            raise
-
-    def _update_runtime_stats(self, stats: TaskDailyStatsDB, runtime: float):
+    def _update_runtime_stats(self, stats: TaskDailyStatsDB, delta: DailyStatsDelta):
         """
         Update runtime statistics (avg, min, max, percentiles).
 
+        Must run before the delta's counters are added, since the running
+        average is replayed from the row's earlier succeeded count.
+
         For percentiles, we use a simple approximation since we don't store
         all individual runtimes. For accurate percentiles, query the raw task_events table.
         """
-        if stats.min_runtime is None or runtime < stats.min_runtime:
-            stats.min_runtime = runtime
-        if stats.max_runtime is None or runtime > stats.max_runtime:
-            stats.max_runtime = runtime
-
-        if stats.avg_runtime is None:
-            stats.avg_runtime = runtime
-        else:
-            count = stats.succeeded
-            if count > 0:
-                stats.avg_runtime = ((stats.avg_runtime * count) + runtime) / (count + 1)
-            else:
-                stats.avg_runtime = runtime
+        if stats.min_runtime is None or delta.min_runtime < stats.min_runtime:
+            stats.min_runtime = delta.min_runtime
+        if stats.max_runtime is None or delta.max_runtime > stats.max_runtime:
+            stats.max_runtime = delta.max_runtime
+
+        stats.avg_runtime = delta.apply_avg_runtime(stats.avg_runtime, stats.succeeded or 0)
 
     def get_daily_stats(
         self,
@@ -146,7 +347,7 @@ class DailyStatsService:
             query = query.filter(TaskDailyStatsDB.date <= end_date)
 
         stats = query.order_by(TaskDailyStatsDB.date.desc()).limit(limit).all()
-        return [TaskDailyStatsResponse.model_validate(s) for s in stats]
+        return _STATS_LIST_ADAPTER.validate_python(stats, from_attributes=True)
 
     def get_stats_for_date(
         self,
@@ -172,7 +373,7 @@ class DailyStatsService:
             TaskDailyStatsDB.date == target_date
         ).order_by(TaskDailyStatsDB.total_executions.desc()).all()
 
-        return [TaskDailyStatsResponse.model_validate(s) for s in stats]
+        return _STATS_LIST_ADAPTER.validate_python(stats, from_attributes=True)
 
     def get_task_trend_summary(
         self,
@@ -188,7 +389,6 @@ class DailyStatsService:
         - Failure rate
         - Average runtime trend
         """
-        from datetime import timedelta
         end_date = datetime.now(timezone.utc).date()
         start_date = end_date - timedelta(days=days - 1)
 
@@ -226,3 +426,120 @@ class DailyStatsService:
             'avg_failure_rate': round(failure_rate, 2),
             'avg_runtime': avg_runtime
         }
+
+
+class DailyStatsBuffer:
+    """
+    Coalesce per-event daily statistics updates and flush them periodically.
+
+    Events are merged in memory per (task_name, date); a background thread
+    writes all pending rows in one transaction every flush interval. Rows from
+    a failed flush are retried in their own transactions, so one row that
+    cannot be written does not block the others, and are dropped after
+    _MAX_FLUSH_ATTEMPTS failures.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, flush_interval_seconds: float = 0.5):
+        self.db_manager = db_manager
+        self.flush_interval_seconds = flush_interval_seconds
+        self._pending: Dict[Tuple[str, date], DailyStatsDelta] = {}
+        # Failed flush attempts per row; only touched under _flush_lock.
+        self._flush_failures: Dict[Tuple[str, date], int] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, task_event: TaskEvent):
+        key = (task_event.task_name, task_event.timestamp.date())
+        with self._lock:
+            delta = self._pending.get(key)
+            if delta is None:
+                self._pending[key] = DailyStatsDelta.from_event(task_event)
+            else:
+                delta.add(task_event)
+
+        if self._stop_event.is_set():
+            # The flush thread is gone after stop(), so late events are written now.
+            self.flush()
+        elif self._thread is None:
+            self.start()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run_loop, name="daily-stats-flush", daemon=True
+            )
+            self._thread.start()
+        logger.info("Daily stats buffer started")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5)
+        self.flush()
+        logger.info("Daily stats buffer stopped")
+
+    def flush(self) -> int:
+        """Write all buffered deltas. Returns the number of rows upserted."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                pending, self._pending = self._pending, {}
+
+            retrying = {key: pending.pop(key) for key in list(pending) if key in self._flush_failures}
+            written = 0
+            failed: Dict[Tuple[str, date], DailyStatsDelta] = {}
+
+            if pending:
+                try:
+                    with self.db_manager.get_ingest_session() as session:
+                        DailyStatsService(session).apply_deltas(pending.values())
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.error("Failed to flush daily stats for %d rows: %s", len(pending), exc)
+                    for key in pending:
+                        self._flush_failures[key] = 1
+                    failed.update(pending)
+                else:
+                    written += len(pending)
+
+            for key, delta in retrying.items():
+                try:
+                    with self.db_manager.get_ingest_session() as session:
+                        DailyStatsService(session).apply_deltas([delta])
+                except Exception as exc:  # pylint: disable=broad-except
+                    attempts = self._flush_failures[key] + 1
+                    if attempts >= _MAX_FLUSH_ATTEMPTS:
+                        del self._flush_failures[key]
+                        logger.error(
+                            "Dropping daily stats for %s on %s after %d failed flushes: %s",
+                            key[0], key[1], attempts, exc,
+                        )
+                    else:
+                        self._flush_failures[key] = attempts
+                        failed[key] = delta
+                else:
+                    del self._flush_failures[key]
+                    written += 1
+
+            if failed:
+                self._requeue(failed)
+            return written
+
+    def _requeue(self, failed: Dict[Tuple[str, date], DailyStatsDelta]):
+        with self._lock:
+            for key, newer in self._pending.items():
+                older = failed.get(key)
+                if older is None:
+                    failed[key] = newer
+                else:
+                    older.merge(newer)
+            self._pending = failed
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.wait(self.flush_interval_seconds):
+            self.flush()
@@ -1,11 +1,14 @@
 """Service for managing environment filters."""
 
+import fnmatch
+import functools
 import logging
+import re
 import uuid
-import fnmatch
-from typing import List, Optional
+from typing import List, Optional, Pattern, Tuple
 from datetime import datetime, timezone
 
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
@@ -14,6 +17,15 @@ from models import EnvironmentCreate, EnvironmentUpdate, EnvironmentResponse
 
 logger = logging.getLogger(__name__)
 
+_ENVIRONMENT_LIST_ADAPTER = TypeAdapter(List[EnvironmentResponse])
+_PATTERN_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=_PATTERN_CACHE_SIZE)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Pattern[str]:
+    """Fold a set of wildcard patterns into one anchored alternation."""
+    return re.compile('|'.join(fnmatch.translate(pattern) for pattern in patterns))
+
 
 class EnvironmentService:
     """Service for environment filter operations."""
@@ -51,7 +63,7 @@ class EnvironmentService:
             desc(EnvironmentDB.is_default),
             EnvironmentDB.name
         ).all()
-        return [EnvironmentResponse.model_validate(env) for env in envs]
+        return _ENVIRONMENT_LIST_ADAPTER.validate_python(envs, from_attributes=True)
 
     def get_environment(self, env_id: str) -> Optional[EnvironmentResponse]:
         """Get environment by ID."""
@@ -119,10 +131,7 @@ class EnvironmentService:
         if not patterns:
             return True  # Empty patterns = match all
 
-        for pattern in patterns:
-            if fnmatch.fnmatch(value, pattern):
-                return True
-        return False
+        return _compile_patterns(tuple(patterns)).match(value) is not None
 
     def should_include_event(
         self,
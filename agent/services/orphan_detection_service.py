@@ -2,8 +2,8 @@ import logging
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, and_, func, select, update
+from sqlalchemy.orm import Session, aliased
 
 from database import TaskEventDB
 from models import TaskEvent
@@ -11,6 +11,20 @@ from constants import NON_TERMINAL_EVENT_TYPES, EventType
 
 logger = logging.getLogger(__name__)
 
+_NON_TERMINAL_VALUES = tuple(event_type.value for event_type in NON_TERMINAL_EVENT_TYPES)
+
+# Only the columns needed to mark tasks and build the orphan broadcast events;
+# avoids loading result/traceback/exception blobs for every in-flight task.
+_ORPHAN_COLUMNS = (
+    TaskEventDB.task_id,
+    TaskEventDB.task_name,
+    TaskEventDB.event_type,
+    TaskEventDB.hostname,
+    TaskEventDB.routing_key,
+    TaskEventDB.args,
+    TaskEventDB.kwargs,
+)
+
 
 class OrphanDetectionService:
 
@@ -22,17 +36,33 @@ class OrphanDetectionService:
         hostname: str,
         orphaned_at: datetime,
         grace_period_seconds: int = 2
-    ) -> List[TaskEventDB]:
+    ) -> List[Row]:
         latest_events_subquery = self._build_latest_events_subquery(hostname)
-        orphaned_tasks = self._find_non_terminal_tasks(latest_events_subquery)
+
+        if self._supports_update_returning():
+            orphaned_tasks = self._mark_and_return_orphaned_tasks(
+                hostname, latest_events_subquery, orphaned_at
+            )
+        else:
+            orphaned_tasks = self._find_non_terminal_tasks(latest_events_subquery)
+            if orphaned_tasks:
+                self._mark_tasks_as_orphaned(orphaned_tasks, orphaned_at)
 
         if orphaned_tasks:
-            self._mark_tasks_as_orphaned(orphaned_tasks, orphaned_at, grace_period_seconds)
+            self.session.commit()
+            logger.info(
+                f"Marked {len(orphaned_tasks)} tasks as orphaned for offline worker "
+                f"(grace period: {grace_period_seconds}s)"
+            )
         else:
-            logger.info(f"No tasks to orphan for offline worker {hostname}")
+            logger.info("No tasks to orphan for offline worker %s", hostname)
 
         return orphaned_tasks
 
+    def _supports_update_returning(self) -> bool:
+        bind = self.session.get_bind()
+        return bool(bind is not None and bind.dialect.update_returning)
+
     def _build_latest_events_subquery(self, hostname: str):
         return self.session.query(
             TaskEventDB.task_id,
@@ -41,23 +71,63 @@ class OrphanDetectionService:
             TaskEventDB.hostname == hostname
         ).group_by(TaskEventDB.task_id).subquery()
 
-    def _find_non_terminal_tasks(self, latest_events_subquery) -> List[TaskEventDB]:
-        non_terminal_values = [et.value for et in NON_TERMINAL_EVENT_TYPES]
-        return self.session.query(TaskEventDB).join(
+    def _find_non_terminal_tasks(self, latest_events_subquery) -> List[Row]:
+        return self.session.query(*_ORPHAN_COLUMNS).join(
             latest_events_subquery,
             and_(
                 TaskEventDB.task_id == latest_events_subquery.c.task_id,
                 TaskEventDB.timestamp == latest_events_subquery.c.max_timestamp,
-                TaskEventDB.event_type.in_(non_terminal_values),
+                TaskEventDB.event_type.in_(_NON_TERMINAL_VALUES),
                 TaskEventDB.is_orphan.is_(False)
             )
         ).all()
 
+    def _mark_and_return_orphaned_tasks(
+        self,
+        hostname: str,
+        latest_events_subquery,
+        orphaned_at: datetime
+    ) -> List[Row]:
+        """
+        Mark and fetch orphaned tasks in one UPDATE ... RETURNING round-trip.
+
+        Every event of an orphaned task is marked, so the returned rows are
+        narrowed to the task's latest event on the offline worker, which is the
+        row the two-step path selects.
+        """
+        candidate = aliased(TaskEventDB)
+        candidate_task_ids = select(candidate.task_id).join(
+            latest_events_subquery,
+            and_(
+                candidate.task_id == latest_events_subquery.c.task_id,
+                candidate.timestamp == latest_events_subquery.c.max_timestamp,
+                candidate.event_type.in_(_NON_TERMINAL_VALUES),
+                candidate.is_orphan.is_(False)
+            )
+        )
+
+        stmt = (
+            update(TaskEventDB)
+            .where(TaskEventDB.task_id.in_(candidate_task_ids))
+            .values(is_orphan=True, orphaned_at=orphaned_at)
+            .returning(*_ORPHAN_COLUMNS, TaskEventDB.timestamp, TaskEventDB.id)
+            .execution_options(synchronize_session=False)
+        )
+
+        latest_by_task = {}
+        for row in self.session.execute(stmt):
+            if row.hostname != hostname:
+                continue
+            current = latest_by_task.get(row.task_id)
+            if current is None or (row.timestamp, row.id) > (current.timestamp, current.id):
+                latest_by_task[row.task_id] = row
+
+        return list(latest_by_task.values())
+
     def _mark_tasks_as_orphaned(
         self,
-        orphaned_tasks: List[TaskEventDB],
-        orphaned_at: datetime,
-        grace_period_seconds: int
+        orphaned_tasks: List[Row],
+        orphaned_at: datetime
     ):
         task_ids = [task.task_id for task in orphaned_tasks]
 
@@ -68,23 +138,16 @@ class OrphanDetectionService:
             'orphaned_at': orphaned_at
         }, synchronize_session=False)
 
-        self.session.commit()
-
-        logger.info(
-            f"Marked {len(orphaned_tasks)} tasks as orphaned for offline worker "
-            f"(grace period: {grace_period_seconds}s)"
-        )
-
     def create_orphan_events(
         self,
-        orphaned_tasks: List[TaskEventDB],
+        orphaned_tasks: List[Row],
         orphaned_at: datetime
     ) -> List[TaskEvent]:
         """
         Create orphan event objects from orphaned tasks.
 
         Args:
-            orphaned_tasks: List of orphaned task database objects
+            orphaned_tasks: Orphaned task rows from find_and_mark_orphaned_tasks
             orphaned_at: Timestamp when tasks were orphaned
 
         Returns:
@@ -109,7 +172,7 @@ class OrphanDetectionService:
 
     def broadcast_orphan_events(
         self,
-        orphaned_tasks: List[TaskEventDB],
+        orphaned_tasks: List[Row],
         orphaned_at: datetime,
         connection_manager
     ):
@@ -117,12 +180,11 @@ class OrphanDetectionService:
         Create and broadcast orphan events to WebSocket clients.
 
         Args:
-            orphaned_tasks: List of orphaned task database objects
+            orphaned_tasks: Orphaned task rows from find_and_mark_orphaned_tasks
             orphaned_at: Timestamp when tasks were orphaned
             connection_manager: ConnectionManager instance for broadcasting
         """
         orphan_events = self.create_orphan_events(orphaned_tasks, orphaned_at)
 
-        for orphan_event in orphan_events:
-            logger.info(f"Broadcasting orphan event for task {orphan_event.task_id}")
-            connection_manager.queue_broadcast(orphan_event)
+        logger.info("Broadcasting %d orphan events", len(orphan_events))
+        connection_manager.queue_broadcast_many(orphan_events)
@@ -98,7 +98,7 @@ class ProgressService:
         events = (
             self.session.query(TaskProgressDB)
             .filter_by(task_id=task_id)
-            .order_by(TaskProgressDB.timestamp.desc())
+            .order_by(TaskProgressDB.timestamp.desc(), TaskProgressDB.id.desc())
             .limit(limit)
             .all()
         )
@@ -1057,7 +1057,9 @@ class TaskActionService:
     def _broadcast(self, detail: TaskActionDetail) -> None:
         if not self.connection_manager:
             return
-        event = TaskActionWebSocketEvent(**detail.model_dump())
+        # The detail is already validated; copy its fields instead of dumping
+        # and re-validating the whole item list for every broadcast.
+        event = TaskActionWebSocketEvent.model_construct(**dict(detail))
         queue_method = getattr(self.connection_manager, "queue_task_action_broadcast", None)
         if queue_method:
             queue_method(event)
@@ -2,10 +2,12 @@
 
 import logging
 import threading
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
+from pydantic import TypeAdapter
 from sqlalchemy import String, and_, case, cast, func
 from sqlalchemy.orm import Session
 
@@ -26,6 +28,12 @@ from services.utils import EnvironmentFilter
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between last_seen writes for the same task name
+LAST_SEEN_WRITE_INTERVAL = 60
+
+# Validates a whole registry listing in one pydantic-core call instead of per row
+_REGISTRY_LIST_ADAPTER = TypeAdapter(List[TaskRegistryResponse])
+
 
 class TaskRegistryService:
     """Service for managing task registry with thread-safe in-memory cache."""
@@ -33,6 +41,7 @@ class TaskRegistryService:
     _cache: set = set()
     _cache_initialized: bool = False
     _cache_lock = threading.Lock()
+    _last_seen_written: dict = {}
 
     def __init__(self, session: Session, active_env=None):
         self.session = session
@@ -63,7 +72,8 @@ class TaskRegistryService:
         """
         Ensure task is registered. Auto-discover if not found.
 
-        Uses in-memory cache for fast lookups. Only hits DB on cache miss.
+        Uses in-memory cache for fast lookups. Only hits DB on cache miss;
+        cache hits refresh last_seen at most once per LAST_SEEN_WRITE_INTERVAL.
 
         Args:
             task_name: Name of task to register
@@ -75,10 +85,11 @@ class TaskRegistryService:
         Callers should not rely on the return value for logic, only for logging.
         """
         if task_name in TaskRegistryService._cache:
-            try:
-                self._update_last_seen(task_name)
-            except Exception as e:
-                logger.warning(f"Failed to update last_seen for {task_name}: {e}")
+            if self._last_seen_due(task_name):
+                try:
+                    self._update_last_seen(task_name)
+                except Exception as e:
+                    logger.warning(f"Failed to update last_seen for {task_name}: {e}")
             return None
 
         existing_task = (
@@ -90,6 +101,7 @@ class TaskRegistryService:
         if existing_task:
             with TaskRegistryService._cache_lock:
                 TaskRegistryService._cache.add(task_name)
+            self._last_seen_due(task_name)
             self._update_last_seen(task_name)
             logger.info(f"Task '{task_name}' found in DB, added to cache")
             return existing_task
@@ -97,6 +109,7 @@ class TaskRegistryService:
         new_task = self._register_new_task(task_name)
         with TaskRegistryService._cache_lock:
             TaskRegistryService._cache.add(task_name)
+        self._last_seen_due(task_name)
         logger.info(f"Auto-discovered new task: '{task_name}'")
         return new_task
 
@@ -124,7 +137,7 @@ class TaskRegistryService:
             query = query.filter(cast(TaskRegistryDB.tags, String).contains(f'"{tag}"'))
 
         tasks = query.order_by(TaskRegistryDB.last_seen.desc()).all()
-        return [TaskRegistryResponse.model_validate(task) for task in tasks]
+        return _REGISTRY_LIST_ADAPTER.validate_python(tasks, from_attributes=True)
 
     def get_task(self, task_name: str) -> Optional[TaskRegistryResponse]:
         """
@@ -389,42 +402,38 @@ class TaskRegistryService:
         )
 
         bucket_stats = {
-            result.bucket_index: {
-                'total_executions': result.total_executions or 0,
-                'succeeded': result.succeeded or 0,
-                'failed': result.failed or 0,
-                'retried': result.retried or 0
-            }
+            result.bucket_index: (
+                result.total_executions or 0,
+                result.succeeded or 0,
+                result.failed or 0,
+                result.retried or 0,
+            )
             for result in bucket_query
         }
 
-        timeline_buckets = []
-        current_bucket_start = start_time
+        # Counts are already aggregated in SQL and timestamps are derived from
+        # the aware start_time, so the buckets skip per-field validation.
+        empty = (0, 0, 0, 0)
         bucket_delta = timedelta(minutes=bucket_size_minutes)
-
+        timeline_buckets = []
+        non_empty = 0
         for i in range(num_buckets):
-            stats = bucket_stats.get(i, {
-                'total_executions': 0,
-                'succeeded': 0,
-                'failed': 0,
-                'retried': 0
-            })
-
+            total, succeeded, failed, retried = bucket_stats.get(i, empty)
+            if total > 0:
+                non_empty += 1
             timeline_buckets.append(
-                TimelineBucket(
-                    timestamp=current_bucket_start,
-                    total_executions=stats['total_executions'],
-                    succeeded=stats['succeeded'],
-                    failed=stats['failed'],
-                    retried=stats['retried']
+                TimelineBucket.model_construct(
+                    timestamp=start_time + i * bucket_delta,
+                    total_executions=total,
+                    succeeded=succeeded,
+                    failed=failed,
+                    retried=retried
                 )
             )
-            current_bucket_start += bucket_delta
 
-        non_empty_buckets = [b for b in timeline_buckets if b.total_executions > 0]
         logger.info(
-            f"Timeline for {task_name}: "
-            f"Returning {len(non_empty_buckets)}/{len(timeline_buckets)} non-empty buckets"
+            "Timeline for %s: Returning %d/%d non-empty buckets",
+            task_name, non_empty, len(timeline_buckets)
         )
 
         return TaskTimelineResponse(
@@ -468,6 +477,24 @@ class TaskRegistryService:
             logger.error(f"Failed to register new task {task_name}: {e}")
             raise
 
+    @staticmethod
+    def _last_seen_due(task_name: str) -> bool:
+        """
+        Check whether last_seen should be written for a task, and claim the slot if so.
+
+        Args:
+            task_name: Name of task seen
+
+        Returns:
+            True if the previous write is older than LAST_SEEN_WRITE_INTERVAL
+        """
+        now = time.monotonic()
+        last_written = TaskRegistryService._last_seen_written.get(task_name)
+        if last_written is not None and now - last_written < LAST_SEEN_WRITE_INTERVAL:
+            return False
+        TaskRegistryService._last_seen_written[task_name] = now
+        return True
+
     def _update_last_seen(self, task_name: str):
         """
         Update last_seen timestamp for a task.
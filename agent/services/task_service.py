@@ -3,17 +3,22 @@
 import json
 import logging
 from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from sqlalchemy import (
+    Row,
     String,
     and_,
     asc,
+    bindparam,
     case,
     desc,
     func,
+    insert,
     or_,
     select,
+    tuple_,
 )
 from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -25,6 +30,7 @@ from database import (
     RetryRelationshipDB,
     TaskActionItemDB,
     TaskEventDB,
+    TaskEventRow,
     TaskLatestDB,
     TaskRerunRelationshipDB,
     TaskResolutionDB,
@@ -42,6 +48,53 @@ def _ensure_utc(dt: Optional[datetime]) -> Optional[datetime]:
     return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
 
 
+# Retry/rerun fields every event of a task shares with its first event.
+_RELATIONSHIP_FIELDS = (
+    'retry_of', 'retried_by', 'is_retry', 'has_retries', 'retry_count',
+    'rerun_of', 'rerun_by', 'is_rerun', 'has_reruns', 'rerun_count',
+)
+_get_relationship_fields = attrgetter(*_RELATIONSHIP_FIELDS)
+
+
+def _state_to_event_type(state: str) -> Optional[str]:
+    try:
+        task_state = TaskState(state.upper())
+        event_type = STATE_TO_EVENT_MAP.get(task_state)
+        return event_type.value if event_type else None
+    except (ValueError, KeyError):
+        return None
+
+
+_SEARCH_PATTERN = bindparam('search_pattern', type_=String)
+
+
+def _build_search_clause(model):
+    return or_(
+        model.task_name.ilike(_SEARCH_PATTERN),
+        model.task_id.ilike(_SEARCH_PATTERN),
+        model.hostname.ilike(_SEARCH_PATTERN),
+        model.event_type.ilike(_SEARCH_PATTERN),
+        func.cast(model.args, String).ilike(_SEARCH_PATTERN),
+        func.cast(model.kwargs, String).ilike(_SEARCH_PATTERN)
+    )
+
+
+# Free-text search clauses are built once per table; the term is bound per query.
+_SEARCH_CLAUSES = {
+    TaskEventDB: _build_search_clause(TaskEventDB),
+    TaskLatestDB: _build_search_clause(TaskLatestDB),
+}
+
+
+# Retry enrichment only needs the linkage, not timestamps or surrogate keys.
+_RETRY_RELATIONSHIP_COLUMNS = (
+    RetryRelationshipDB.task_id,
+    RetryRelationshipDB.original_id,
+    RetryRelationshipDB.retry_chain,
+    RetryRelationshipDB.total_retries,
+)
+
+
 class TaskService:
     """Service for managing task events and statistics."""
 
@@ -49,46 +102,80 @@ class TaskService:
         self.session = session
         self.active_env = active_env
 
-    def save_task_event(self, task_event: TaskEvent) -> TaskEventDB:
+    def save_task_event(self, task_event: TaskEvent) -> TaskEventRow:
         """
         Save a task event to the database.
 
+        The row is inserted through Core rather than the ORM unit of work; the
+        ingest path never reads it back as a mapped object.
+
         Args:
             task_event: Task event to save
 
         Returns:
-            Saved database model
+            Saved row, with its generated id
 
         Raises:
             Exception: If database operation fails
         """
         try:
-            routing_key, queue = self._inherit_queue_info(task_event)
-            args, kwargs = self._parse_task_arguments(task_event)
-            self._log_payload_truncation(task_event, args, kwargs, task_event.result)
-
-            # Ensure the in-memory event (used for WebSocket broadcast) carries the
-            # inherited data so downstream consumers don't lose it.
-            task_event.routing_key = routing_key
-            task_event.queue = queue
-            task_event.args = args
-            task_event.kwargs = kwargs
-
-            task_event_db = self._create_task_event_db(
-                task_event, routing_key, queue, args, kwargs
-            )
-
-            self.session.add(task_event_db)
-            self.session.flush()  # Ensure task_event_db.id is available for snapshot upsert
-            self._upsert_task_latest(task_event_db)
+            row = self._insert_task_event(task_event)
             self.session.commit()
-            return task_event_db
+            return row
 
         except Exception as e:
             self.session.rollback()
             logger.error(f"Failed to save task event {task_event.task_id[:8]}: {e}")
             raise
 
+    def save_task_events(self, task_events: List[TaskEvent]) -> List[TaskEventRow]:
+        """
+        Save several task events in a single transaction.
+
+        Events are written in order, so later events in the batch inherit queue
+        info and arguments from earlier ones exactly as with save_task_event.
+
+        Args:
+            task_events: Task events to save
+
+        Returns:
+            Saved rows, in input order
+
+        Raises:
+            Exception: If database operation fails; nothing from the batch is kept
+        """
+        try:
+            rows = [self._insert_task_event(task_event) for task_event in task_events]
+            self.session.commit()
+            return rows
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to save batch of {len(task_events)} task events: {e}")
+            raise
+
+    def _insert_task_event(self, task_event: TaskEvent) -> TaskEventRow:
+        """Insert one task event and refresh its snapshot row, without committing."""
+        routing_key, queue = self._inherit_queue_info(task_event)
+        args, kwargs = self._parse_task_arguments(task_event)
+        self._log_payload_truncation(task_event, args, kwargs, task_event.result)
+
+        # Ensure the in-memory event (used for WebSocket broadcast) carries the
+        # inherited data so downstream consumers don't lose it.
+        task_event.routing_key = routing_key
+        task_event.queue = queue
+        task_event.args = args
+        task_event.kwargs = kwargs
+
+        row = self._create_task_event_row(
+            task_event, routing_key, queue, args, kwargs
+        )
+
+        result = self.session.execute(insert(TaskEventDB).values(**row.insert_values()))
+        row.id = result.inserted_primary_key[0]  # Needed for the snapshot upsert
+        self._upsert_task_latest(row)
+        return row
+
     def get_task_events(self, task_id: str) -> List[TaskEvent]:
         """
         Get all events for a specific task.
@@ -102,7 +189,7 @@ class TaskService:
         events_db = (
             self.session.query(TaskEventDB)
             .filter_by(task_id=task_id)
-            .order_by(TaskEventDB.timestamp)
+            .order_by(TaskEventDB.timestamp, TaskEventDB.id)
             .all()
         )
 
@@ -111,17 +198,10 @@ class TaskService:
         if events:
             self._bulk_enrich_with_retry_info([events[0]])
             self._bulk_enrich_with_rerun_info([events[0]])
-            for i in range(1, len(events)):
-                events[i].retry_of = events[0].retry_of
-                events[i].retried_by = events[0].retried_by
-                events[i].is_retry = events[0].is_retry
-                events[i].has_retries = events[0].has_retries
-                events[i].retry_count = events[0].retry_count
-                events[i].rerun_of = events[0].rerun_of
-                events[i].rerun_by = events[0].rerun_by
-                events[i].is_rerun = events[0].is_rerun
-                events[i].has_reruns = events[0].has_reruns
-                events[i].rerun_count = events[0].rerun_count
+            shared = _get_relationship_fields(events[0])
+            for event in events[1:]:
+                for field, value in zip(_RELATIONSHIP_FIELDS, shared):
+                    setattr(event, field, value)
 
         self._attach_resolution_info(events)
         return events
@@ -140,11 +220,19 @@ class TaskService:
         filter_state: Optional[str] = None,
         filter_worker: Optional[str] = None,
         filter_task: Optional[str] = None,
-        filter_queue: Optional[str] = None
+        filter_queue: Optional[str] = None,
+        before: Optional[Tuple[datetime, Any]] = None
     ) -> Dict[str, Any]:
         """
         Get recent task events with filtering and pagination.
 
+        Passing ``before`` switches from OFFSET paging to keyset (seek) paging:
+        rows strictly older than the ``(timestamp, id)`` cursor are returned and
+        ``page`` is ignored. The cursor for the following page is returned as
+        ``pagination.next_cursor``, which is None on the last page; ``has_next``
+        and ``has_prev`` then describe the cursor position rather than ``page``.
+        Keyset paging only applies to the default sort order.
+
         Args:
             limit: Maximum number of events per page
             page: Page number (0-indexed)
@@ -159,25 +247,41 @@ class TaskService:
             filter_worker: Legacy worker filter
             filter_task: Legacy task name filter
             filter_queue: Legacy queue filter
+            before: Keyset cursor ``(timestamp, id)`` of the last row already seen;
+                ``id`` is the task_id when aggregating
 
         Returns:
             Dictionary with 'data' (list of events) and 'pagination' (metadata)
         """
+        if sort_by:
+            before = None
+
         if aggregate:
-            events, total_events = self._get_aggregated_events(
+            events, total_events, next_cursor = self._get_aggregated_events(
                 limit, page, sort_by, sort_order,
                 filters, start_time, end_time,
-                filter_state, filter_worker, filter_task, filter_queue, search
+                filter_state, filter_worker, filter_task, filter_queue, search,
+                before=before
             )
         else:
-            events, total_events = self._get_all_events(
+            events, total_events, next_cursor = self._get_all_events(
                 limit, page, sort_by, sort_order,
                 filters, start_time, end_time,
-                filter_state, filter_worker, filter_task, filter_queue, search
+                filter_state, filter_worker, filter_task, filter_queue, search,
+                before=before
             )
 
         total_pages = (total_events + limit - 1) // limit if limit > 0 else 1
 
+        if before is None:
+            has_next = page < total_pages - 1
+            has_prev = page > 0
+        else:
+            # A cursor means newer rows were already seen; whether older ones
+            # remain is known from the extra row fetched with the page.
+            has_next = next_cursor is not None
+            has_prev = True
+
         return {
             "data": events,
             "pagination": {
@@ -185,8 +289,9 @@ class TaskService:
                 "limit": limit,
                 "total": total_events,
                 "total_pages": total_pages,
-                "has_next": page < total_pages - 1,
-                "has_prev": page > 0
+                "has_next": has_next,
+                "has_prev": has_prev,
+                "next_cursor": next_cursor
             }
         }
 
@@ -373,7 +478,7 @@ class TaskService:
                 TaskEventDB.task_id.not_in(rerun_original_ids)
             )
 
-        query = query.order_by(TaskEventDB.timestamp.desc())
+        query = query.order_by(TaskEventDB.timestamp.desc(), TaskEventDB.id.desc())
 
         if limit and limit > 0:
             query = query.limit(limit)
@@ -621,8 +726,10 @@ class TaskService:
         kwargs_empty = not kwargs or kwargs in ({}, "{}", "{}")
 
         if args_empty and kwargs_empty:
+            # Only the two JSON columns are loaded, so result/traceback of the
+            # received row are not fetched and decoded just to be discarded.
             existing_received_event = (
-                self.session.query(TaskEventDB)
+                self.session.query(TaskEventDB.args, TaskEventDB.kwargs)
                 .filter_by(task_id=task_event.task_id, event_type=EventType.TASK_RECEIVED.value)
                 .first()
             )
@@ -657,16 +764,16 @@ class TaskService:
 
         return field_value if field_value is not None else default
 
-    def _create_task_event_db(
+    def _create_task_event_row(
         self,
         task_event: TaskEvent,
         routing_key: str,
         queue: str,
         args: Any,
         kwargs: Any
-    ) -> TaskEventDB:
+    ) -> TaskEventRow:
         """
-        Create a TaskEventDB model from a TaskEvent.
+        Create a task_events row from a TaskEvent.
 
         Args:
             task_event: Source task event
@@ -676,9 +783,9 @@ class TaskService:
             kwargs: Parsed kwargs
 
         Returns:
-            TaskEventDB instance ready for insertion
+            TaskEventRow ready for insertion
         """
-        return TaskEventDB(
+        return TaskEventRow(
             task_id=task_event.task_id,
             task_name=task_event.task_name,
             event_type=task_event.event_type,
@@ -713,7 +820,7 @@ class TaskService:
             retry_count=task_event.retry_count
         )
 
-    def _upsert_task_latest(self, event_db: TaskEventDB):
+    def _upsert_task_latest(self, event_db: Union[TaskEventDB, TaskEventRow]):
         """
         Maintain the task_latest snapshot table with the newest event per task_id.
         """
@@ -912,14 +1019,25 @@ class TaskService:
         Returns:
             TaskEvent object
         """
-        args_str = json.dumps(event_db.args) if event_db.args is not None else "()"
-        kwargs_str = json.dumps(event_db.kwargs) if event_db.kwargs is not None else "{}"
-
-        task_event = TaskEvent(
+        args, kwargs = event_db.args, event_db.kwargs
+        # Rows written by _insert_task_event hold args/kwargs as a JSON list and
+        # dict and a result that were sanitized on write, and every other column
+        # is typed to match its field, so those rows are built unvalidated.
+        # Anything else (legacy repr strings, nulls) still goes through the
+        # validators. Unvalidated rows skip only the args/kwargs/result
+        # validators and scalar coercion: the datetime fields (timestamp,
+        # orphaned_at, resolved_at) are UTC-normalized with _ensure_utc below,
+        # matching validate_datetime.
+        build = (
+            TaskEvent.model_construct
+            if type(args) is list and type(kwargs) is dict
+            else TaskEvent
+        )
+        return build(
             task_id=event_db.task_id,
             task_name=event_db.task_name,
             event_type=event_db.event_type,
-            timestamp=event_db.timestamp,
+            timestamp=_ensure_utc(event_db.timestamp),
             hostname=event_db.hostname,
             worker_name=event_db.worker_name,
             queue=event_db.queue,
@@ -927,25 +1045,22 @@ class TaskService:
             routing_key=event_db.routing_key or "",
             root_id=event_db.root_id,
             parent_id=event_db.parent_id,
-            args=args_str,
-            kwargs=kwargs_str,
+            args=args,
+            kwargs=kwargs,
             retries=event_db.retries,
             eta=event_db.eta,
             expires=event_db.expires,
             result=event_db.result,
             runtime=event_db.runtime,
             exception=event_db.exception,
-            traceback=event_db.traceback
+            traceback=event_db.traceback,
+            is_orphan=event_db.is_orphan or False,
+            orphaned_at=_ensure_utc(event_db.orphaned_at),
+            resolved=getattr(event_db, "resolved", False) or False,
+            resolved_at=_ensure_utc(getattr(event_db, "resolved_at", None)),
+            resolved_by=getattr(event_db, "resolved_by", None),
         )
 
-        task_event.is_orphan = event_db.is_orphan or False
-        task_event.orphaned_at = event_db.orphaned_at
-        task_event.resolved = getattr(event_db, "resolved", False) or False
-        task_event.resolved_at = getattr(event_db, "resolved_at", None)
-        task_event.resolved_by = getattr(event_db, "resolved_by", None)
-
-        return task_event
-
     def _enrich_task_with_retry_info(self, task_event: TaskEvent):
         """
         Enrich a single task event with retry relationship information.
@@ -960,7 +1075,8 @@ class TaskService:
         Bulk enrich multiple task events with retry information in a single query.
 
         Populates nested TaskEvent objects for retry_of and retried_by (1 level only).
-        Circular references are prevented by setting nested objects' retry_of and retried_by to None/[].
+        Circular references are prevented by leaving nested objects' retry_of as None
+        and retried_by as the empty tuple default.
 
         Args:
             events: List of task events to enrich
@@ -971,7 +1087,7 @@ class TaskService:
         task_ids = [event.task_id for event in events]
 
         retry_relationships = (
-            self.session.query(RetryRelationshipDB)
+            self.session.query(*_RETRY_RELATIONSHIP_COLUMNS)
             .filter(RetryRelationshipDB.task_id.in_(task_ids))
             .all()
         )
@@ -1074,11 +1190,11 @@ class TaskService:
                 event.submitted_rerun_kind = None
 
             child_rels = by_original_id.get(event.task_id, [])
-            event.rerun_by = [
+            event.rerun_by = tuple(
                 related_tasks[rel.rerun_task_id]
                 for rel in child_rels
                 if rel.rerun_task_id in related_tasks
-            ]
+            )
             event.has_reruns = bool(event.rerun_by)
             event.rerun_count = len(child_rels)
 
@@ -1114,14 +1230,12 @@ class TaskService:
             .all()
         )
 
-        related_tasks_map = {}
-        for event_db in related_events_db:
-            task_event = self._db_to_task_event(event_db)
-            task_event.retry_of = None
-            task_event.retried_by = []
-            related_tasks_map[event_db.task_id] = task_event
-
-        return related_tasks_map
+        # Freshly converted events carry no retry_of/retried_by, which keeps the
+        # nesting one level deep without resetting the fields here.
+        return {
+            event_db.task_id: self._db_to_task_event(event_db)
+            for event_db in related_events_db
+        }
 
     def _attach_resolution_info(self, events: List[TaskEvent]) -> None:
         """
@@ -1150,7 +1264,7 @@ class TaskService:
     def _populate_retry_info(
         self,
         event: TaskEvent,
-        retry_rel: RetryRelationshipDB,
+        retry_rel: Row,
         related_tasks_map: Dict[str, TaskEvent]
     ):
         """
@@ -1158,58 +1272,21 @@ class TaskService:
 
         Args:
             event: Task event to populate
-            retry_rel: Retry relationship from database
-            related_tasks_map: Map of related task events
+            retry_rel: Retry relationship columns from _RETRY_RELATIONSHIP_COLUMNS
+            related_tasks_map: Map of latest events for every related task,
+                as returned by _fetch_related_tasks
         """
-        if retry_rel.original_id != event.task_id:
-            parent_task = related_tasks_map.get(retry_rel.original_id)
-            if not parent_task:
-                parent_task = self._fetch_single_task(retry_rel.original_id)
-            event.retry_of = parent_task
-            event.is_retry = True
-        else:
-            event.retry_of = None
-            event.is_retry = False
-
-        if retry_rel.retry_chain:
-            event.retried_by = []
-            for retry_id in retry_rel.retry_chain:
-                retry_task = related_tasks_map.get(retry_id)
-                if not retry_task:
-                    retry_task = self._fetch_single_task(retry_id)
-                if retry_task:
-                    event.retried_by.append(retry_task)
-            event.has_retries = len(event.retried_by) > 0
-        else:
-            event.retried_by = []
-            event.has_retries = False
+        event.is_retry = retry_rel.original_id != event.task_id
+        event.retry_of = related_tasks_map.get(retry_rel.original_id) if event.is_retry else None
 
-        event.retry_count = retry_rel.total_retries
-
-    def _fetch_single_task(self, task_id: str) -> Optional[TaskEvent]:
-        """
-        Fetch a single task event (fallback for missing bulk fetch).
-
-        Args:
-            task_id: Task ID to fetch
-
-        Returns:
-            TaskEvent or None if not found
-        """
-        event_db = (
-            self.session.query(TaskEventDB)
-            .filter_by(task_id=task_id)
-            .order_by(TaskEventDB.timestamp.desc())
-            .first()
+        event.retried_by = tuple(
+            retry_task
+            for retry_task in map(related_tasks_map.get, retry_rel.retry_chain or ())
+            if retry_task
         )
+        event.has_retries = bool(event.retried_by)
 
-        if event_db:
-            task_event = self._db_to_task_event(event_db)
-            task_event.retry_of = None
-            task_event.retried_by = []
-            return task_event
-
-        return None
+        event.retry_count = retry_rel.total_retries
 
     def _set_default_retry_info(self, event: TaskEvent):
         """
@@ -1219,7 +1296,7 @@ class TaskService:
             event: Task event to set defaults on
         """
         event.retry_of = None
-        event.retried_by = []
+        event.retried_by = ()
         event.is_retry = False
         event.has_retries = False
         event.retry_count = 0
@@ -1237,8 +1314,9 @@ class TaskService:
         filter_worker: Optional[str],
         filter_task: Optional[str],
         filter_queue: Optional[str],
-        search: Optional[str]
-    ) -> Tuple[List[TaskEvent], int]:
+        search: Optional[str],
+        before: Optional[Tuple[datetime, Any]] = None
+    ) -> Tuple[List[TaskEvent], int, Optional[Dict[str, Any]]]:
         """
         Get all task events (non-aggregated) with filtering and pagination.
 
@@ -1246,7 +1324,7 @@ class TaskService:
             See get_recent_events for parameter descriptions
 
         Returns:
-            Tuple of (events list, total count)
+            Tuple of (events list, total count, next keyset cursor)
         """
         query = self.session.query(TaskEventDB)
         query = EnvironmentFilter.apply(query, self.active_env)
@@ -1257,15 +1335,14 @@ class TaskService:
         total_events = query.with_entities(func.count(TaskEventDB.id)).scalar()
 
         query = self._apply_sorting(query, sort_by, sort_order)
-        start_idx = page * limit
-        events_db = query.offset(start_idx).limit(limit).all()
+        events_db, has_more = self._fetch_page(query, limit, page, before)
 
         events = [self._db_to_task_event(event_db) for event_db in events_db]
         self._bulk_enrich_with_retry_info(events)
         self._bulk_enrich_with_rerun_info(events)
         self._attach_resolution_info(events)
 
-        return events, total_events
+        return events, total_events, self._next_cursor(events_db, has_more)
 
     def _get_aggregated_events(
         self,
@@ -1280,8 +1357,9 @@ class TaskService:
         filter_worker: Optional[str],
         filter_task: Optional[str],
         filter_queue: Optional[str],
-        search: Optional[str]
-    ) -> Tuple[List[TaskEvent], int]:
+        search: Optional[str],
+        before: Optional[Tuple[datetime, Any]] = None
+    ) -> Tuple[List[TaskEvent], int, Optional[Dict[str, Any]]]:
         """
         Get aggregated task events (latest per task) with filtering and pagination.
 
@@ -1289,11 +1367,12 @@ class TaskService:
             See get_recent_events for parameter descriptions
 
         Returns:
-            Tuple of (events list, total count)
+            Tuple of (events list, total count, next keyset cursor)
         """
         return self._get_aggregated_events_from_latest(
             limit, page, sort_by, sort_order, filters, start_time, end_time,
-            filter_state, filter_worker, filter_task, filter_queue, search
+            filter_state, filter_worker, filter_task, filter_queue, search,
+            before=before
         )
 
     def _get_aggregated_events_from_latest(
@@ -1309,8 +1388,9 @@ class TaskService:
         filter_worker: Optional[str],
         filter_task: Optional[str],
         filter_queue: Optional[str],
-        search: Optional[str]
-    ) -> Tuple[List[TaskEvent], int]:
+        search: Optional[str],
+        before: Optional[Tuple[datetime, Any]] = None
+    ) -> Tuple[List[TaskEvent], int, Optional[Dict[str, Any]]]:
         """
         Fetch aggregated events from the task_latest snapshot table.
         """
@@ -1324,14 +1404,57 @@ class TaskService:
         total_events = query.with_entities(func.count(TaskLatestDB.task_id)).scalar()
 
         query = self._apply_sorting(query, sort_by, sort_order, model=TaskLatestDB)
-        start_idx = page * limit
-        events_db = query.offset(start_idx).limit(limit).all()
+        events_db, has_more = self._fetch_page(query, limit, page, before, model=TaskLatestDB)
 
         events = [self._db_to_task_event(event_db) for event_db in events_db]
         self._bulk_enrich_with_retry_info(events)
         self._bulk_enrich_with_rerun_info(events)
         self._attach_resolution_info(events)
-        return events, total_events
+        return events, total_events, self._next_cursor(events_db, has_more)
+
+    @staticmethod
+    def _keyset_column(model):
+        """Tie-breaker column paired with timestamp in the default sort order."""
+        id_column = getattr(model, 'id', None)
+        return id_column if id_column is not None else model.task_id
+
+    def _fetch_page(
+        self,
+        query,
+        limit: int,
+        page: int,
+        before: Optional[Tuple[datetime, Any]],
+        model=TaskEventDB
+    ) -> Tuple[list, bool]:
+        """
+        Fetch one page of rows, seeking past ``before`` instead of using OFFSET when given.
+
+        One extra row is requested to tell whether another page follows; returns
+        the page and that flag.
+        """
+        if before is None:
+            query = query.offset(page * limit)
+        else:
+            before_timestamp, before_id = before
+            query = query.filter(
+                tuple_(model.timestamp, self._keyset_column(model))
+                < tuple_(_ensure_utc(before_timestamp), before_id)
+            )
+
+        if limit <= 0:
+            return query.limit(limit).all(), False
+        rows = query.limit(limit + 1).all()
+        return rows[:limit], len(rows) > limit
+
+    def _next_cursor(self, events_db: list, has_more: bool) -> Optional[Dict[str, Any]]:
+        """Build the keyset cursor pointing after the last row when another page follows."""
+        if not events_db or not has_more:
+            return None
+        last = events_db[-1]
+        return {
+            "timestamp": _ensure_utc(last.timestamp).isoformat(),
+            "id": getattr(last, self._keyset_column(type(last)).key),
+        }
 
 
     def _apply_all_filters(
@@ -1411,17 +1534,10 @@ class TaskService:
             )
 
         if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                or_(
-                    getattr(model, 'task_name').ilike(search_pattern),
-                    getattr(model, 'task_id').ilike(search_pattern),
-                    getattr(model, 'hostname').ilike(search_pattern),
-                    getattr(model, 'event_type').ilike(search_pattern),
-                    func.cast(getattr(model, 'args'), String).ilike(search_pattern),
-                    func.cast(getattr(model, 'kwargs'), String).ilike(search_pattern)
-                )
-            )
+            search_clause = _SEARCH_CLAUSES.get(model)
+            if search_clause is None:
+                search_clause = _build_search_clause(model)
+            query = query.filter(search_clause).params(search_pattern=f"%{search}%")
 
         return query
 
@@ -1446,16 +1562,8 @@ class TaskService:
 
     def _apply_state_filter(self, query, operator: str, values: List[str], model=TaskEventDB):
         """Apply state filter with operator support."""
-        def state_to_event_type(state: str) -> Optional[str]:
-            try:
-                task_state = TaskState(state.upper())
-                event_type = STATE_TO_EVENT_MAP.get(task_state)
-                return event_type.value if event_type else None
-            except (ValueError, KeyError):
-                return None
-
         return GenericFilter.apply(
-            query, getattr(model, 'event_type'), operator, values, state_to_event_type
+            query, getattr(model, 'event_type'), operator, values, _state_to_event_type
         )
 
     def _apply_sorting(self, query, sort_by: Optional[str], sort_order: str, model=TaskEventDB):
@@ -1463,10 +1571,13 @@ class TaskService:
         if sort_by:
             sort_column = getattr(model, sort_by, None)
             if sort_column is not None:
-                if sort_order == "desc":
-                    query = query.order_by(desc(sort_column))
-                else:
-                    query = query.order_by(asc(sort_column))
+                direction = desc if sort_order == "desc" else asc
+                query = query.order_by(direction(sort_column))
+                # Events recorded in the same clock tick share a timestamp;
+                # insertion order keeps them stable.
+                id_column = getattr(model, 'id', None)
+                if sort_by == 'timestamp' and id_column is not None:
+                    query = query.order_by(direction(id_column))
                 return query
 
         timestamp_column = getattr(model, 'timestamp')
@@ -65,7 +65,7 @@ class WorkerService:
         """
         events_db = (
             self.session.query(WorkerEventDB)
-            .order_by(desc(WorkerEventDB.timestamp))
+            .order_by(desc(WorkerEventDB.timestamp), desc(WorkerEventDB.id))
             .limit(limit)
             .all()
         )
@@ -19,6 +19,23 @@ from services.workflow_catalog import EVENT_TRIGGER_MAP, TRIGGER_METADATA
 
 logger = logging.getLogger(__name__)
 
+# Condition operators as (field_value, expected_value) predicates. Patterns for
+# MATCHES go through re.compile, whose internal cache keeps them compiled.
+_OPERATORS = {
+    ConditionOperator.EQUALS: lambda value, expected: value == expected,
+    ConditionOperator.NOT_EQUALS: lambda value, expected: value != expected,
+    ConditionOperator.IN: lambda value, expected: value in expected,
+    ConditionOperator.NOT_IN: lambda value, expected: value not in expected,
+    ConditionOperator.MATCHES: lambda value, expected: bool(re.compile(expected).search(str(value))),
+    ConditionOperator.GREATER_THAN: lambda value, expected: float(value) > float(expected),
+    ConditionOperator.LESS_THAN: lambda value, expected: float(value) < float(expected),
+    ConditionOperator.GREATER_EQUAL: lambda value, expected: float(value) >= float(expected),
+    ConditionOperator.LESS_EQUAL: lambda value, expected: float(value) <= float(expected),
+    ConditionOperator.CONTAINS: lambda value, expected: expected in str(value),
+    ConditionOperator.STARTS_WITH: lambda value, expected: str(value).startswith(expected),
+    ConditionOperator.ENDS_WITH: lambda value, expected: str(value).endswith(expected),
+}
+
 
 class WorkflowEngine:
     """Engine for processing events and triggering workflows."""
@@ -40,11 +57,9 @@ class WorkflowEngine:
             if not trigger_type:
                 return
 
-            context = event.model_dump()
-
             thread = threading.Thread(
                 target=self._run_async_workflow_evaluation,
-                args=(trigger_type, context, event),
+                args=(trigger_type, event),
                 daemon=True
             )
             thread.start()
@@ -55,19 +70,17 @@ class WorkflowEngine:
     def _run_async_workflow_evaluation(
         self,
         trigger_type: str,
-        context: Dict[str, Any],
         event: TaskEvent | WorkerEvent
     ):
         """Run async workflow evaluation in a new event loop."""
         try:
-            asyncio.run(self._evaluate_and_execute_workflows(trigger_type, context, event))
+            asyncio.run(self._evaluate_and_execute_workflows(trigger_type, event))
         except Exception as e:
             logger.error(f"Error running workflow evaluation: {e}", exc_info=True)
 
     async def _evaluate_and_execute_workflows(
         self,
         trigger_type: str,
-        context: Dict[str, Any],
         event: TaskEvent | WorkerEvent
     ):
         """Evaluate and execute matching workflows (async)."""
@@ -79,6 +92,9 @@ class WorkflowEngine:
             if not workflows:
                 return
 
+            # Dumped only once a workflow is listening, off the ingest thread.
+            context = event.model_dump()
+
             logger.debug(f"Found {len(workflows)} workflows for trigger {trigger_type}")
 
             for workflow in workflows:
@@ -170,48 +186,13 @@ class WorkflowEngine:
         operator = condition.operator
         expected_value = condition.value
 
-        try:
-            if operator == ConditionOperator.EQUALS:
-                return field_value == expected_value
-
-            elif operator == ConditionOperator.NOT_EQUALS:
-                return field_value != expected_value
-
-            elif operator == ConditionOperator.IN:
-                return field_value in expected_value
-
-            elif operator == ConditionOperator.NOT_IN:
-                return field_value not in expected_value
-
-            elif operator == ConditionOperator.MATCHES:
-                pattern = re.compile(expected_value)
-                return bool(pattern.search(str(field_value)))
-
-            elif operator == ConditionOperator.GREATER_THAN:
-                return float(field_value) > float(expected_value)
-
-            elif operator == ConditionOperator.LESS_THAN:
-                return float(field_value) < float(expected_value)
-
-            elif operator == ConditionOperator.GREATER_EQUAL:
-                return float(field_value) >= float(expected_value)
-
-            elif operator == ConditionOperator.LESS_EQUAL:
-                return float(field_value) <= float(expected_value)
-
-            elif operator == ConditionOperator.CONTAINS:
-                return expected_value in str(field_value)
-
-            elif operator == ConditionOperator.STARTS_WITH:
-                return str(field_value).startswith(expected_value)
-
-            elif operator == ConditionOperator.ENDS_WITH:
-                return str(field_value).endswith(expected_value)
-
-            else:
-                logger.warning(f"Unknown operator: {operator}")
-                return False
+        compare = _OPERATORS.get(operator)
+        if compare is None:
+            logger.warning(f"Unknown operator: {operator}")
+            return False
 
+        try:
+            return compare(field_value, expected_value)
         except Exception as e:
             logger.error(f"Error evaluating condition: {e}", exc_info=True)
             return False
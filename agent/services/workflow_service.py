@@ -548,7 +548,9 @@ class WorkflowService:
 
     def _db_to_execution(self, execution_db: WorkflowExecutionDB) -> WorkflowExecutionRecord:
         """Convert database execution to Pydantic model."""
-        return WorkflowExecutionRecord(
+        # Rows are written by this service, so the JSON columns are stored as
+        # validated; rebuilding them key by key on every history page is wasted.
+        return WorkflowExecutionRecord.model_construct(
             id=execution_db.id,
             workflow_id=execution_db.workflow_id,
             triggered_at=execution_db.triggered_at,
@@ -0,0 +1,12 @@
+import asyncio
+import json
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+
+def fastapi_json(annotation, content):
+    """Encode ``content`` the way FastAPI would for a ``response_model`` of ``annotation``."""
+    field = create_response_field(name="response", type_=annotation)
+    encoded = asyncio.run(serialize_response(field=field, response_content=content, is_coroutine=True))
+    return json.loads(json.dumps(encoded))
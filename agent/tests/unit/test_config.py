@@ -0,0 +1,30 @@
+import unittest
+
+from config import Config
+
+
+class TestConfigFromEnv(unittest.TestCase):
+
+    def setUp(self):
+        Config.from_env.cache_clear()
+        self.addCleanup(Config.from_env.cache_clear)
+
+    def test_from_env_is_shared(self):
+        self.assertIs(Config.from_env(), Config.from_env())
+
+    def test_generated_secrets_are_consistent_across_callers(self):
+        first = Config.from_env()
+        second = Config.from_env()
+
+        self.assertEqual(first.session_secret_key, second.session_secret_key)
+        self.assertEqual(first.token_secret_key, second.token_secret_key)
+
+    def test_cache_clear_rebuilds(self):
+        first = Config.from_env()
+        Config.from_env.cache_clear()
+
+        self.assertIsNot(Config.from_env(), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
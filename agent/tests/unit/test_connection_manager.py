@@ -0,0 +1,180 @@
+import asyncio
+import json
+import unittest
+from datetime import datetime, timezone
+
+from connection_manager import ConnectionManager
+from models import TaskEvent, WorkerEvent
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        self.sent.append(message)
+
+
+class TestLiveConnections(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ConnectionManager()
+        self.manager.start_background_broadcaster = lambda: None
+
+    def _connect(self, websocket):
+        asyncio.run(self.manager.connect(websocket))
+
+    def test_mode_changes_update_live_set(self):
+        ws = FakeWebSocket()
+        self._connect(ws)
+        self.assertIn(ws, self.manager.live_connections)
+
+        self.manager.set_client_mode(ws, "static")
+        self.assertNotIn(ws, self.manager.live_connections)
+
+        self.manager.set_client_mode(ws, "live")
+        self.assertIn(ws, self.manager.live_connections)
+
+        self.manager.disconnect(ws)
+        self.assertNotIn(ws, self.manager.live_connections)
+
+    def test_broadcast_skips_static_clients(self):
+        live, static = FakeWebSocket(), FakeWebSocket()
+        self._connect(live)
+        self._connect(static)
+        self.manager.set_client_mode(static, "static")
+
+        event = WorkerEvent(
+            hostname="worker1",
+            event_type="worker-heartbeat",
+            timestamp=datetime.now(timezone.utc),
+        )
+        asyncio.run(self.manager._broadcast_worker_event(event))
+
+        self.assertEqual(len(live.sent), 1)
+        self.assertEqual(static.sent, [])
+
+    def test_broadcast_skips_serialization_when_all_filtered(self):
+        ws = FakeWebSocket()
+        self._connect(ws)
+        self.manager.set_client_filters(ws, {"event_types": ["task-failed"]})
+
+        class Event:
+            event_type = "task-succeeded"
+            task_name = "tasks.example"
+
+            def model_dump_json(self, **kwargs):
+                raise AssertionError("should not serialize")
+
+        asyncio.run(self.manager._broadcast_task_event(Event()))
+
+        self.assertEqual(ws.sent, [])
+        self.assertIn(ws, self.manager.live_connections)
+
+    def test_broadcast_serializes_once_for_all_clients(self):
+        clients = [FakeWebSocket() for _ in range(3)]
+        for ws in clients:
+            self._connect(ws)
+
+        class Event:
+            event_type = "task-succeeded"
+            task_name = "tasks.example"
+            dumps = 0
+
+            def model_dump_json(self, **kwargs):
+                Event.dumps += 1
+                return '{"event_type": "task-succeeded"}'
+
+        asyncio.run(self.manager._broadcast_task_event(Event()))
+
+        self.assertEqual(Event.dumps, 1)
+        for ws in clients:
+            self.assertEqual(ws.sent, ['{"event_type": "task-succeeded"}'])
+
+    def test_broadcast_disconnects_only_failing_clients(self):
+        class BrokenWebSocket(FakeWebSocket):
+            async def send_text(self, message: str):
+                raise ConnectionError("gone")
+
+        healthy, broken = FakeWebSocket(), BrokenWebSocket()
+        self._connect(healthy)
+        self._connect(broken)
+
+        event = WorkerEvent(
+            hostname="worker1",
+            event_type="worker-heartbeat",
+            timestamp=datetime.now(timezone.utc),
+        )
+        asyncio.run(self.manager._broadcast_worker_event(event))
+
+        self.assertEqual(len(healthy.sent), 1)
+        self.assertIn(healthy, self.manager.active_connections)
+        self.assertNotIn(broken, self.manager.active_connections)
+        self.assertNotIn(broken, self.manager.live_connections)
+
+    def test_broadcast_applies_event_type_and_task_name_filters(self):
+        by_type, by_name, unfiltered = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        for ws in (by_type, by_name, unfiltered):
+            self._connect(ws)
+        self.manager.set_client_filters(by_type, {"event_types": ["task-failed"], "task_names": []})
+        self.manager.set_client_filters(by_name, {"task_names": ["tasks.other"]})
+
+        class Event:
+            event_type = "task-failed"
+            task_name = "tasks.example"
+
+            def model_dump_json(self, **kwargs):
+                return "{}"
+
+        asyncio.run(self.manager._broadcast_task_event(Event()))
+
+        self.assertEqual(by_type.sent, ["{}"])
+        self.assertEqual(by_name.sent, [])
+        self.assertEqual(unfiltered.sent, ["{}"])
+
+        self.manager.disconnect(by_type)
+        self.assertNotIn(by_type, self.manager._compiled_filters)
+
+    def test_task_broadcast_omits_none_fields(self):
+        ws = FakeWebSocket()
+        self._connect(ws)
+        event = TaskEvent(
+            task_id="task-1",
+            task_name="tasks.example",
+            event_type="task-succeeded",
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            runtime=1.5,
+        )
+
+        asyncio.run(self.manager._broadcast_task_event(event))
+
+        payload = json.loads(ws.sent[0])
+        self.assertEqual(payload["runtime"], 1.5)
+        self.assertEqual(payload["retried_by"], [])
+        self.assertNotIn("exception", payload)
+        self.assertNotIn("retry_of", payload)
+
+    def test_queue_broadcast_many_uses_single_queue_entry(self):
+        class Loop:
+            def __init__(self):
+                self.calls = []
+
+            def call_soon_threadsafe(self, callback, *args):
+                self.calls.append(args)
+
+        ws = FakeWebSocket()
+        self._connect(ws)
+        self.manager._loop = Loop()
+        self.manager.message_queue = asyncio.Queue()
+
+        self.manager.queue_broadcast_many(["a", "b", "c"])
+        self.manager.queue_broadcast_many([])
+
+        self.assertEqual(self.manager._loop.calls, [(("task_batch", ["a", "b", "c"]),)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,14 @@
 import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
 from datetime import datetime, timezone, timedelta, date
 
-from services.daily_stats_service import DailyStatsService
+from services.daily_stats_service import (
+    _MAX_FLUSH_ATTEMPTS,
+    DailyStatsBuffer,
+    DailyStatsDelta,
+    DailyStatsService,
+)
 from models import TaskEvent
 from tests.base import DatabaseTestCase
 
@@ -294,6 +301,21 @@ class TestDailyStatsService(DatabaseTestCase):
 
         self.assertEqual(len(stats), 5)
 
+    def test_get_daily_stats_serializes_datetimes_as_utc(self):
+        event = self.create_task_event(
+            task_name="tasks.example",
+            event_type="task-received",
+            timestamp=self.base_time
+        )
+        self.service.update_daily_stats(event)
+
+        stats = self.service.get_daily_stats("tasks.example")[0]
+
+        self.assertEqual(stats.first_execution, self.base_time)
+        payload = stats.model_dump_json()
+        self.assertIn('"date":"2024-06-15"', payload)
+        self.assertIn('"first_execution":"2024-06-15T12:00:00Z"', payload)
+
     def test_get_daily_stats_with_start_date_filter(self):
         for i in range(5):
             event = self.create_task_event(
@@ -488,5 +510,118 @@ class TestDailyStatsService(DatabaseTestCase):
         self.assertIsNotNone(stats)
 
 
+class TestDailyStatsBuffer(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.base_time = datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+        self.buffer = DailyStatsBuffer(self)
+        self.buffer.start = lambda: None
+
+    @contextmanager
+    def get_ingest_session(self):
+        yield self.session
+
+    def _event(self, event_type, seconds=0, **kwargs):
+        return self.create_task_event(
+            task_name="tasks.example",
+            event_type=event_type,
+            timestamp=self.base_time + timedelta(seconds=seconds),
+            **kwargs
+        )
+
+    def test_flush_writes_one_row_per_task_and_day(self):
+        self.buffer.add(self._event("task-received"))
+        self.buffer.add(self._event("task-received", 1))
+        self.buffer.add(self._event("task-succeeded", 2, runtime=2.0))
+        self.buffer.add(self._event("task-failed", 3, runtime=4.0))
+
+        self.assertEqual(self.buffer.flush(), 1)
+        self.assertEqual(self.buffer.flush(), 0)
+
+        stats = DailyStatsService(self.session).get_stats_for_date("tasks.example", date(2024, 6, 15))
+        self.assertEqual(stats.total_executions, 2)
+        self.assertEqual(stats.succeeded, 1)
+        self.assertEqual(stats.failed, 1)
+        self.assertEqual(stats.pending, 0)
+        self.assertEqual(stats.min_runtime, 2.0)
+        self.assertEqual(stats.max_runtime, 4.0)
+        self.assertEqual(stats.first_execution.replace(tzinfo=timezone.utc), self.base_time)
+
+    def test_flush_accumulates_onto_existing_row(self):
+        self.buffer.add(self._event("task-received"))
+        self.buffer.flush()
+        self.buffer.add(self._event("task-received", 1))
+        self.buffer.add(self._event("task-succeeded", 2))
+        self.buffer.flush()
+
+        stats = DailyStatsService(self.session).get_stats_for_date("tasks.example", date(2024, 6, 15))
+        self.assertEqual(stats.total_executions, 2)
+        self.assertEqual(stats.pending, 1)
+
+    def test_pending_clamp_composes_like_sequential_updates(self):
+        events = ["task-succeeded", "task-received", "task-failed", "task-revoked", "task-received"]
+
+        delta = DailyStatsDelta(task_name="tasks.example", date=date(2024, 6, 15))
+        for index, event_type in enumerate(events):
+            delta.add(self._event(event_type, index))
+
+        for start in range(3):
+            pending = start
+            for event_type in events:
+                if event_type == "task-received":
+                    pending += 1
+                elif pending > 0:
+                    pending -= 1
+            self.assertEqual(delta.apply_pending(start), pending)
+
+    def test_events_added_after_stop_are_written_immediately(self):
+        self.buffer.stop()
+        self.buffer.add(self._event("task-received"))
+
+        stats = DailyStatsService(self.session).get_stats_for_date("tasks.example", date(2024, 6, 15))
+        self.assertEqual(stats.total_executions, 1)
+        self.assertEqual(self.buffer._pending, {})
+
+    def test_avg_runtime_matches_sequential_updates(self):
+        self.buffer.add(self._event("task-received"))
+        self.buffer.add(self._event("task-succeeded", 1, runtime=2.0))
+        self.buffer.flush()
+
+        self.buffer.add(self._event("task-failed", 2, runtime=10.0))
+        self.buffer.add(self._event("task-succeeded", 3, runtime=4.0))
+        self.buffer.flush()
+
+        # Per event: (2 * 1 + 10) / 2 = 6, then (6 * 2 + 4) / 3.
+        stats = DailyStatsService(self.session).get_stats_for_date("tasks.example", date(2024, 6, 15))
+        self.assertAlmostEqual(stats.avg_runtime, 16 / 3)
+
+    def test_failing_row_is_isolated_and_eventually_dropped(self):
+        apply_deltas = DailyStatsService.apply_deltas
+
+        def failing_apply(service, deltas):
+            deltas = list(deltas)
+            if any(delta.task_name == "tasks.poison" for delta in deltas):
+                raise ValueError("cannot store row")
+            apply_deltas(service, deltas)
+
+        with patch.object(DailyStatsService, "apply_deltas", failing_apply):
+            self.buffer.add(self._event("task-received"))
+            self.buffer.add(self.create_task_event(
+                task_name="tasks.poison", event_type="task-received", timestamp=self.base_time
+            ))
+            self.assertEqual(self.buffer.flush(), 0)
+
+            self.buffer.add(self._event("task-received", 1))
+            self.assertEqual(self.buffer.flush(), 1)
+            for _ in range(_MAX_FLUSH_ATTEMPTS):
+                self.buffer.flush()
+
+        service = DailyStatsService(self.session)
+        self.assertEqual(service.get_stats_for_date("tasks.example", date(2024, 6, 15)).total_executions, 2)
+        self.assertIsNone(service.get_stats_for_date("tasks.poison", date(2024, 6, 15)))
+        self.assertEqual(self.buffer._pending, {})
+        self.assertEqual(self.buffer._flush_failures, {})
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from sqlalchemy import inspect
+
+from database import Base, DatabaseManager, TaskEventDB
+
+
+class TestDatabaseManagerSessions(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.db_manager = DatabaseManager(f"sqlite:///{self.db_path}")
+        Base.metadata.create_all(self.db_manager.engine)
+
+    def tearDown(self):
+        self.db_manager.engine.dispose()
+        os.unlink(self.db_path)
+
+    def _make_event(self) -> TaskEventDB:
+        return TaskEventDB(
+            task_id="task-1",
+            event_type="task-started",
+            timestamp=datetime.now(timezone.utc),
+        )
+
+    def test_ingest_session_keeps_attributes_after_commit(self):
+        with self.db_manager.get_ingest_session() as session:
+            event = self._make_event()
+            session.add(event)
+            session.commit()
+            self.assertEqual(inspect(event).expired_attributes, set())
+
+    def test_default_session_expires_on_commit(self):
+        with self.db_manager.get_session() as session:
+            event = self._make_event()
+            session.add(event)
+            session.commit()
+            self.assertIn("task_id", inspect(event).expired_attributes)
+
+
+if __name__ == '__main__':
+    unittest.main()
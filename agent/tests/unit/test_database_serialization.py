@@ -0,0 +1,67 @@
+import json
+import unittest
+from datetime import datetime, timezone
+
+from database import TaskEventDB, TaskEventRow
+from tests.base import DatabaseTestCase
+
+
+class TestTaskEventDBToDict(DatabaseTestCase):
+
+    def test_defaults_for_empty_columns(self):
+        """Null args/kwargs/exchange/retried_by are normalised for the API."""
+        event = self.create_task_event_db(task_id="task-1")
+
+        data = event.to_dict()
+
+        self.assertEqual(data["args"], [])
+        self.assertEqual(data["kwargs"], {})
+        self.assertEqual(data["exchange"], "")
+        self.assertEqual(data["retried_by"], [])
+        self.assertIsNone(data["orphaned_at"])
+
+    def test_naive_timestamps_serialised_as_utc(self):
+        """Naive datetimes come back as UTC ISO strings."""
+        event = TaskEventDB(
+            task_id="task-2",
+            event_type="task-started",
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            orphaned_at=datetime(2024, 1, 1, 12, 5, 0, tzinfo=timezone.utc),
+            retried_by=json.dumps(["task-3"]),
+            args=[1, 2],
+        )
+
+        data = event.to_dict()
+
+        self.assertEqual(data["timestamp"], "2024-01-01T12:00:00+00:00")
+        self.assertEqual(data["orphaned_at"], "2024-01-01T12:05:00+00:00")
+        self.assertEqual(data["retried_by"], ["task-3"])
+        self.assertEqual(data["args"], [1, 2])
+        self.assertEqual(len(data), 27)
+
+
+class TestTaskEventRowInsertValues(unittest.TestCase):
+
+    def test_insert_values_cover_every_field_but_id(self):
+        timestamp = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        row = TaskEventRow(
+            task_id="task-1",
+            task_name="tasks.example",
+            event_type="task-received",
+            timestamp=timestamp,
+            args=[1],
+            id=7,
+        )
+
+        values = row.insert_values()
+
+        self.assertNotIn("id", values)
+        self.assertEqual(values["task_id"], "task-1")
+        self.assertEqual(values["timestamp"], timestamp)
+        self.assertEqual(values["args"], [1])
+        self.assertEqual(values["routing_key"], None)
+        self.assertEqual(set(values), {column.name for column in TaskEventDB.__table__.columns} - {"id"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -256,6 +256,14 @@ class TestEnvironmentService(DatabaseTestCase):
             "exact-match-not", ["exact-match"]
         ))
 
+    def test_matches_patterns_anchors_every_alternative(self):
+        patterns = ["prod", "celery@*.eu", "q.[ab]"]
+        self.assertTrue(EnvironmentService.matches_patterns("celery@w1.eu", patterns))
+        self.assertTrue(EnvironmentService.matches_patterns("q.b", patterns))
+        self.assertFalse(EnvironmentService.matches_patterns("prod-queue", patterns))
+        self.assertFalse(EnvironmentService.matches_patterns("celery@w1.eu.old", patterns))
+        self.assertFalse(EnvironmentService.matches_patterns("qxa", patterns))
+
     def test_matches_patterns_empty_patterns_returns_true(self):
         self.assertTrue(EnvironmentService.matches_patterns("anything", []))
 
@@ -0,0 +1,162 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import event_handler
+
+from database import Base, DatabaseManager, TaskEventDB
+from event_handler import EventHandler
+from models import TaskEvent, WorkerEvent
+from services.task_service import TaskService
+
+
+class FakeConnectionManager:
+    def __init__(self):
+        self.single = []
+        self.batches = []
+
+    def queue_broadcast(self, task_event):
+        self.single.append(task_event)
+
+    def queue_broadcast_many(self, task_events):
+        self.batches.append(list(task_events))
+
+    def queue_worker_broadcast(self, worker_event):
+        pass
+
+
+class EventHandlerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.db_manager = DatabaseManager(f"sqlite:///{self.db_path}")
+        Base.metadata.create_all(self.db_manager.engine)
+        self.connection_manager = FakeConnectionManager()
+        self.handler = EventHandler(self.db_manager, self.connection_manager)
+        self.handler.daily_stats_buffer.start = lambda: None
+        self.base_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    def tearDown(self):
+        self.db_manager.engine.dispose()
+        os.unlink(self.db_path)
+
+    def _event(self, task_id, event_type="task-received", seconds=0, **kwargs):
+        return TaskEvent(
+            task_id=task_id,
+            task_name="tasks.example",
+            event_type=event_type,
+            timestamp=self.base_time + timedelta(seconds=seconds),
+            **kwargs
+        )
+
+    def _stored_task_ids(self):
+        with self.db_manager.get_session() as session:
+            return [row.task_id for row in session.query(TaskEventDB).order_by(TaskEventDB.id)]
+
+
+class TestHandleTaskEvents(EventHandlerTestCase):
+
+    def test_batch_is_saved_and_broadcast_together(self):
+        events = [
+            self._event("task-1", routing_key="priority", queue="priority"),
+            self._event("task-1", "task-started", 1, queue=None),
+            self._event("task-2", seconds=2),
+        ]
+
+        self.handler.handle_task_events(events)
+
+        self.assertEqual(self._stored_task_ids(), ["task-1", "task-1", "task-2"])
+        self.assertEqual(self.connection_manager.batches, [events])
+        self.assertEqual(events[1].queue, "priority")
+
+    def test_failed_batch_falls_back_to_single_events(self):
+        events = [self._event("task-1"), self._event("task-2", seconds=1)]
+        original = TaskService.save_task_events
+
+        def fail_on_batches(service, task_events):
+            if len(task_events) > 1:
+                raise RuntimeError("batch rejected")
+            return original(service, task_events)
+
+        with patch.object(TaskService, "save_task_events", fail_on_batches):
+            self.handler.handle_task_events(events)
+
+        self.assertEqual(self._stored_task_ids(), ["task-1", "task-2"])
+        self.assertEqual(self.connection_manager.batches, [events])
+
+    def test_nothing_is_broadcast_when_commit_fails(self):
+        events = [self._event("task-1"), self._event("task-2", seconds=1)]
+
+        def fail_commit(service, task_events):
+            raise RuntimeError("commit failed")
+
+        with patch.object(TaskService, "save_task_events", fail_commit):
+            self.handler.handle_task_events(events)
+            self.handler.handle_task_event(self._event("task-3", seconds=2))
+
+        self.assertEqual(self._stored_task_ids(), [])
+        self.assertEqual(self.connection_manager.single, [])
+        self.assertEqual(self.connection_manager.batches, [])
+
+    def test_publish_errors_are_logged_not_raised(self):
+        events = [self._event("task-1"), self._event("task-2", seconds=1)]
+
+        def fail_for_task_1(task_event):
+            if task_event.task_id == "task-1":
+                raise RuntimeError("stats rejected")
+
+        with patch.object(self.handler.daily_stats_buffer, "add", side_effect=fail_for_task_1), \
+                patch.object(self.connection_manager, "queue_broadcast", side_effect=RuntimeError("queue full")):
+            self.handler.handle_task_events(events)
+            self.handler.handle_task_event(self._event("task-3", seconds=2))
+
+        self.assertEqual(self._stored_task_ids(), ["task-1", "task-2", "task-3"])
+        self.assertEqual(self.connection_manager.batches, [events])
+
+
+class TestWorkerOffline(EventHandlerTestCase):
+
+    def _offline(self):
+        return WorkerEvent(
+            hostname="worker1",
+            event_type="worker-offline",
+            timestamp=self.base_time,
+        )
+
+    def test_orphan_scan_runs_after_grace_period_on_timer(self):
+        self.handler.handle_task_events([
+            self._event("task-1", "task-started", hostname="worker1"),
+        ])
+
+        timers = []
+
+        class FakeTimer:
+            def __init__(self, interval, function, args=()):
+                self.interval = interval
+                self.function = function
+                self.args = args
+                timers.append(self)
+
+            def start(self):
+                pass
+
+        with patch.object(event_handler.threading, "Timer", FakeTimer):
+            self.handler.handle_worker_event(self._offline())
+
+        self.assertEqual(len(timers), 1)
+        self.assertEqual(timers[0].interval, event_handler.ORPHAN_GRACE_PERIOD_SECONDS)
+        self.assertEqual(self.connection_manager.batches, [])
+
+        timers[0].function(*timers[0].args)
+
+        with self.db_manager.get_session() as session:
+            row = session.query(TaskEventDB).filter_by(task_id="task-1").one()
+            self.assertTrue(row.is_orphan)
+        self.assertEqual(self.connection_manager.batches[0][0].event_type, "task-orphaned")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import unittest
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from prometheus_client import REGISTRY
+
+from metrics import _shard, metrics_collector
+from models import TaskEvent, WorkerEvent
+
+
+class TestMetricsCollector(unittest.TestCase):
+
+    def setUp(self):
+        # The collector registers with the global Prometheus registry, so tests
+        # share the module instance and isolate themselves with unique labels.
+        self.collector = metrics_collector
+        tracking = patch.object(
+            self.collector, "_tracking", [OrderedDict() for _ in self.collector._tracking]
+        )
+        tracking.start()
+        self.addCleanup(tracking.stop)
+        self.task_name = f"tasks.metrics_{uuid.uuid4().hex[:8]}"
+        self.worker = f"worker-{uuid.uuid4().hex[:8]}"
+        self.base_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    def _record(self, task_id, event_type, seconds=0, **kwargs):
+        self.collector.record_task_event(TaskEvent(
+            task_id=task_id,
+            task_name=self.task_name,
+            event_type=event_type,
+            hostname=self.worker,
+            timestamp=self.base_time + timedelta(seconds=seconds),
+            **kwargs
+        ))
+
+    def _sample(self, name, **labels):
+        return REGISTRY.get_sample_value(name, labels)
+
+    def test_task_lifecycle_updates_gauges(self):
+        task_id = str(uuid.uuid4())
+        labels = {"task_name": self.task_name, "worker": self.worker}
+
+        self._record(task_id, "task-received")
+        self.assertEqual(self._sample("kanchi_worker_prefetch_count", **labels), 1)
+
+        self._record(task_id, "task-started", seconds=3)
+        self.assertEqual(self._sample("kanchi_task_queue_wait_seconds", **labels), 3)
+        self.assertEqual(self._sample("kanchi_worker_prefetch_count", **labels), 0)
+        self.assertEqual(self._sample("kanchi_worker_active_tasks", worker=self.worker), 1)
+
+        self._record(task_id, "task-succeeded", seconds=5)
+        self.assertEqual(self._sample("kanchi_worker_active_tasks", worker=self.worker), 0)
+        self.assertEqual(
+            self._sample("kanchi_task_execution_duration_seconds_sum", **labels), 2
+        )
+
+    def test_event_counts_are_buffered_until_flush(self):
+        labels = {"task_name": self.task_name, "event_type": "task-received", "worker": self.worker}
+        self.collector.flush()
+
+        for _ in range(3):
+            self._record(str(uuid.uuid4()), "task-received")
+        self.assertIsNone(self._sample("kanchi_task_events_total", **labels))
+
+        self.collector.flush()
+        self.assertEqual(self._sample("kanchi_task_events_total", **labels), 3)
+
+        self.collector.flush()
+        self.assertEqual(self._sample("kanchi_task_events_total", **labels), 3)
+
+    def test_duplicate_terminal_event_leaves_gauges_alone(self):
+        task_id = str(uuid.uuid4())
+        self._record(task_id, "task-succeeded")
+
+        self.assertIsNone(
+            self._sample("kanchi_worker_prefetch_count", task_name=self.task_name, worker=self.worker)
+        )
+        self.assertIsNone(self._sample("kanchi_worker_active_tasks", worker=self.worker))
+
+    def test_worker_offline_resets_prefetch_and_active(self):
+        for _ in range(3):
+            self._record(str(uuid.uuid4()), "task-received")
+        self.collector.record_worker_event(WorkerEvent(
+            hostname=self.worker,
+            event_type="worker-offline",
+            timestamp=self.base_time,
+        ))
+
+        self.assertEqual(
+            self._sample("kanchi_worker_prefetch_count", task_name=self.task_name, worker=self.worker),
+            0,
+        )
+        self.assertEqual(self._sample("kanchi_worker_status", worker=self.worker), 0)
+        self.assertEqual(self._sample("kanchi_worker_active_tasks", worker=self.worker), 0)
+
+    def _same_shard_task_ids(self, count):
+        ids = []
+        shard = None
+        while len(ids) < count:
+            task_id = str(uuid.uuid4())
+            if shard is None:
+                shard = _shard(task_id)
+            if _shard(task_id) == shard:
+                ids.append(task_id)
+        return shard, ids
+
+    def test_tracking_over_capacity_releases_prefetch(self):
+        shard, (lost, fresh) = self._same_shard_task_ids(2)
+        labels = {"task_name": self.task_name, "worker": self.worker}
+        with patch.object(self.collector, "_tracking_shard_capacity", 1):
+            self._record(lost, "task-received")
+            self._record(fresh, "task-received")
+
+        self.assertNotIn(lost, self.collector._tracking[shard])
+        self.assertIn(fresh, self.collector._tracking[shard])
+        self.assertEqual(self._sample("kanchi_worker_prefetch_count", **labels), 1)
+
+    def test_expired_tracking_releases_active(self):
+        shard, (lost, fresh) = self._same_shard_task_ids(2)
+
+        self._record(lost, "task-received")
+        self._record(lost, "task-started", seconds=1)
+        self.assertEqual(self._sample("kanchi_worker_active_tasks", worker=self.worker), 1)
+
+        self.collector._tracking[shard][lost].touched_at -= self.collector._tracking_ttl_seconds + 1
+        self._record(fresh, "task-received")
+
+        self.assertNotIn(lost, self.collector._tracking[shard])
+        self.assertEqual(self._sample("kanchi_worker_active_tasks", worker=self.worker), 0)
+
+    def test_finishing_an_evicted_task_does_not_release_it_again(self):
+        shard, (lost, running, fresh) = self._same_shard_task_ids(3)
+
+        for task_id in (lost, running):
+            self._record(task_id, "task-received")
+            self._record(task_id, "task-started", seconds=1)
+        self.assertEqual(self._sample("kanchi_worker_active_tasks", worker=self.worker), 2)
+
+        self.collector._tracking[shard][lost].touched_at -= self.collector._tracking_ttl_seconds + 1
+        self._record(fresh, "task-received")
+        self.assertEqual(self._sample("kanchi_worker_active_tasks", worker=self.worker), 1)
+
+        self._record(lost, "task-succeeded", seconds=5)
+        self.assertEqual(self._sample("kanchi_worker_active_tasks", worker=self.worker), 1)
+        self.assertEqual(
+            self._sample("kanchi_worker_prefetch_count", task_name=self.task_name, worker=self.worker),
+            1,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,23 @@
-"""Tests for CeleryEventMonitor reconnect / backoff behaviour."""
+"""Tests for CeleryEventMonitor reconnect / backoff behaviour and event handling."""
 
+import socket
+import threading
+import time
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
 
 import pytest
+from celery.events.state import State
+from kombu.mixins import ConsumerMixin
 
 from monitor import (
     CeleryEventMonitor,
     _RECONNECT_BASE_DELAY,
     _RECONNECT_MAX_DELAY,
     _RECONNECT_MULTIPLIER,
+    _DRAIN_TIMEOUT,
+    _TASK_BATCH_MAX_DELAY,
+    _TASK_BATCH_SIZE,
 )
 
 
@@ -226,3 +235,262 @@ class TestKeyboardInterrupt:
 
         assert call_count["n"] == 1
         mock_sleep.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Cached wall clock
+# ---------------------------------------------------------------------------
+
+class TestUtcNow:
+    def test_reuses_reading_within_resolution(self):
+        monitor = _make_monitor()
+
+        with patch("monitor.time.time", side_effect=[1000.0, 1000.0005, 1000.002]):
+            first = monitor._utc_now()
+            second = monitor._utc_now()
+            third = monitor._utc_now()
+
+        assert first is second
+        assert third > first
+        assert first.tzinfo is not None
+
+    def test_refreshes_when_clock_steps_backwards(self):
+        monitor = _make_monitor()
+
+        with patch("monitor.time.time", side_effect=[1000.0, 990.0]):
+            first = monitor._utc_now()
+            second = monitor._utc_now()
+
+        assert second < first
+
+
+# ---------------------------------------------------------------------------
+# Handler table
+# ---------------------------------------------------------------------------
+
+class TestHandlerTable:
+    def test_handlers_are_built_once_and_reused(self):
+        monitor = _make_monitor()
+        handlers = monitor._handlers
+
+        monitor._run_once()
+        monitor._run_once()
+
+        calls = monitor.app.events.Receiver.call_args_list
+        assert len(calls) == 2
+        assert all(call.kwargs["handlers"] is handlers for call in calls)
+
+    def test_worker_handlers_pass_their_event_type(self):
+        monitor = _make_monitor()
+        monitor.worker_callback = MagicMock()
+
+        monitor._handlers["worker-offline"]({"hostname": "celery@w1", "type": "worker-offline"})
+
+        assert monitor.workers["celery@w1"]["status"] == "offline"
+        monitor.worker_callback.assert_called_once()
+
+    def test_heartbeat_updates_worker_state_in_place(self):
+        monitor = _make_monitor()
+        monitor._handlers["worker-online"]({"hostname": "celery@w1", "sw_ver": "5.3.0"})
+        worker = monitor.workers["celery@w1"]
+
+        monitor._handlers["worker-heartbeat"]({"hostname": "celery@w1", "active": 2, "loadavg": [0.1, 0.2, 0.3]})
+
+        assert monitor.workers["celery@w1"] is worker
+        assert worker["status"] == "online"
+        assert worker["sw_ver"] == "5.3.0"
+        assert worker["active"] == 2
+        assert worker["processed"] == 0
+        assert worker["loadavg"] == [0.1, 0.2, 0.3]
+
+    def test_task_handler_resolves_name_from_state(self):
+        monitor = _make_monitor()
+        monitor.state = State()
+        monitor.task_callback = MagicMock()
+
+        def event(uuid, event_type, **fields):
+            return {"uuid": uuid, "type": event_type, "hostname": "celery@w1", "timestamp": 1704067200.0,
+                    "local_received": 1704067200.0, "clock": 1, **fields}
+
+        monitor._handlers["task-received"](event("task-1", "task-received", name="tasks.example"))
+        monitor._handlers["task-started"](event("task-1", "task-started"))
+        monitor._handlers["task-succeeded"](event("task-2", "task-succeeded"))
+
+        received, started, unnamed = (call.args[0] for call in monitor.task_callback.call_args_list)
+        assert (started.task_id, started.task_name, started.event_type) == ("task-1", "tasks.example", "task-started")
+        assert received.task_name == "tasks.example"
+        assert (unnamed.task_id, unnamed.task_name) == ("task-2", "unknown")
+
+
+# ---------------------------------------------------------------------------
+# Task event batching
+# ---------------------------------------------------------------------------
+
+class TestTaskEventBatching:
+    def _batching_monitor(self):
+        monitor = _make_monitor()
+        monitor.task_callback = MagicMock()
+        monitor.set_batch_task_callback(MagicMock())
+        return monitor
+
+    def test_flushes_when_batch_is_full(self):
+        monitor = self._batching_monitor()
+
+        for i in range(_TASK_BATCH_SIZE + 1):
+            monitor._handle_task_event({"uuid": f"task-{i}", "type": "task-received"})
+
+        monitor.batch_task_callback.assert_called_once()
+        batch = monitor.batch_task_callback.call_args.args[0]
+        assert [event.task_id for event in batch] == [f"task-{i}" for i in range(_TASK_BATCH_SIZE)]
+        assert len(monitor._pending_task_events) == 1
+        monitor.task_callback.assert_not_called()
+
+    def test_stale_partial_batch_is_flushed(self):
+        monitor = self._batching_monitor()
+
+        with patch("monitor.time.monotonic", side_effect=[100.0, 100.01, 101.0]):
+            monitor._handle_task_event({"uuid": "task-1", "type": "task-started"})
+            monitor._flush_stale_task_events()
+            monitor.batch_task_callback.assert_not_called()
+            monitor._flush_stale_task_events()
+
+        monitor.batch_task_callback.assert_called_once()
+        assert monitor._pending_task_events == []
+
+    def test_worker_offline_flushes_pending_task_events_first(self):
+        monitor = self._batching_monitor()
+        calls = []
+        monitor.batch_task_callback.side_effect = lambda batch: calls.append("tasks")
+        monitor.worker_callback = MagicMock(side_effect=lambda event: calls.append("worker"))
+
+        monitor._handle_task_event({"uuid": "task-1", "type": "task-started"})
+        monitor._handlers["worker-offline"]({"hostname": "celery@w1"})
+
+        assert calls == ["tasks", "worker"]
+
+    def test_connection_close_flushes_pending_events(self):
+        monitor = self._batching_monitor()
+
+        def consume(**kwargs):
+            monitor._handle_task_event({"uuid": "task-1", "type": "task-started"})
+            return iter(())
+
+        monitor.app.events.Receiver.return_value.consume.side_effect = consume
+        monitor._run_once()
+
+        monitor.batch_task_callback.assert_called_once()
+        receiver = monitor.app.events.Receiver.return_value
+        assert receiver.on_iteration == monitor._flush_stale_task_events
+
+    def test_idle_broker_is_polled_within_the_batch_deadline(self):
+        monitor = self._batching_monitor()
+        receiver = monitor.app.events.Receiver.return_value
+        receiver.consume.return_value = iter(())
+
+        monitor._run_once()
+        assert receiver.consume.call_args.kwargs["safety_interval"] == _TASK_BATCH_MAX_DELAY
+
+        monitor.batch_task_callback = None
+        monitor._run_once()
+        assert receiver.consume.call_args.kwargs["safety_interval"] == _DRAIN_TIMEOUT
+
+    def test_partial_batch_is_flushed_while_broker_is_idle(self):
+        monitor = self._batching_monitor()
+        clock = [0.0]
+        flushed_at = []
+        monitor.batch_task_callback.side_effect = lambda batch: flushed_at.append(clock[0])
+
+        class IdleConnection:
+            """One task event arrives, then the broker goes quiet."""
+            drains = 0
+
+            def drain_events(self, timeout):
+                self.drains += 1
+                if self.drains == 1:
+                    monitor._handle_task_event({"uuid": "task-1", "type": "task-started"})
+                clock[0] += timeout
+                if flushed_at or self.drains > 100:
+                    receiver.should_stop = True
+                raise socket.timeout()
+
+            def heartbeat_check(self):
+                pass
+
+        class IdleReceiver(ConsumerMixin):
+            @contextmanager
+            def consumer_context(self, **kwargs):
+                yield IdleConnection(), None, []
+
+        receiver = IdleReceiver()
+        monitor.app.events.Receiver.return_value = receiver
+
+        with patch("monitor.time.monotonic", side_effect=lambda: clock[0]):
+            monitor._run_once()
+
+        assert flushed_at and flushed_at[0] <= 2 * _TASK_BATCH_MAX_DELAY
+
+    def test_stop_flushes_pending_events_from_another_thread(self):
+        monitor = self._batching_monitor()
+        consuming = threading.Event()
+
+        class QuietConnection:
+            def drain_events(self, timeout):
+                consuming.set()
+                time.sleep(0.01)
+                raise socket.timeout()
+
+            def heartbeat_check(self):
+                pass
+
+        class QuietReceiver(ConsumerMixin):
+            @contextmanager
+            def consumer_context(self, **kwargs):
+                yield QuietConnection(), None, []
+
+        monitor.app.events.Receiver.return_value = QuietReceiver()
+        # Keep the event younger than the batch deadline so only stop() flushes it.
+        monitor._flush_stale_task_events = lambda: None
+        thread = threading.Thread(target=monitor._run_once, daemon=True)
+        thread.start()
+        assert consuming.wait(1)
+
+        monitor._handle_task_event({"uuid": "task-1", "type": "task-started"})
+        monitor.stop(timeout=1)
+
+        assert not thread.is_alive()
+        batch = monitor.batch_task_callback.call_args.args[0]
+        assert [event.task_id for event in batch] == ["task-1"]
+        assert monitor._pending_task_events == []
+
+
+# ---------------------------------------------------------------------------
+# Worker snapshots
+# ---------------------------------------------------------------------------
+
+class TestWorkersSnapshot:
+    def test_snapshot_is_reused_until_workers_change(self):
+        monitor = _make_monitor()
+        monitor._handlers["worker-online"]({"hostname": "celery@w1"})
+
+        first = monitor.get_workers_info()
+        assert monitor.get_workers_info() is first
+        assert first["celery@w1"] is not monitor.workers["celery@w1"]
+
+        monitor._handlers["worker-heartbeat"]({"hostname": "celery@w1", "active": 4})
+        second = monitor.get_workers_info()
+
+        assert second is not first
+        assert second["celery@w1"]["active"] == 4
+        assert "active" not in first["celery@w1"]
+
+    def test_mark_worker_offline_updates_state_and_snapshot(self):
+        monitor = _make_monitor()
+        monitor._handlers["worker-online"]({"hostname": "celery@w1"})
+        before = monitor.get_workers_info()
+
+        monitor.mark_worker_offline("celery@w1")
+        monitor.mark_worker_offline("celery@unknown")
+
+        assert before["celery@w1"]["status"] == "online"
+        assert monitor.get_workers_info()["celery@w1"]["status"] == "offline"
+        assert "celery@unknown" not in monitor.workers
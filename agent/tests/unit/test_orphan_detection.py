@@ -12,6 +12,9 @@ class TestOrphanDetectionService(DatabaseTestCase):
         self.service = OrphanDetectionService(self.session)
         self.base_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
 
+    def test_uses_update_returning_on_sqlite(self):
+        self.assertTrue(OrphanDetectionService(self.session)._supports_update_returning())
+
     def test_find_orphaned_tasks_basic(self):
         self.create_task_event_db(
             task_id="orphan-1",
@@ -275,5 +278,16 @@ class TestOrphanDetectionService(DatabaseTestCase):
         self.assertEqual(orphaned_tasks[0].task_id, "task-2")
 
 
+class TestOrphanDetectionWithoutReturning(TestOrphanDetectionService):
+    """Runs the same cases through the select-then-update path used on MySQL."""
+
+    def setUp(self):
+        super().setUp()
+        self.service._supports_update_returning = lambda: False
+
+    def test_returning_path_disabled(self):
+        self.assertFalse(self.service._supports_update_returning())
+
+
 if __name__ == '__main__':
     unittest.main()
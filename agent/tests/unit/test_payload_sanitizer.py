@@ -55,3 +55,10 @@ def test_find_placeholder_paths_reports_precise_locations():
     assert "$.root_list[1]" in paths
     assert "$.root_list[2].inner[0]" in paths
     assert len(paths) == 2
+
+
+def test_sanitize_payload_returns_scalars_unchanged():
+    for value in (None, "text", 3, 2.5, True):
+        sanitized, truncated = sanitize_payload(value)
+        assert sanitized is value
+        assert truncated is False
@@ -59,6 +59,72 @@ class TestRecentEventsCount(DatabaseTestCase):
         self.assertEqual(result["pagination"]["total"], 7)
         self.assertEqual(result["pagination"]["total_pages"], 3)  # ceil(7/3) = 3
 
+    def test_keyset_cursor_walks_aggregated_pages(self):
+        """Following next_cursor returns each task exactly once, newest first."""
+        for i in range(7):
+            self._add_latest(f"task-{i}", offset_seconds=i)
+
+        seen = []
+        before = None
+        while True:
+            result = self.service.get_recent_events(limit=3, before=before)
+            seen.extend(event.task_id for event in result["data"])
+            cursor = result["pagination"]["next_cursor"]
+            if cursor is None:
+                break
+            before = (datetime.fromisoformat(cursor["timestamp"]), cursor["id"])
+
+        self.assertEqual(seen, [f"task-{i}" for i in range(6, -1, -1)])
+
+    def test_keyset_cursor_on_raw_events(self):
+        """Non-aggregated paging seeks on (timestamp, id)."""
+        for i in range(4):
+            self.create_task_event_db(
+                task_id=f"task-{i}",
+                timestamp=self.base_time + timedelta(seconds=i),
+            )
+
+        first = self.service.get_recent_events(limit=2, aggregate=False)
+        cursor = first["pagination"]["next_cursor"]
+        second = self.service.get_recent_events(
+            limit=2,
+            aggregate=False,
+            before=(datetime.fromisoformat(cursor["timestamp"]), cursor["id"]),
+        )
+
+        self.assertEqual([e.task_id for e in first["data"]], ["task-3", "task-2"])
+        self.assertEqual([e.task_id for e in second["data"]], ["task-1", "task-0"])
+
+    def test_keyset_pages_report_navigation_from_the_cursor(self):
+        """has_next/has_prev follow the cursor, and the last full page has no next cursor."""
+        for i in range(4):
+            self._add_latest(f"task-{i}", offset_seconds=i)
+
+        first = self.service.get_recent_events(limit=2)
+        cursor = first["pagination"]["next_cursor"]
+        last = self.service.get_recent_events(
+            limit=2, before=(datetime.fromisoformat(cursor["timestamp"]), cursor["id"])
+        )
+
+        self.assertTrue(first["pagination"]["has_next"])
+        self.assertEqual([e.task_id for e in last["data"]], ["task-1", "task-0"])
+        self.assertIsNone(last["pagination"]["next_cursor"])
+        self.assertFalse(last["pagination"]["has_next"])
+        self.assertTrue(last["pagination"]["has_prev"])
+
+    def test_search_matches_and_counts(self):
+        """Free-text search filters rows and the total count alike."""
+        for i in range(3):
+            self._add_latest(f"alpha-{i}", offset_seconds=i)
+        self._add_latest("beta-0", offset_seconds=5)
+
+        result = self.service.get_recent_events(limit=100, search="ALPHA")
+        raw = self.service.get_recent_events(limit=100, search="missing", aggregate=False)
+
+        self.assertEqual(result["pagination"]["total"], 3)
+        self.assertEqual(len(result["data"]), 3)
+        self.assertEqual(raw["pagination"]["total"], 0)
+
 
 if __name__ == "__main__":
     unittest.main()
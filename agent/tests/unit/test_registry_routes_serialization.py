@@ -0,0 +1,52 @@
+import json
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from typing import List
+
+from api.responses import json_response
+from api.registry_routes import _DAILY_STATS_LIST_ADAPTER, _TIMELINE_ADAPTER
+from models import TaskDailyStatsResponse, TaskTimelineResponse, TimelineBucket
+from tests.helpers import fastapi_json
+
+
+class TestRegistryRouteSerialization(unittest.TestCase):
+
+    def test_timeline_matches_fastapi_encoding(self):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        timeline = TaskTimelineResponse(
+            task_name="tasks.example",
+            start_time=start,
+            end_time=start + timedelta(hours=2),
+            bucket_size_minutes=60,
+            buckets=[
+                TimelineBucket(timestamp=start, total_executions=3, succeeded=2, failed=1),
+                TimelineBucket(timestamp=start + timedelta(hours=1)),
+            ],
+        )
+
+        response = json_response(_TIMELINE_ADAPTER, timeline)
+
+        self.assertEqual(response.media_type, "application/json")
+        self.assertEqual(json.loads(response.body), fastapi_json(TaskTimelineResponse, timeline))
+
+    def test_daily_stats_match_fastapi_encoding(self):
+        stats = [
+            TaskDailyStatsResponse(
+                task_name="tasks.example",
+                date=date(2024, 1, 1),
+                total_executions=5,
+                succeeded=4,
+                failed=1,
+                avg_runtime=1.25,
+                first_execution=datetime(2024, 1, 1, 0, 5),
+                last_execution=datetime(2024, 1, 1, 23, 55, tzinfo=timezone.utc),
+            )
+        ]
+
+        response = json_response(_DAILY_STATS_LIST_ADAPTER, stats)
+
+        self.assertEqual(json.loads(response.body), fastapi_json(List[TaskDailyStatsResponse], stats))
+
+
+if __name__ == '__main__':
+    unittest.main()
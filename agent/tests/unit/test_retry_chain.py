@@ -1,6 +1,8 @@
 import unittest
 from datetime import datetime, timezone, timedelta
 
+from sqlalchemy import event
+
 from services.task_service import TaskService
 from tests.base import DatabaseTestCase
 
@@ -250,7 +252,7 @@ class TestRetryChainTracking(DatabaseTestCase):
 
         self.assertIsNotNone(retry_event.retry_of)
         self.assertIsNone(retry_event.retry_of.retry_of)
-        self.assertEqual(retry_event.retry_of.retried_by, [])
+        self.assertEqual(retry_event.retry_of.retried_by, ())
 
     def test_empty_retry_chain(self):
         task_db = self.create_task_event_db(
@@ -269,7 +271,7 @@ class TestRetryChainTracking(DatabaseTestCase):
         task_event = self.service._db_to_task_event(task_db)
         self.service._enrich_task_with_retry_info(task_event)
 
-        self.assertEqual(task_event.retried_by, [])
+        self.assertEqual(task_event.retried_by, ())
         self.assertIsNone(task_event.retry_of)
 
     def test_retry_preserves_task_details(self):
@@ -318,6 +320,59 @@ class TestRetryChainTracking(DatabaseTestCase):
         else:
             self.assertEqual(parent.kwargs, {"key": "value"})
 
+    def test_unknown_related_tasks_do_not_trigger_extra_queries(self):
+        self.create_task_event_db(
+            task_id="retry-1",
+            event_type="task-started",
+            timestamp=self.base_time
+        )
+        self.create_retry_relationship(
+            task_id="retry-1",
+            original_id="missing-parent",
+            retry_chain=["missing-child-1", "missing-child-2"],
+            total_retries=2
+        )
+        retry_event = self.service._db_to_task_event(self.get_task_events_by_id("retry-1")[0])
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(self.engine, "before_cursor_execute", listener)
+        try:
+            self.service._enrich_task_with_retry_info(retry_event)
+        finally:
+            event.remove(self.engine, "before_cursor_execute", listener)
+
+        self.assertEqual(len(statements), 2)
+        self.assertTrue(retry_event.is_retry)
+        self.assertIsNone(retry_event.retry_of)
+        self.assertEqual(retry_event.retried_by, ())
+        self.assertEqual(retry_event.retry_count, 2)
+
+    def test_task_events_share_retry_info_of_first_event(self):
+        self.create_task_event_db(task_id="original-1", event_type="task-failed", timestamp=self.base_time)
+        for offset, event_type in enumerate(("task-received", "task-started", "task-succeeded"), start=1):
+            self.create_task_event_db(
+                task_id="retry-1",
+                event_type=event_type,
+                timestamp=self.base_time + timedelta(seconds=offset)
+            )
+        self.create_retry_relationship(
+            task_id="retry-1",
+            original_id="original-1",
+            retry_chain=[],
+            total_retries=1
+        )
+
+        events = self.service.get_task_events("retry-1")
+
+        self.assertEqual(len(events), 3)
+        for retry_event in events:
+            self.assertTrue(retry_event.is_retry)
+            self.assertEqual(retry_event.retry_of.task_id, "original-1")
+            self.assertEqual(retry_event.retried_by, ())
+            self.assertFalse(retry_event.has_retries)
+            self.assertEqual(retry_event.retry_count, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
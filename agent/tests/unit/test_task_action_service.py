@@ -16,6 +16,7 @@ from models import (
     TaskActionItemOutcome,
     TaskActionStatus,
     TaskActionType,
+    TaskActionWebSocketEvent,
 )
 from services.task_action_service import TaskActionService, TaskActionValidationError
 from services.task_service import TaskService
@@ -86,6 +87,28 @@ class TestTaskActionService(DatabaseTestCase):
         self.assertEqual(relationship.rerun_task_id, action.items[0].rerun_task_id)
         self.assertEqual(relationship.action_id, action.id)
 
+    def test_broadcast_event_matches_validated_payload(self):
+        self.create_task_event_db(
+            task_id="task-1",
+            task_name="tasks.example",
+            event_type="task-failed",
+            timestamp=self.base_time,
+            args="[1, 2]",
+            kwargs='{"dry_run": true}',
+        )
+        connection_manager = Mock()
+        self.service.connection_manager = connection_manager
+
+        action = self.service.create_action(
+            action_type=TaskActionType.RERUN,
+            task_ids=["task-1"],
+            initiated_by="tester",
+        )
+
+        event = connection_manager.queue_task_action_broadcast.call_args_list[-1].args[0]
+        expected = TaskActionWebSocketEvent(**action.model_dump())
+        self.assertEqual(event.model_dump_json(), expected.model_dump_json())
+
     def test_preflight_marks_truncated_payload_repairable(self):
         self.create_task_event_db(
             task_id="task-1",
@@ -0,0 +1,183 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from models import TaskEvent, TaskProgressEvent, WorkerEvent
+
+
+class TestTaskEventFromCeleryEvent(unittest.TestCase):
+
+    def test_maps_celery_fields(self):
+        event = TaskEvent.from_celery_event({
+            'uuid': 'task-1',
+            'name': 'tasks.example',
+            'type': 'task-received',
+            'args': '(1, 2)',
+            'kwargs': "{'dry_run': True}",
+            'retries': 2,
+            'hostname': 'celery@worker1',
+            'routing_key': 'priority',
+            'parent_id': 'parent-1',
+        })
+
+        self.assertEqual(event.task_id, 'task-1')
+        self.assertEqual(event.task_name, 'tasks.example')
+        self.assertEqual(event.event_type, 'task-received')
+        self.assertEqual(event.args, [1, 2])
+        self.assertEqual(event.kwargs, {'dry_run': True})
+        self.assertEqual(event.retries, 2)
+        self.assertEqual(event.hostname, 'celery@worker1')
+        self.assertEqual(event.routing_key, 'priority')
+        self.assertEqual(event.root_id, 'task-1')
+        self.assertEqual(event.parent_id, 'parent-1')
+        self.assertIsNotNone(event.timestamp.tzinfo)
+
+    def test_defaults_for_sparse_events(self):
+        event = TaskEvent.from_celery_event(
+            {'uuid': 'task-1', 'type': 'task-started', 'root_id': 'root-1', 'exchange': None},
+            task_name='tasks.cached',
+        )
+
+        self.assertEqual(event.task_name, 'tasks.cached')
+        self.assertEqual(event.root_id, 'root-1')
+        self.assertEqual(event.exchange, '')
+        self.assertEqual(event.routing_key, 'default')
+        self.assertEqual(event.args, [])
+        self.assertEqual(event.kwargs, {})
+
+    def test_low_cardinality_fields_are_interned(self):
+        def fresh(text):
+            return ''.join(list(text))
+
+        events = [
+            TaskEvent.from_celery_event({
+                'uuid': f'task-{i}',
+                'name': fresh('tasks.example'),
+                'type': fresh('task-received'),
+                'hostname': fresh('celery@worker1'),
+                'routing_key': fresh('priority'),
+            })
+            for i in range(2)
+        ]
+
+        self.assertIs(events[0].event_type, events[1].event_type)
+        self.assertIs(events[0].task_name, events[1].task_name)
+        self.assertIs(events[0].hostname, events[1].hostname)
+        self.assertIs(events[0].routing_key, events[1].routing_key)
+
+    def test_parses_json_compatible_and_python_reprs(self):
+        for raw_args, raw_kwargs, args, kwargs in [
+            ('[1, 2.5]', '{"limit": 10}', [1, 2.5], {'limit': 10}),
+            ("('a', None)", "{'tags': {1, 2}}", ['a', None], {'tags': [1, 2]}),
+            ('[True]', '{}', [True], {}),
+        ]:
+            event = TaskEvent.from_celery_event({'uuid': 'task-1', 'args': raw_args, 'kwargs': raw_kwargs})
+            self.assertEqual(event.args, args)
+            self.assertEqual(event.kwargs, kwargs)
+
+    def test_json_compatible_reprs_skip_literal_eval(self):
+        with patch('models.ast.literal_eval') as literal_eval:
+            event = TaskEvent.from_celery_event({'uuid': 'task-1', 'args': '[1, "a", [2.5]]', 'kwargs': '{"n": null}'})
+
+        literal_eval.assert_not_called()
+        self.assertEqual(event.args, [1, 'a', [2.5]])
+        self.assertEqual(event.kwargs, {'n': None})
+
+    def test_payload_fields_are_sanitized(self):
+        event = TaskEvent.from_celery_event({
+            'uuid': 'task-1',
+            'type': 'task-succeeded',
+            'args': "('a', ...)",
+            'result': {'ids': (1, 2)},
+        })
+
+        self.assertEqual(event.args[0], 'a')
+        self.assertIsInstance(event.args[1], dict)
+        self.assertEqual(event.result, {'ids': [1, 2]})
+        self.assertEqual(event.retried_by, ())
+
+    def test_repeated_reprs_do_not_share_parsed_payloads(self):
+        raw = {'uuid': 'task-1', 'args': "([1], 'x')", 'kwargs': "{'opts': {'a': 1}}"}
+        first = TaskEvent.from_celery_event(raw)
+        first.args[0].append(2)
+        first.kwargs['opts']['b'] = 2
+
+        second = TaskEvent.from_celery_event(raw)
+
+        self.assertEqual(second.args, [[1], 'x'])
+        self.assertEqual(second.kwargs, {'opts': {'a': 1}})
+
+    def test_uses_supplied_clock_reading(self):
+        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+        event = TaskEvent.from_celery_event({'uuid': 'task-1', 'type': 'task-started'}, now=now)
+
+        self.assertIs(event.timestamp, now)
+
+    def test_empty_payloads_skip_sanitizer(self):
+        with patch('models.sanitize_payload') as sanitize_payload:
+            for empty in (None, '', [], (), {}):
+                self.assertEqual(TaskEvent.validate_args(empty), [])
+                self.assertEqual(TaskEvent.validate_kwargs(empty), {})
+
+        sanitize_payload.assert_not_called()
+
+    def test_tuple_args_become_lists(self):
+        event = TaskEvent(task_id='task-1', task_name='tasks.example', event_type='task-received',
+                          timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc), args=(1, (2, 3)))
+
+        self.assertEqual(event.args, [1, [2, 3]])
+        self.assertEqual(event.model_dump_json(include={'args'}), '{"args":[1,[2,3]]}')
+
+
+class TestWorkerEventFromCeleryEvent(unittest.TestCase):
+
+    def test_uses_event_timestamp(self):
+        event = WorkerEvent.from_celery_event({
+            'hostname': 'celery@worker1',
+            'type': 'worker-heartbeat',
+            'timestamp': 1704110400.0,
+            'active': 2,
+            'loadavg': [0.5, 0.25, 0.1],
+        })
+
+        self.assertEqual(event.timestamp, datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc))
+        self.assertEqual(event.active, 2)
+        self.assertEqual(event.loadavg, (0.5, 0.25, 0.1))
+        self.assertIn('"loadavg":[0.5,0.25,0.1]', event.model_dump_json())
+
+    def test_defaults_timestamp_to_now(self):
+        before = datetime.now(timezone.utc)
+        event = WorkerEvent.from_celery_event({'hostname': 'celery@worker1', 'type': 'worker-online'})
+
+        self.assertGreaterEqual(event.timestamp, before)
+
+    def test_falls_back_to_supplied_clock_reading(self):
+        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+        event = WorkerEvent.from_celery_event({'hostname': 'celery@worker1', 'type': 'worker-online'}, now=now)
+
+        self.assertEqual(event.timestamp, now)
+
+    def test_naive_timestamp_is_serialized_as_utc(self):
+        event = WorkerEvent(hostname='celery@worker1', event_type='worker-online', timestamp=datetime(2024, 1, 1))
+
+        self.assertIn('"timestamp":"2024-01-01T00:00:00Z"', event.model_dump_json())
+
+
+class TestTaskProgressEventFromCeleryEvent(unittest.TestCase):
+
+    def test_falls_back_to_supplied_clock_reading(self):
+        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+        missing = TaskProgressEvent.from_celery_event({'task_id': 'task-1', 'progress': 50}, now=now)
+        invalid = TaskProgressEvent.from_celery_event({'task_id': 'task-1', 'timestamp': 'soon'}, now=now)
+        stamped = TaskProgressEvent.from_celery_event({'task_id': 'task-1', 'timestamp': 1704067200.0}, now=now)
+
+        self.assertIs(missing.timestamp, now)
+        self.assertIs(invalid.timestamp, now)
+        self.assertEqual(stamped.timestamp, datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+
+if __name__ == '__main__':
+    unittest.main()
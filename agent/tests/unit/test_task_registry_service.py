@@ -1,5 +1,6 @@
 import unittest
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 from database import RetryRelationshipDB, TaskRerunRelationshipDB
 from services.task_registry_service import TaskRegistryService
@@ -25,6 +26,28 @@ class TestTaskRegistryServiceStats(DatabaseTestCase):
 
         self.assertEqual(stats.failed, 1)
 
+    def test_timeline_buckets_cover_window_with_counts(self):
+        for minutes_ago, event_type in ((30, "task-received"), (31, "task-succeeded"), (90, "task-failed")):
+            self.create_task_event_db(
+                task_id=f"task-{minutes_ago}",
+                task_name="tasks.example",
+                event_type=event_type,
+                timestamp=self.now - timedelta(minutes=minutes_ago),
+            )
+
+        timeline = self.service.get_task_timeline("tasks.example", hours=3, bucket_size_minutes=60)
+
+        self.assertEqual(len(timeline.buckets), 3)
+        self.assertEqual(
+            [bucket.timestamp for bucket in timeline.buckets],
+            [timeline.start_time + timedelta(hours=i) for i in range(3)],
+        )
+        self.assertEqual(sum(bucket.total_executions for bucket in timeline.buckets), 1)
+        self.assertEqual(sum(bucket.succeeded for bucket in timeline.buckets), 1)
+        self.assertEqual(sum(bucket.failed for bucket in timeline.buckets), 1)
+        self.assertEqual(timeline.buckets[2].total_executions, 1)
+        self.assertIn('"retried":0', timeline.model_dump_json())
+
     def test_failed_stat_excludes_celery_retried_failures(self):
         self.create_task_event_db(
             task_id="failed-retried",
@@ -87,5 +110,52 @@ class TestTaskRegistryServiceStats(DatabaseTestCase):
         self.assertEqual(stats.failed, 1)
 
 
+class TestEnsureTaskRegistered(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._reset_class_cache()
+        self.service = TaskRegistryService(self.session)
+
+    def tearDown(self):
+        self._reset_class_cache()
+        super().tearDown()
+
+    @staticmethod
+    def _reset_class_cache():
+        TaskRegistryService._cache = set()
+        TaskRegistryService._cache_initialized = False
+        TaskRegistryService._last_seen_written = {}
+
+    def test_cache_hits_throttle_last_seen_writes(self):
+        self.service.ensure_task_registered("tasks.example")
+
+        with patch.object(TaskRegistryService, "_update_last_seen") as update_last_seen:
+            for _ in range(5):
+                self.assertIsNone(self.service.ensure_task_registered("tasks.example"))
+
+        update_last_seen.assert_not_called()
+
+    def test_last_seen_written_again_after_interval(self):
+        self.service.ensure_task_registered("tasks.example")
+        TaskRegistryService._last_seen_written["tasks.example"] -= 3600
+
+        with patch.object(TaskRegistryService, "_update_last_seen") as update_last_seen:
+            self.service.ensure_task_registered("tasks.example")
+            self.service.ensure_task_registered("tasks.example")
+
+        update_last_seen.assert_called_once_with("tasks.example")
+
+    def test_list_tasks_returns_responses_newest_first(self):
+        self.service.ensure_task_registered("tasks.older")
+        self.service.ensure_task_registered("tasks.newer")
+        TaskRegistryService._last_seen_written.clear()
+        self.service._update_last_seen("tasks.newer")
+
+        tasks = self.service.list_tasks(name_filter="tasks.")
+
+        self.assertEqual([task.name for task in tasks], ["tasks.newer", "tasks.older"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from datetime import datetime, timezone
+
+from fastapi import HTTPException
+
+from api.task_routes import _parse_cursor
+
+
+class TestParseCursor(unittest.TestCase):
+
+    def setUp(self):
+        self.timestamp = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    def test_no_cursor(self):
+        self.assertIsNone(_parse_cursor(None, None, aggregate=True))
+
+    def test_aggregated_cursor_keeps_task_id(self):
+        self.assertEqual(_parse_cursor(self.timestamp, "task-1", aggregate=True), (self.timestamp, "task-1"))
+
+    def test_raw_cursor_uses_integer_id(self):
+        self.assertEqual(_parse_cursor(self.timestamp, "42", aggregate=False), (self.timestamp, 42))
+
+    def test_non_integer_raw_id_is_rejected(self):
+        with self.assertRaises(HTTPException) as ctx:
+            _parse_cursor(self.timestamp, "task-1", aggregate=False)
+        self.assertEqual(ctx.exception.status_code, 400)
+
+    def test_half_specified_cursor_is_rejected(self):
+        for before_timestamp, before_id in ((self.timestamp, None), (None, "task-1")):
+            with self.subTest(before_timestamp=before_timestamp, before_id=before_id):
+                with self.assertRaises(HTTPException) as ctx:
+                    _parse_cursor(before_timestamp, before_id, aggregate=True)
+                self.assertEqual(ctx.exception.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import json
+import unittest
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from api.responses import json_response
+from api.task_routes import _EVENT_LIST_ADAPTER, _EVENT_PAGE_ADAPTER
+from models import TaskEvent
+from tests.helpers import fastapi_json
+
+
+class TestTaskRouteSerialization(unittest.TestCase):
+
+    def setUp(self):
+        now = datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+        parent = TaskEvent(task_id="parent", task_name="tasks.example", event_type="task-failed", timestamp=now)
+        self.events = [
+            TaskEvent(
+                task_id=f"task-{i}",
+                task_name="tasks.example",
+                event_type="task-started",
+                timestamp=now,
+                args=[1, "a"],
+                kwargs={"nested": {"values": [1, 2]}},
+                retry_of=parent,
+                retried_by=[parent],
+                orphaned_at=now,
+            )
+            for i in range(3)
+        ]
+
+    def test_event_list_matches_fastapi_encoding(self):
+        response = json_response(_EVENT_LIST_ADAPTER, self.events)
+
+        self.assertEqual(response.media_type, "application/json")
+        self.assertEqual(json.loads(response.body), fastapi_json(List[TaskEvent], self.events))
+
+    def test_event_page_matches_fastapi_encoding(self):
+        page = {
+            "data": self.events,
+            "pagination": {
+                "page": 0,
+                "limit": 3,
+                "total": 10,
+                "next_cursor": {"timestamp": self.events[-1].timestamp, "id": "task-2"},
+            },
+        }
+
+        response = json_response(_EVENT_PAGE_ADAPTER, page)
+
+        self.assertEqual(json.loads(response.body), fastapi_json(Dict[str, Any], page))
+
+
+if __name__ == '__main__':
+    unittest.main()
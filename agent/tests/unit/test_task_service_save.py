@@ -0,0 +1,98 @@
+import unittest
+from datetime import datetime, timezone, timedelta
+
+from database import TaskEventDB, TaskLatestDB
+from services.task_service import TaskService
+from tests.base import DatabaseTestCase
+
+
+class TestSaveTaskEvent(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.service = TaskService(self.session)
+        self.base_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    def test_returns_row_with_generated_id(self):
+        event = self.create_task_event(task_id="task-1", args=[1], kwargs={"a": 1})
+
+        row = self.service.save_task_event(event)
+
+        stored = self.session.query(TaskEventDB).filter_by(task_id="task-1").one()
+        self.assertEqual(row.id, stored.id)
+        self.assertEqual(stored.args, [1])
+        self.assertEqual(stored.kwargs, {"a": 1})
+        self.assertEqual(stored.retries, 0)
+
+    def test_snapshot_points_at_newest_event(self):
+        self.service.save_task_event(self.create_task_event(
+            task_id="task-2", event_type="task-started", timestamp=self.base_time
+        ))
+        newest = self.service.save_task_event(self.create_task_event(
+            task_id="task-2",
+            event_type="task-succeeded",
+            timestamp=self.base_time + timedelta(seconds=1),
+        ))
+
+        latest = self.session.query(TaskLatestDB).filter_by(task_id="task-2").one()
+        self.assertEqual(latest.event_id, newest.id)
+        self.assertEqual(latest.event_type, "task-succeeded")
+
+    def test_later_events_inherit_arguments_from_received_event(self):
+        self.service.save_task_event(self.create_task_event(
+            task_id="task-5", event_type="task-received", args=[1, 2], kwargs={"a": 1}
+        ))
+        started = self.create_task_event(task_id="task-5", event_type="task-started")
+
+        self.service.save_task_event(started)
+
+        stored = (
+            self.session.query(TaskEventDB)
+            .filter_by(task_id="task-5", event_type="task-started")
+            .one()
+        )
+        self.assertEqual(stored.args, [1, 2])
+        self.assertEqual(stored.kwargs, {"a": 1})
+        self.assertEqual(started.args, [1, 2])
+
+    def test_loaded_events_keep_json_literals_in_arguments(self):
+        self.service.save_task_event(self.create_task_event(
+            task_id="task-3", args=[True, None], kwargs={"dry_run": False, "limit": None}
+        ))
+
+        event = self.service.get_task_events("task-3")[0]
+
+        self.assertEqual(event.args, [True, None])
+        self.assertEqual(event.kwargs, {"dry_run": False, "limit": None})
+
+    def test_loaded_events_validate_legacy_repr_arguments(self):
+        self.create_task_event_db(task_id="task-6", args="(1, 2)", kwargs=None)
+
+        event = self.service.get_task_events("task-6")[0]
+
+        self.assertEqual(event.args, [1, 2])
+        self.assertEqual(event.kwargs, {})
+
+    def test_loaded_events_carry_utc_orphaned_at(self):
+        self.create_task_event_db(task_id="task-4", is_orphan=True, orphaned_at=self.base_time)
+
+        event = self.service.get_task_events("task-4")[0]
+
+        self.assertTrue(event.is_orphan)
+        self.assertEqual(event.orphaned_at, self.base_time)
+        self.assertIn('"orphaned_at":"2024-01-01T12:00:00Z"', event.model_dump_json())
+
+    def test_events_sharing_a_timestamp_keep_insertion_order(self):
+        for event_type in ("task-received", "task-started", "task-succeeded"):
+            self.create_task_event_db(task_id="task-7", event_type=event_type, timestamp=self.base_time)
+
+        events = self.service.get_task_events("task-7")
+
+        self.assertEqual(
+            [event.event_type for event in events],
+            ["task-received", "task-started", "task-succeeded"],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from datetime import datetime, timezone
+
+from api.websocket_routes import _matches_filters
+from models import TaskEvent
+
+
+class TestMatchesFilters(unittest.TestCase):
+
+    def setUp(self):
+        parent = TaskEvent(
+            task_id="parent-1",
+            task_name="tasks.example",
+            event_type="task-failed",
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+        self.event = TaskEvent(
+            task_id="task-1",
+            task_name="tasks.Example",
+            event_type="task-started",
+            timestamp=datetime(2024, 1, 1, 0, 0, 5, tzinfo=timezone.utc),
+            retries=2,
+            retry_of=parent,
+        )
+
+    def test_empty_filters_match(self):
+        self.assertTrue(_matches_filters(self.event, {}))
+
+    def test_string_filters_match_case_insensitive_substring(self):
+        self.assertTrue(_matches_filters(self.event, {"task_name": "example"}))
+        self.assertFalse(_matches_filters(self.event, {"task_name": "other"}))
+
+    def test_non_string_filters_match_exactly(self):
+        self.assertTrue(_matches_filters(self.event, {"retries": 2}))
+        self.assertFalse(_matches_filters(self.event, {"retries": 3}))
+
+    def test_unknown_key_does_not_match(self):
+        self.assertFalse(_matches_filters(self.event, {"not_a_field": "x"}))
+
+    def test_nested_model_compares_as_dict(self):
+        expected = self.event.retry_of.model_dump()
+        self.assertTrue(_matches_filters(self.event, {"retry_of": expected}))
+
+    def test_tuple_fields_compare_as_lists(self):
+        self.assertTrue(_matches_filters(self.event, {"retried_by": []}))
+        self.assertTrue(_matches_filters(self.event.retry_of.model_copy(update={"retried_by": (self.event,)}),
+                                         {"retried_by": [self.event.model_dump()]}))
+
+    def test_plain_dict_events(self):
+        self.assertTrue(_matches_filters({"task_name": "tasks.example"}, {"task_name": "EXAMPLE"}))
+        self.assertFalse(_matches_filters({"task_name": "tasks.example"}, {"hostname": "w1"}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from datetime import datetime, timezone
+
+from api.worker_routes import _to_worker_info
+
+
+class TestWorkerInfoConversion(unittest.TestCase):
+
+    def setUp(self):
+        self.now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    def test_maps_monitor_state(self):
+        info = _to_worker_info("celery@worker1", {
+            'status': 'online',
+            'timestamp': datetime(2024, 1, 1, 11, 59, 0),
+            'active': 3,
+            'processed': 10,
+            'sw_ver': '5.3.0',
+            'loadavg': [0.5, 0.25, 0.1],
+        }, self.now)
+
+        self.assertEqual(info.hostname, "celery@worker1")
+        self.assertEqual(info.status, "online")
+        self.assertEqual(info.timestamp, datetime(2024, 1, 1, 11, 59, 0, tzinfo=timezone.utc))
+        self.assertEqual(info.active_tasks, 3)
+        self.assertEqual(info.processed_tasks, 10)
+        self.assertEqual(info.sw_ver, '5.3.0')
+        self.assertEqual(info.loadavg, (0.5, 0.25, 0.1))
+
+    def test_defaults_for_sparse_state(self):
+        info = _to_worker_info("celery@worker1", {}, self.now)
+
+        self.assertEqual(info.status, "unknown")
+        self.assertEqual(info.timestamp, self.now)
+        self.assertEqual(info.active_tasks, 0)
+        self.assertEqual(info.processed_tasks, 0)
+        self.assertIsNone(info.loadavg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from models import Condition, TaskEvent
+from services.workflow_engine import WorkflowEngine
+from services.workflow_service import WorkflowService
+
+
+class FakeDatabaseManager:
+    @contextmanager
+    def get_session(self):
+        yield None
+
+
+class TestWorkflowEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = WorkflowEngine(FakeDatabaseManager())
+        self.event = TaskEvent(
+            task_id="task-1",
+            task_name="tasks.example",
+            event_type="task-failed",
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+
+    def test_event_is_not_dumped_without_matching_workflows(self):
+        with patch.object(WorkflowService, "get_active_workflows_for_trigger", return_value=[]), \
+                patch.object(TaskEvent, "model_dump") as model_dump:
+            asyncio.run(self.engine._evaluate_and_execute_workflows("task.failed", self.event))
+
+        model_dump.assert_not_called()
+
+    def test_process_event_hands_event_to_worker_thread(self):
+        with patch("services.workflow_engine.threading.Thread") as thread:
+            self.engine.process_event(self.event)
+
+        thread.assert_called_once()
+        self.assertEqual(thread.call_args.kwargs["args"], ("task.failed", self.event))
+        thread.return_value.start.assert_called_once()
+
+    def test_single_condition_operators(self):
+        context = {"task_name": "tasks.example", "runtime": "2.5", "queue": "default"}
+        cases = [
+            ("task_name", "equals", "tasks.example", True),
+            ("task_name", "not_equals", "tasks.example", False),
+            ("queue", "in", ["default", "priority"], True),
+            ("queue", "not_in", ["default"], False),
+            ("task_name", "matches", r"^tasks\.ex", True),
+            ("runtime", "gt", 2, True),
+            ("runtime", "lte", "2", False),
+            ("task_name", "contains", "exam", True),
+            ("task_name", "starts_with", "jobs.", False),
+            ("task_name", "ends_with", "example", True),
+            ("missing", "not_equals", "x", True),
+            ("missing", "equals", "x", False),
+            ("task_name", "gt", 1, False),
+        ]
+
+        for field, operator, value, expected in cases:
+            condition = Condition(field=field, operator=operator, value=value)
+            with self.subTest(operator=operator, field=field):
+                self.assertIs(self.engine._evaluate_single_condition(condition, context), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
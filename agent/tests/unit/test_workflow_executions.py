@@ -0,0 +1,43 @@
+import json
+import unittest
+
+from api.responses import json_response
+from api.workflow_routes import _EXECUTION_LIST_ADAPTER
+from services.workflow_service import WorkflowService
+from tests.base import DatabaseTestCase
+
+
+class TestWorkflowExecutionHistory(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.service = WorkflowService(self.session)
+
+    def test_execution_history_round_trips_json_columns(self):
+        execution_id = self.service.record_workflow_execution_start(
+            workflow_id="workflow-1",
+            trigger_type="task.failed",
+            trigger_event={"task_id": "task-1", "args": [1, {"a": None}]},
+            workflow_snapshot={"name": "Retry failures", "actions": [{"type": "task.retry"}]},
+        )
+        self.service.update_workflow_execution(
+            execution_id,
+            status="completed",
+            actions_executed=[{"type": "task.retry", "status": "success"}],
+        )
+
+        executions = self.service.get_workflow_executions(workflow_id="workflow-1")
+
+        self.assertEqual(len(executions), 1)
+        record = executions[0]
+        self.assertEqual(record.status, "completed")
+        self.assertEqual(record.trigger_event, {"task_id": "task-1", "args": [1, {"a": None}]})
+        self.assertEqual(record.actions_executed, [{"type": "task.retry", "status": "success"}])
+
+        payload = json.loads(json_response(_EXECUTION_LIST_ADAPTER, executions).body)
+        self.assertEqual(payload[0]["id"], execution_id)
+        self.assertEqual(payload[0]["workflow_snapshot"]["name"], "Retry failures")
+
+
+if __name__ == '__main__':
+    unittest.main()
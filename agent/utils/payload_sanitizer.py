@@ -23,9 +23,16 @@ def _placeholder() -> Dict[str, str]:
     }
 
 
+# Values that are already JSON-safe as-is; most events carry no result at all.
+_SCALAR_TYPES = frozenset((type(None), str, int, float, bool))
+
+
 def sanitize_payload(value: Any) -> Tuple[Any, bool]:
     """Return a JSON-serializable copy of *value* and flag when we had to truncate."""
 
+    if type(value) in _SCALAR_TYPES:
+        return value, False
+
     truncated = False
 
     def _sanitize(item: Any) -> Any:
@@ -73,7 +73,7 @@ class WorkerHealthMonitor:
                 if last_seen < timeout_threshold and current_status == 'online':
                     logger.warning(f"Worker {hostname} appears offline (last seen: {last_seen})")
 
-                    workers[hostname]['status'] = 'offline'
+                    self.monitor_instance.mark_worker_offline(hostname)
                     offline_workers.append(hostname)
                     self._mark_worker_tasks_as_orphaned(hostname, current_time)
 